@@ -1,12 +1,48 @@
 import io
-from typing import Dict, List, Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests
 import streamlit as st
 from PIL import ExifTags, Image
-
+from streamlit.delta_generator import DeltaGenerator
+
+import exif_reader
+from circuit_breaker import OPEN, CircuitBreaker
+from exif_batch import extract_batch
+from gps import gps_to_decimal
+from blob_store import BlobStore
+from image_cache import ImageCache, ProbeCache
+from instrumentation import (
+    CompositeInstrumentation,
+    InMemoryInstrumentation,
+    Instrumentation,
+    JsonlSpanExporter,
+)
 from osint_core import OSINTCore
+from profile_cache import ProfileCache
+from rate_limiter import RateLimiter
+from report_export import MIME_TYPES, available_formats, export_report
+from results_store import ResultsStore
+from retry_scheduler import TRANSIENT_STATUSES
+from search_cache import SearchCache
+from thumbnails import ThumbnailPipeline
+
+CACHE_DIR = os.environ.get("OSINT_CACHE_DIR", ".osint_cache")
+SEARCH_CACHE_TTL = float(os.environ.get("OSINT_SEARCH_CACHE_TTL", "3600"))
+PROFILE_CACHE_TTL = float(os.environ.get("OSINT_PROFILE_CACHE_TTL", "900"))
+PROFILE_ERROR_TTL = float(os.environ.get("OSINT_PROFILE_ERROR_TTL", "120"))
+IMAGE_CACHE_MB = int(os.environ.get("OSINT_IMAGE_CACHE_MB", "64"))
+BLOB_STORE_MB = int(os.environ.get("OSINT_BLOB_STORE_MB", "1024"))
+PROBE_CACHE_TTL = float(os.environ.get("OSINT_PROBE_CACHE_TTL", "900"))
+THUMBNAIL_PX = int(os.environ.get("OSINT_THUMBNAIL_PX", "360"))
+TRACE_FILE = os.environ.get("OSINT_TRACE_FILE")
+METRICS_FILE = os.environ.get("OSINT_METRICS_FILE")
+EXPORT_CHUNK_ROWS = int(os.environ.get("OSINT_EXPORT_CHUNK_ROWS", "1000"))
 
 
 def set_dark_theme() -> None:
@@ -99,6 +135,59 @@ def set_dark_theme() -> None:
     )
 
 
+@st.cache_resource
+def get_search_cache() -> SearchCache:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return SearchCache(path=os.path.join(CACHE_DIR, "search.sqlite3"), ttl=SEARCH_CACHE_TTL)
+
+
+@st.cache_resource
+def get_profile_cache() -> ProfileCache:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return ProfileCache(
+        path=os.path.join(CACHE_DIR, "profiles.sqlite3"),
+        ttl=PROFILE_CACHE_TTL,
+        error_ttl=PROFILE_ERROR_TTL,
+    )
+
+
+@st.cache_resource
+def get_image_cache() -> ImageCache:
+    return ImageCache(max_bytes=IMAGE_CACHE_MB * 1024 * 1024)
+
+
+@st.cache_resource
+def get_probe_cache() -> ProbeCache:
+    return ProbeCache(ttl=PROBE_CACHE_TTL)
+
+
+@st.cache_resource
+def get_blob_store() -> BlobStore:
+    return BlobStore(os.path.join(CACHE_DIR, "blobs"), max_bytes=BLOB_STORE_MB * 1024 * 1024)
+
+
+@st.cache_resource
+def get_thumbnailer() -> ThumbnailPipeline:
+    return ThumbnailPipeline(max_size=(THUMBNAIL_PX, THUMBNAIL_PX))
+
+
+@st.cache_resource
+def get_metrics() -> InMemoryInstrumentation:
+    return InMemoryInstrumentation()
+
+
+@st.cache_resource
+def get_core() -> OSINTCore:
+    instrumentation: Instrumentation = get_metrics()
+    if TRACE_FILE:
+        instrumentation = CompositeInstrumentation(instrumentation, JsonlSpanExporter(TRACE_FILE))
+    return OSINTCore(
+        cache=get_search_cache(),
+        instrumentation=instrumentation,
+        profile_cache=get_profile_cache(),
+    )
+
+
 def build_link_table(dork_results: Dict[str, object]) -> pd.DataFrame:
     rows: List[Dict[str, str]] = []
     for entry in dork_results.get("dorks", []):
@@ -114,30 +203,402 @@ def build_link_table(dork_results: Dict[str, object]) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
+def build_link_table_from_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    rows = frame[frame["source"] == "google_dorks"]
+    return pd.DataFrame(
+        {
+            "Tipo da Dork": rows["dork_type"].to_numpy(),
+            "URL Encontrada": rows["url"].to_numpy(),
+            "Ação": rows["url"].to_numpy(),
+        }
+    )
+
+
+def link_table(store: ResultsStore) -> pd.DataFrame:
+    return store.view("link_table", lambda current: build_link_table_from_frame(current.frame()))
+
+
+def render_link_table(slot: DeltaGenerator, store: ResultsStore) -> None:
+    table = link_table(store)
+    if table.empty:
+        return
+    slot.dataframe(
+        table,
+        use_container_width=True,
+        column_config={
+            "Ação": st.column_config.LinkColumn(
+                "Ação",
+                display_text="Abrir",
+            )
+        },
+    )
+
+
+IMAGE_STATUS_CAPTIONS = {
+    "forbidden": "Acesso Negado",
+    "unavailable": "Host Indisponivel (circuito aberto)",
+    "error": "Falha no Download",
+}
+IMAGE_DORK_TYPES = ("Fotos e Imagens", "Fotos em Redes Sociais")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
 def extract_image_urls_from_dorks(dork_results: Dict[str, object]) -> List[str]:
-    image_dork_types = {"Fotos e Imagens", "Fotos em Redes Sociais"}
-    image_extensions = (".jpg", ".jpeg", ".png")
     image_urls: List[str] = []
     for entry in dork_results.get("dorks", []):
-        if entry.get("type", "") in image_dork_types:
+        if entry.get("type", "") in IMAGE_DORK_TYPES:
             for url in entry.get("urls", []):
-                if url.lower().endswith(image_extensions):
+                if url.lower().endswith(IMAGE_EXTENSIONS):
                     image_urls.append(url)
     return image_urls
 
 
-def fetch_image(url: str, headers: Dict[str, str]) -> Tuple[bytes, str]:
+def extract_image_urls_from_frame(frame: pd.DataFrame) -> List[str]:
+    mask = (
+        (frame["source"] == "google_dorks")
+        & frame["dork_type"].isin(IMAGE_DORK_TYPES)
+        & frame["url"].str.lower().str.endswith(IMAGE_EXTENSIONS)
+    )
+    return frame["url"][mask].tolist()
+
+
+def image_urls_from_store(store: ResultsStore) -> List[str]:
+    return store.view("image_urls", lambda current: extract_image_urls_from_frame(current.frame()))
+
+
+def fetch_image(
+    url: str,
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+    cache: Optional[ImageCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    store: Optional[BlobStore] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Tuple[bytes, str]:
+    instrumentation = instrumentation or Instrumentation()
+    if cache is not None:
+        with instrumentation.span("image.cache_lookup") as span:
+            cached = cache.get(url)
+            span["hit"] = cached is not None
+        if cached is not None:
+            return cached, "ok"
+    if store is not None:
+        with instrumentation.span("image.store_lookup") as span:
+            stored = store.get(url)
+            span["hit"] = stored is not None
+        if stored is not None:
+            if cache is not None:
+                cache.put(url, stored)
+            return stored, "ok"
+    host = urlparse(url).netloc.lower()
+    if breaker is not None and not breaker.allow(host):
+        return b"", "unavailable"
+    http = session if session is not None else requests
     try:
-        response = requests.get(url, headers=headers, timeout=12)
-        if response.status_code == 403:
-            return b"", "forbidden"
-        response.raise_for_status()
-        return response.content, "ok"
+        with instrumentation.span("image.request", host=host) as span:
+            response = http.get(url, headers=headers, timeout=12, stream=True)
+            span["status"] = response.status_code
+        try:
+            if response.status_code == 403:
+                content, status = b"", "forbidden"
+            else:
+                response.raise_for_status()
+                with instrumentation.span("image.download") as span:
+                    content = response.content
+                    span["bytes"] = len(content)
+                status = "ok"
+        finally:
+            response.close()
+    except requests.RequestException as exc:
+        if breaker is not None:
+            failed = exc.response if isinstance(exc, requests.HTTPError) else None
+            if failed is None or failed.status_code in TRANSIENT_STATUSES:
+                breaker.record_failure(host)
+            else:
+                breaker.record_success(host)
+        return b"", "error"
     except Exception:
+        if breaker is not None:
+            breaker.release(host)
         return b"", "error"
+    if breaker is not None:
+        breaker.record_success(host)
+    if status == "ok":
+        if store is not None:
+            with instrumentation.span("image.store_write", bytes=len(content)):
+                store.put(url, content)
+        if cache is not None:
+            cache.put(url, content)
+    return content, status
+
+
+def iter_fetch_images(
+    urls: List[str],
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+    cache: Optional[ImageCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    store: Optional[BlobStore] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    max_workers: int = 6,
+    per_host: int = 2,
+) -> Iterator[Tuple[int, bytes, str]]:
+    host_slots: Dict[str, threading.Semaphore] = {}
+    slots_lock = threading.Lock()
+
+    def fetch_with_host_slot(url: str) -> Tuple[bytes, str]:
+        host = urlparse(url).netloc.lower()
+        with slots_lock:
+            slot = host_slots.setdefault(host, threading.Semaphore(per_host))
+        with slot:
+            return fetch_image(url, headers, session, cache, instrumentation, store, breaker)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(fetch_with_host_slot, url): idx for idx, url in enumerate(urls)}
+        for future in as_completed(futures):
+            image_bytes, status = future.result()
+            yield futures[future], image_bytes, status
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_images(
+    urls: List[str],
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+    cache: Optional[ImageCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    store: Optional[BlobStore] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    max_workers: int = 6,
+    per_host: int = 2,
+) -> List[Tuple[bytes, str]]:
+    results: List[Tuple[bytes, str]] = [(b"", "error")] * len(urls)
+    for idx, image_bytes, status in iter_fetch_images(
+        urls,
+        headers,
+        session,
+        cache,
+        instrumentation,
+        store,
+        breaker,
+        max_workers=max_workers,
+        per_host=per_host,
+    ):
+        results[idx] = (image_bytes, status)
+    return results
+
+
+def _read_until_exif(
+    response: requests.Response, buf: bytearray, max_bytes: int, chunk_size: int = 16384
+) -> str:
+    state, _, needed = exif_reader.locate_exif(buf)
+    if state != exif_reader.INCOMPLETE:
+        return state
+    for chunk in response.iter_content(chunk_size):
+        buf.extend(chunk)
+        if len(buf) < needed and len(buf) < max_bytes:
+            continue
+        state, _, needed = exif_reader.locate_exif(buf)
+        if state != exif_reader.INCOMPLETE or len(buf) >= max_bytes:
+            break
+    return state
+
+
+def probe_local(url: str, data: exif_reader.Buffer) -> Dict[str, object]:
+    image_format = exif_reader.sniff_format(data)
+    state, _, _ = exif_reader.locate_exif(data)
+    return {
+        "url": url,
+        "status": "ok",
+        "content_type": f"image/{image_format}" if image_format else None,
+        "size": len(data),
+        "bytes_read": 0,
+        "exif_status": state,
+        "metadata": exif_reader.read_exif(data) if state == exif_reader.FOUND else {},
+    }
+
+
+def probe_image(
+    url: str,
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+    probe_bytes: int = 65536,
+    max_bytes: int = 8 * 1024 * 1024,
+    instrumentation: Optional[Instrumentation] = None,
+    probe_cache: Optional[ProbeCache] = None,
+    cache: Optional[ImageCache] = None,
+    store: Optional[BlobStore] = None,
+) -> Dict[str, object]:
+    instrumentation = instrumentation or Instrumentation()
+    if probe_cache is not None:
+        with instrumentation.span("image.probe_cache_lookup") as span:
+            cached = probe_cache.get(url)
+            span["hit"] = cached is not None
+        if cached is not None:
+            return cached
+    result: Optional[Dict[str, object]] = None
+    local = cache.get(url) if cache is not None else None
+    if local is not None:
+        with instrumentation.span("image.probe_local", bytes=len(local)):
+            result = probe_local(url, local)
+    elif store is not None:
+        with store.open(url) as view:
+            if view is not None:
+                with instrumentation.span("image.probe_local", bytes=len(view)):
+                    result = probe_local(url, view)
+    if result is None:
+        result = _probe_remote(url, headers, session, probe_bytes, max_bytes, instrumentation)
+    if probe_cache is not None and result["status"] == "ok":
+        probe_cache.put(url, result)
+    return result
+
+
+def _probe_remote(
+    url: str,
+    headers: Dict[str, str],
+    session: Optional[requests.Session],
+    probe_bytes: int,
+    max_bytes: int,
+    instrumentation: Instrumentation,
+) -> Dict[str, object]:
+    http = session if session is not None else requests
+    result: Dict[str, object] = {
+        "url": url,
+        "status": "error",
+        "content_type": None,
+        "size": None,
+        "bytes_read": 0,
+        "exif_status": None,
+        "metadata": {},
+    }
+    try:
+        with instrumentation.span("image.probe_head") as span:
+            head = http.head(url, headers=headers, timeout=12, allow_redirects=True)
+            span["status"] = head.status_code
+        if head.status_code == 403:
+            result["status"] = "forbidden"
+            return result
+        if head.ok:
+            result["content_type"] = head.headers.get("Content-Type")
+            if head.headers.get("Content-Length", "").isdigit():
+                result["size"] = int(head.headers["Content-Length"])
+        buf = bytearray()
+        range_headers = dict(headers, Range=f"bytes=0-{probe_bytes - 1}")
+        with instrumentation.span("image.probe_range") as span:
+            response = http.get(url, headers=range_headers, timeout=12, stream=True)
+            span["status"] = response.status_code
+            try:
+                if response.status_code == 403:
+                    result["status"] = "forbidden"
+                    return result
+                response.raise_for_status()
+                result["content_type"] = result["content_type"] or response.headers.get("Content-Type")
+                content_range = response.headers.get("Content-Range", "")
+                if response.status_code == 206 and "/" in content_range:
+                    total = content_range.rsplit("/", 1)[1]
+                    if total.isdigit():
+                        result["size"] = int(total)
+                state = _read_until_exif(response, buf, max_bytes)
+                ranged = response.status_code == 206
+            finally:
+                response.close()
+            span["bytes"] = len(buf)
+        size = result["size"]
+        if state == exif_reader.INCOMPLETE and ranged and (size is None or len(buf) < size):
+            buf = bytearray()
+            with instrumentation.span("image.probe_stream") as span:
+                response = http.get(url, headers=headers, timeout=12, stream=True)
+                try:
+                    response.raise_for_status()
+                    state = _read_until_exif(response, buf, max_bytes)
+                finally:
+                    response.close()
+                span["bytes"] = len(buf)
+        result["status"] = "ok"
+        result["bytes_read"] = len(buf)
+        result["exif_status"] = state
+        if state == exif_reader.FOUND:
+            result["metadata"] = exif_reader.read_exif(buf)
+    except Exception:
+        result["status"] = "error"
+    return result
+
+
+def probe_images(
+    urls: List[str],
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    probe_cache: Optional[ProbeCache] = None,
+    cache: Optional[ImageCache] = None,
+    store: Optional[BlobStore] = None,
+    max_workers: int = 6,
+) -> List[Dict[str, object]]:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda url: probe_image(
+                    url,
+                    headers,
+                    session,
+                    instrumentation=instrumentation,
+                    probe_cache=probe_cache,
+                    cache=cache,
+                    store=store,
+                ),
+                urls,
+            )
+        )
+
+
+def build_probe_table(probes: List[Dict[str, object]]) -> pd.DataFrame:
+    rows: List[Dict[str, object]] = []
+    for probe in probes:
+        metadata = probe.get("metadata") or {}
+        maps_url = ""
+        gps = metadata.get("GPSInfo")
+        coordinates = gps_to_decimal(gps) if gps else None
+        if coordinates is not None:
+            maps_url = f"https://maps.google.com/?q={coordinates[0]},{coordinates[1]}"
+        size = probe.get("size")
+        rows.append(
+            {
+                "URL": probe.get("url"),
+                "Status": probe.get("status"),
+                "Tipo": probe.get("content_type") or "",
+                "Tamanho (KB)": round(size / 1024, 1) if size else None,
+                "Bytes Lidos": probe.get("bytes_read", 0),
+                "Camera": " ".join(str(metadata[k]) for k in ("Make", "Model") if k in metadata),
+                "Data": str(metadata.get("DateTimeOriginal") or metadata.get("DateTime") or ""),
+                "GPS": maps_url,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def report_download(store: ResultsStore, fmt: str, directory: str) -> Callable[[], bytes]:
+    def build() -> bytes:
+        path = export_report(store.iter_chunks(EXPORT_CHUNK_ROWS), fmt, directory)
+        try:
+            with open(path, "rb") as handle:
+                return handle.read()
+        finally:
+            os.remove(path)
+
+    return build
 
 
 def extract_exif(image_bytes: bytes) -> Dict[str, object]:
+    if not image_bytes:
+        return {}
+    if exif_reader.sniff_format(image_bytes) is not None:
+        return exif_reader.read_exif(image_bytes)
+    return extract_exif_pil(image_bytes)
+
+
+def extract_exif_pil(image_bytes: bytes) -> Dict[str, object]:
     if not image_bytes:
         return {}
     image = Image.open(io.BytesIO(image_bytes))
@@ -148,7 +609,7 @@ def extract_exif(image_bytes: bytes) -> Dict[str, object]:
     for tag_id, value in exif.items():
         tag = ExifTags.TAGS.get(tag_id, tag_id)
         exif_data[tag] = value
-    gps_info = exif.get(34853)
+    gps_info = exif.get_ifd(34853)
     if gps_info:
         gps_tags = {}
         for key, value in gps_info.items():
@@ -157,27 +618,22 @@ def extract_exif(image_bytes: bytes) -> Dict[str, object]:
     return exif_data
 
 
-def gps_to_decimal(gps_info: Dict[str, object]) -> Tuple[float, float]:
-    def to_degrees(value: Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]) -> float:
-        d = value[0][0] / value[0][1]
-        m = value[1][0] / value[1][1]
-        s = value[2][0] / value[2][1]
-        return d + (m / 60.0) + (s / 3600.0)
-
-    lat = to_degrees(gps_info["GPSLatitude"])
-    if gps_info.get("GPSLatitudeRef") == "S":
-        lat = -lat
-    lon = to_degrees(gps_info["GPSLongitude"])
-    if gps_info.get("GPSLongitudeRef") == "W":
-        lon = -lon
-    return lat, lon
+def show_image_metadata(image_bytes: bytes) -> None:
+    exif = extract_exif(image_bytes)
+    if not exif:
+        st.info("Sem metadados disponiveis.")
+        return
+    st.json({k: str(v) for k, v in exif.items() if k != "GPSInfo"})
+    coordinates = gps_to_decimal(exif.get("GPSInfo") or {})
+    if coordinates is not None:
+        st.markdown(f"[Abrir no Google Maps](https://maps.google.com/?q={coordinates[0]},{coordinates[1]})")
 
 
 def main() -> None:
     st.set_page_config(page_title="OSINT Dark Ops", layout="wide")
     set_dark_theme()
 
-    core = OSINTCore()
+    core = get_core()
 
     st.sidebar.title("OSINT Dark Ops")
     section = st.sidebar.radio(
@@ -187,11 +643,12 @@ def main() -> None:
 
     if "session_results" not in st.session_state:
         st.session_state.session_results = {
-            "google_dorks": {},
             "instagram": {},
             "private_sniffer": {},
-            "image_gallery": {},
         }
+    if "results_store" not in st.session_state:
+        st.session_state.results_store = ResultsStore()
+    store: ResultsStore = st.session_state.results_store
 
     if section == "Dashboard":
         st.title("Painel de Operacoes")
@@ -200,6 +657,43 @@ def main() -> None:
             "<span class='tag-chip'>passive</span><span class='tag-chip'>ghdb</span><span class='tag-chip'>social</span><span class='tag-chip'>media</span>",
             unsafe_allow_html=True,
         )
+        cache_stats = core.cache.stats()
+        cols = st.columns(3)
+        cols[0].metric("Cache Hits", cache_stats["hits"])
+        cols[1].metric("Cache Misses", cache_stats["misses"])
+        cols[2].metric("Buscas em Cache", cache_stats["entries"])
+        blob_stats = get_blob_store().stats()
+        cols = st.columns(3)
+        cols[0].metric("Imagens Arquivadas", blob_stats["blobs"])
+        cols[1].metric("Downloads Evitados", blob_stats["hits"] + blob_stats["dedup_hits"])
+        cols[2].metric("Arquivo (MB)", round(blob_stats["bytes"] / (1024 * 1024), 1))
+        cols = st.columns(4)
+        cols[0].metric("Paginas com Resultados", core.page_counts["results"])
+        cols[1].metric("Paginas Vazias", core.page_counts["empty"])
+        cols[2].metric("Paginas Bloqueadas", core.page_counts["degraded"])
+        cols[3].metric("Paginas Nao Reconhecidas", core.page_counts["unknown"])
+        retry_stats = core.retry_scheduler.stats()
+        cols = st.columns(3)
+        cols[0].metric("Retentativas", retry_stats["retries"])
+        cols[1].metric("Falhas Transitorias", retry_stats["transient_failures"])
+        cols[2].metric("Backoff (s)", round(retry_stats["backoff_time"], 1))
+        cooldowns = core.retry_scheduler.cooldowns()
+        if cooldowns:
+            st.caption(
+                "Em cool-down: " + ", ".join(f"{host} ({seconds:.0f}s)" for host, seconds in sorted(cooldowns.items()))
+            )
+        circuits = core.circuit_breaker.snapshot()
+        if circuits:
+            st.subheader("Estado dos Upstreams")
+            st.dataframe(pd.DataFrame(circuits), use_container_width=True)
+        pool_stats = core.pool_stats()
+        if pool_stats:
+            st.subheader("Conexoes HTTP")
+            st.dataframe(pd.DataFrame(pool_stats), use_container_width=True)
+        span_summary = get_metrics().summary()
+        if span_summary:
+            st.subheader("Tempo por Fase")
+            st.dataframe(pd.DataFrame(span_summary), use_container_width=True)
 
     if section == "Google Dorks":
         st.header("Advanced Google Hacking")
@@ -213,81 +707,106 @@ def main() -> None:
         selected_dorks = st.multiselect("Tipos de Busca", dork_options, default=dork_options)
         st.subheader("Galeria de Evidencias")
         image_count = st.slider("Max imagens", min_value=3, max_value=18, value=9, step=3)
-
-        if st.button("Executar Dorks") and target:
+        probe_only = st.checkbox("Triagem rapida: somente metadados (sem baixar imagens)")
+
+        search_host = RateLimiter.host_of(core.search_url)
+        if core.circuit_breaker.state(search_host) == OPEN:
+            st.info(f"Busca suspensa por {core.circuit_breaker.retry_in(search_host):.0f} s apos falhas repetidas.")
+        run_dorks = st.button("Executar Dorks")
+        table_slot = st.empty()
+        if run_dorks and target:
+            store.remove_source("google_dorks")
+            store.remove_source("image_gallery")
+            completed = 0
             with st.spinner("Executando dorks... isso pode levar alguns segundos."):
                 try:
-                    dork_results = core.advanced_google_hacking(target, selected_dorks)
+                    for entry in core.iter_dorks(target, selected_dorks):
+                        completed += 1
+                        if store.add_dork(entry):
+                            render_link_table(table_slot, store)
                 except Exception as exc:
                     st.error(f"Erro ao executar dorks: {exc}")
-                    dork_results = {}
-            st.session_state.session_results["google_dorks"] = dork_results
-            image_urls = extract_image_urls_from_dorks(dork_results)
+            image_urls = image_urls_from_store(store)
             if image_urls:
-                st.session_state.session_results["image_gallery"] = {
-                    "target": target,
-                    "urls": image_urls[:image_count],
-                }
-            else:
-                st.session_state.session_results["image_gallery"] = {}
-            if dork_results and not any(
-                entry.get("urls") for entry in dork_results.get("dorks", [])
-            ):
+                store.extend("image_gallery", image_urls[:image_count], query=target)
+            cooldown = core.retry_scheduler.cooldown_remaining(search_host)
+            if completed and core.circuit_breaker.state(search_host) == OPEN:
+                st.warning(
+                    "Busca suspensa apos falhas repetidas do servico."
+                    f" Nova tentativa em {core.circuit_breaker.retry_in(search_host):.0f} s."
+                )
+            elif completed and not store.has_source("google_dorks") and cooldown > 0:
+                st.warning(f"O servico de busca pediu uma pausa. Tente novamente em {cooldown:.0f} s.")
+            elif completed and not store.has_source("google_dorks"):
                 st.warning(
                     "Nenhum resultado encontrado. O servico de busca pode estar"
                     " bloqueando requisicoes deste servidor. Tente novamente mais tarde."
                 )
 
-        dork_results = st.session_state.session_results.get("google_dorks", {})
-        if dork_results:
-            table = build_link_table(dork_results)
-            if not table.empty:
-                st.dataframe(
-                    table,
-                    use_container_width=True,
-                    column_config={
-                        "Ação": st.column_config.LinkColumn(
-                            "Ação",
-                            display_text="Abrir",
-                        )
-                    },
-                )
-
-        gallery = st.session_state.session_results.get("image_gallery", {})
-        image_urls = gallery.get("urls", []) if gallery else []
-        if image_urls:
+        if store.has_source("google_dorks"):
+            render_link_table(table_slot, store)
+
+        image_urls = store.urls("image_gallery")
+        if image_urls and probe_only:
+            probes = probe_images(
+                image_urls[:image_count],
+                core._get_headers(),
+                core.session,
+                core.instrumentation,
+                get_probe_cache(),
+                get_image_cache(),
+                get_blob_store(),
+            )
+            st.dataframe(
+                build_probe_table(probes),
+                use_container_width=True,
+                column_config={"GPS": st.column_config.LinkColumn("GPS", display_text="Mapa")},
+            )
+        elif image_urls:
             columns = st.columns(3)
             headers = core._get_headers()
+            slots = []
             for idx, url in enumerate(image_urls[:image_count]):
-                col = columns[idx % 3]
-                with col:
+                with columns[idx % 3]:
                     st.markdown("<div class='image-card'>", unsafe_allow_html=True)
-                    image_bytes, status = fetch_image(url, headers)
-                    if status == "ok":
-                        st.image(image_bytes, use_container_width=True)
-                    else:
-                        st.markdown("<div class='placeholder'></div>", unsafe_allow_html=True)
-                        st.caption("Acesso Negado")
-                    btn_key = f"meta_{idx}"
-                    if st.button("🔍 Ver Metadados", key=btn_key):
-                        exif = extract_exif(image_bytes)
-                        if not exif:
-                            st.info("Sem metadados disponiveis.")
-                        else:
-                            st.json({k: str(v) for k, v in exif.items() if k != "GPSInfo"})
-                            gps = exif.get("GPSInfo")
-                            if gps:
-                                lat, lon = gps_to_decimal(gps)
-                                st.markdown(
-                                    f"[Abrir no Google Maps](https://maps.google.com/?q={lat},{lon})"
-                                )
+                    image_slot = st.empty()
+                    image_slot.markdown("<div class='placeholder'></div>", unsafe_allow_html=True)
+                    button_cols = st.columns(2)
+                    show_meta = button_cols[0].button("🔍 Ver Metadados", key=f"meta_{idx}")
+                    show_original = button_cols[1].button("🖼️ Original", key=f"orig_{idx}")
+                    meta_area = st.container()
                     st.markdown("</div>", unsafe_allow_html=True)
+                slots.append((image_slot, show_meta, show_original, meta_area))
+            fetched = iter_fetch_images(
+                image_urls[:image_count],
+                headers,
+                core.session,
+                get_image_cache(),
+                core.instrumentation,
+                get_blob_store(),
+                core.circuit_breaker,
+            )
+            for idx, image_bytes, status, thumb in get_thumbnailer().iter_thumbnails(fetched):
+                image_slot, show_meta, show_original, meta_area = slots[idx]
+                if status == "ok":
+                    image_slot.image(thumb or image_bytes, use_container_width=True)
+                    if show_original:
+                        with meta_area:
+                            st.image(image_bytes, use_container_width=True)
+                else:
+                    with image_slot.container():
+                        st.markdown("<div class='placeholder'></div>", unsafe_allow_html=True)
+                        st.caption(IMAGE_STATUS_CAPTIONS.get(status, "Falha no Download"))
+                if show_meta:
+                    with meta_area:
+                        show_image_metadata(image_bytes)
 
     if section == "Instagram Intel":
         st.header("Instagram Intelligence")
         username = st.text_input("@usuario", placeholder="nome_do_usuario")
+        force_refresh = st.checkbox("Ignorar cache", value=False)
         if st.button("Coletar Perfil") and username:
-            profile_data = core.get_profile_metadata(username.strip("@"))
+            profile_data = core.get_profile_metadata(username.strip("@"), force_refresh=force_refresh)
             st.session_state.session_results["instagram"] = profile_data
 
         profile_data = st.session_state.session_results.get("instagram", {})
@@ -321,6 +840,8 @@ def main() -> None:
                 if st.button("Rodar Private Sniffer"):
                     sniffer = core.private_sniffer(profile_data["username"])
                     st.session_state.session_results["private_sniffer"] = sniffer
+                    store.remove_source("instagram_collab")
+                    store.extend("instagram_collab", sniffer.get("urls", []), query=sniffer.get("query", ""))
 
         sniffer = st.session_state.session_results.get("private_sniffer", {})
         if sniffer:
@@ -333,19 +854,26 @@ def main() -> None:
 
     if section == "Relatorios":
         st.header("Exportar Relatorios")
-        results = st.session_state.session_results
-        if st.button("Exportar CSV"):
-            rows = []
-            for dork in results.get("google_dorks", {}).get("dorks", []):
-                for url in dork.get("urls", []):
-                    rows.append({"tipo": dork.get("type"), "url": url})
-            for url in results.get("private_sniffer", {}).get("urls", []):
-                rows.append({"tipo": "instagram_collab", "url": url})
-            for url in results.get("image_gallery", {}).get("urls", []):
-                rows.append({"tipo": "image_gallery", "url": url})
-            df = pd.DataFrame(rows)
-            csv_data = df.to_csv(index=False)
-            st.download_button("Baixar CSV", data=csv_data, file_name="osint_results.csv")
+        export_format = st.selectbox("Formato", available_formats())
+        st.caption(f"{len(store)} resultados na sessao")
+        st.download_button(
+            f"Baixar {export_format.upper()}",
+            data=report_download(store, export_format, os.path.join(CACHE_DIR, "exports")),
+            file_name=f"osint_results.{export_format}",
+            mime=MIME_TYPES[export_format],
+        )
+
+        st.subheader("Triagem de Metadados do Arquivo")
+        archived = get_blob_store().entries()
+        st.caption(f"{len(archived)} imagens arquivadas")
+        if st.button("Analisar Metadados em Lote") and archived:
+            with st.spinner("Extraindo EXIF em lote..."):
+                frame = extract_batch([path for _, path in archived])
+            frame.insert(0, "url", [url for url, _ in archived])
+            st.dataframe(frame.drop(columns=["source"]), use_container_width=True)
+
+    if METRICS_FILE:
+        get_metrics().write_prometheus(METRICS_FILE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+import ddg_parser
+from osint_core import DEGRADED_PAGE_COOLDOWN, OSINTCore
+from rate_limiter import RateLimiter
+from retry_scheduler import TRANSIENT, TRANSIENT_STATUSES, RetryExhausted, TransientError, classify, parse_retry_after
+
+
+class AsyncOSINTCore(OSINTCore):
+    def __init__(
+        self,
+        *args: object,
+        client: Optional["httpx.AsyncClient"] = None,
+        max_connections: int = 10,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.max_connections = max_connections
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.request_timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+        self.close()
+
+    async def __aenter__(self) -> "AsyncOSINTCore":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _throttle_async(self, url: str) -> float:
+        return await self.rate_limiter.acquire_async(RateLimiter.host_of(url))
+
+    @staticmethod
+    def _classify_async_error(error: BaseException) -> str:
+        if isinstance(error, httpx.TransportError):
+            return TRANSIENT
+        return classify(error)
+
+    @classmethod
+    def _is_async_upstream_failure(cls, error: BaseException) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code == 403 or error.response.status_code in TRANSIENT_STATUSES
+        return cls._classify_async_error(error) == TRANSIENT
+
+    async def _fetch_search_page_async(self, query: str) -> Tuple[str, str]:
+        with self.circuit_breaker.guard(RateLimiter.host_of(self.search_url), self._is_async_upstream_failure):
+            await self._throttle_async(self.search_url)
+            response = await self.client.get(
+                self.search_url,
+                params={"q": query},
+                headers=self._get_headers(),
+            )
+            if response.status_code in TRANSIENT_STATUSES:
+                raise TransientError(
+                    f"{response.status_code} from {self.search_url}",
+                    status=response.status_code,
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
+            response.raise_for_status()
+            html = response.text
+            kind = ddg_parser.classify_page(html, response.status_code, self.parser)
+            self._count_page(kind)
+            if kind == ddg_parser.DEGRADED:
+                raise TransientError(
+                    f"degraded page from {self.search_url}",
+                    status=response.status_code,
+                    retry_after=DEGRADED_PAGE_COOLDOWN,
+                )
+        return html, kind
+
+    async def async_search_web(self, query: str, max_results: int = 20) -> List[str]:
+        if httpx is None or not ddg_parser.is_available(self.parser):
+            return []
+        if self.cache is not None:
+            cached = self.cache.get(query, max_results)
+            if cached is not None:
+                return cached
+        try:
+            html, kind = await self.retry_scheduler.call_async(
+                RateLimiter.host_of(self.search_url),
+                lambda: self._fetch_search_page_async(query),
+                self._classify_async_error,
+            )
+        except (RetryExhausted, httpx.HTTPError):
+            return []
+        results: List[str] = []
+        if kind == ddg_parser.RESULTS:
+            results = await asyncio.to_thread(self._parse_results, html, max_results)
+        if self.cache is not None and kind != ddg_parser.UNKNOWN:
+            self.cache.set(query, max_results, results)
+        return results
+
+    async def aiter_dorks(
+        self, target: str, dork_types: Optional[List[str]] = None, max_results: int = 20
+    ) -> AsyncIterator[Dict[str, object]]:
+        async def run_dork(dork_type: str, query: str) -> Dict[str, object]:
+            urls = await self.async_search_web(query, max_results=max_results)
+            return {"type": dork_type, "query": query, "urls": urls}
+
+        tasks = [
+            asyncio.ensure_future(run_dork(dork_type, query))
+            for dork_type, query in self._dork_queries(target, dork_types)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def async_advanced_google_hacking(
+        self, target: str, dork_types: Optional[List[str]] = None, max_results: int = 20
+    ) -> Dict[str, object]:
+        queries = self._dork_queries(target, dork_types)
+        url_lists = await asyncio.gather(
+            *(self.async_search_web(query, max_results=max_results) for _, query in queries)
+        )
+        dorks = [
+            {"type": dork_type, "query": query, "urls": urls}
+            for (dork_type, query), urls in zip(queries, url_lists)
+        ]
+        return {"target": target, "dorks": dorks}
@@ -0,0 +1,56 @@
+import argparse
+import io
+import timeit
+from typing import Dict, Tuple
+
+from PIL import Image
+
+import exif_reader
+from app import extract_exif_pil
+
+
+def _sample(fmt: str, size: Tuple[int, int]) -> bytes:
+    exif = Image.Exif()
+    exif[271] = "Canon"
+    exif[272] = "EOS 80D"
+    exif[306] = "2024:05:01 10:00:00"
+    exif[0x8825] = {1: "S", 2: (23.0, 33.0, 1.2), 3: "W", 4: (46.0, 38.0, 10.0)}
+    exif.get_ifd(0x8769)[36867] = "2024:05:01 09:59:00"
+    image = Image.effect_noise(size, 64).convert("RGB")
+    buf = io.BytesIO()
+    image.save(buf, format=fmt, exif=exif)
+    return buf.getvalue()
+
+
+def samples() -> Dict[str, bytes]:
+    return {
+        "jpeg 640x480": _sample("JPEG", (640, 480)),
+        "jpeg 4000x3000": _sample("JPEG", (4000, 3000)),
+        "png 1024x768": _sample("PNG", (1024, 768)),
+    }
+
+
+def run(repeat: int, number: int, prefix_bytes: int) -> None:
+    print(f"{'image':<16} {'size KB':>8} {'pil ms':>9} {'header ms':>10} {'prefix ms':>10} {'speedup':>8}")
+    for name, data in samples().items():
+        prefix = memoryview(data)[:prefix_bytes]
+        pil = min(timeit.repeat(lambda: extract_exif_pil(data), repeat=repeat, number=number)) / number
+        header = min(timeit.repeat(lambda: exif_reader.read_exif(data), repeat=repeat, number=number)) / number
+        partial = min(timeit.repeat(lambda: exif_reader.read_exif(prefix), repeat=repeat, number=number)) / number
+        print(
+            f"{name:<16} {len(data) / 1024:>8.0f} {pil * 1000:>9.3f} {header * 1000:>10.3f} "
+            f"{partial * 1000:>10.3f} {pil / header:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare header-only EXIF parsing against the PIL path.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--prefix-bytes", type=int, default=65536)
+    args = parser.parse_args()
+    run(args.repeat, args.number, args.prefix_bytes)
+
+
+if __name__ == "__main__":
+    main()
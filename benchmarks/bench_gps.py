@@ -0,0 +1,185 @@
+import argparse
+import timeit
+from typing import Dict, List, Optional, Tuple
+
+from PIL.TiffImagePlugin import IFDRational
+
+import gps
+
+Expected = Optional[Tuple[float, float]]
+
+
+def _ifd(*pairs: Tuple[int, int]) -> Tuple[IFDRational, ...]:
+    return tuple(IFDRational(num, den) for num, den in pairs)
+
+
+CORPUS: List[Tuple[str, Dict[object, object], Expected]] = [
+    (
+        "pillow ifdrational (phone)",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": _ifd((37, 1), (46, 1), (3013, 100)),
+            "GPSLongitudeRef": "W",
+            "GPSLongitude": _ifd((122, 1), (25, 1), (1056, 100)),
+        },
+        (37.775036, -122.419600),
+    ),
+    (
+        "tuple rationals (header reader)",
+        {
+            "GPSLatitudeRef": "S",
+            "GPSLatitude": ((23, 1), (33, 1), (6, 5)),
+            "GPSLongitudeRef": "W",
+            "GPSLongitude": ((46, 1), (38, 1), (10, 1)),
+        },
+        (-23.550333, -46.636111),
+    ),
+    (
+        "degrees + decimal minutes",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": ((48, 1), (5143, 100), (0, 1)),
+            "GPSLongitudeRef": "E",
+            "GPSLongitude": ((2, 1), (1753, 100), (0, 1)),
+        },
+        (48.857167, 2.292167),
+    ),
+    (
+        "decimal degrees in first rational",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": ((51500729, 1000000), (0, 1), (0, 1)),
+            "GPSLongitudeRef": "W",
+            "GPSLongitude": ((124625, 1000000), (0, 1), (0, 1)),
+        },
+        (51.500729, -0.124625),
+    ),
+    (
+        "plain floats",
+        {
+            "GPSLatitudeRef": "S",
+            "GPSLatitude": (33.0, 52.0, 4.8),
+            "GPSLongitudeRef": "E",
+            "GPSLongitude": (151.0, 12.0, 30.0),
+        },
+        (-33.868, 151.208333),
+    ),
+    (
+        "numeric tag ids, byte refs",
+        {1: b"N\x00", 2: ((35, 1), (39, 1), (2928, 100)), 3: b"E\x00", 4: ((139, 1), (44, 1), (2844, 100))},
+        (35.658133, 139.7412333),
+    ),
+    (
+        "lowercase refs",
+        {
+            "GPSLatitudeRef": "s",
+            "GPSLatitude": ((22, 1), (54, 1), (0, 1)),
+            "GPSLongitudeRef": "w",
+            "GPSLongitude": ((43, 1), (12, 1), (0, 1)),
+        },
+        (-22.9, -43.2),
+    ),
+    (
+        "signed degrees, missing refs",
+        {"GPSLatitude": (-34.0, 36.0, 0.0), "GPSLongitude": (-58.0, 22.0, 48.0)},
+        (-34.6, -58.38),
+    ),
+    (
+        "zero denominators",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": _ifd((0, 0), (0, 0), (0, 0)),
+            "GPSLongitudeRef": "E",
+            "GPSLongitude": _ifd((0, 0), (0, 0), (0, 0)),
+        },
+        None,
+    ),
+    (
+        "null island placeholder",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": ((0, 1), (0, 1), (0, 1)),
+            "GPSLongitudeRef": "E",
+            "GPSLongitude": ((0, 1), (0, 1), (0, 1)),
+        },
+        None,
+    ),
+    (
+        "minutes out of range",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": ((10, 1), (75, 1), (0, 1)),
+            "GPSLongitudeRef": "E",
+            "GPSLongitude": ((20, 1), (0, 1), (0, 1)),
+        },
+        None,
+    ),
+    (
+        "latitude beyond 90",
+        {
+            "GPSLatitudeRef": "N",
+            "GPSLatitude": ((123, 1), (0, 1), (0, 1)),
+            "GPSLongitudeRef": "E",
+            "GPSLongitude": ((20, 1), (0, 1), (0, 1)),
+        },
+        None,
+    ),
+    (
+        "truncated value",
+        {"GPSLatitudeRef": "N", "GPSLatitude": "garbage", "GPSLongitudeRef": "E", "GPSLongitude": ()},
+        None,
+    ),
+    ("longitude missing", {"GPSLatitudeRef": "N", "GPSLatitude": ((10, 1), (0, 1), (0, 1))}, None),
+]
+
+
+def _legacy_gps_to_decimal(gps_info: Dict[object, object]) -> Expected:
+    def to_degrees(value: Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]) -> float:
+        d = value[0][0] / value[0][1]
+        m = value[1][0] / value[1][1]
+        s = value[2][0] / value[2][1]
+        return d + (m / 60.0) + (s / 3600.0)
+
+    try:
+        lat = to_degrees(gps_info["GPSLatitude"])
+        if gps_info.get("GPSLatitudeRef") == "S":
+            lat = -lat
+        lon = to_degrees(gps_info["GPSLongitude"])
+        if gps_info.get("GPSLongitudeRef") == "W":
+            lon = -lon
+    except (KeyError, IndexError, TypeError, ZeroDivisionError):
+        return None
+    return lat, lon
+
+
+def _time(label: str, infos: List[Dict[object, object]], repeat: int) -> None:
+    timings = {
+        "legacy (try/except)": lambda: [_legacy_gps_to_decimal(info) for info in infos],
+        "gps_to_decimal": lambda: [gps.gps_to_decimal(info) for info in infos],
+        "decode_batch": lambda: gps.decode_batch(infos),
+    }
+    decoded = sum(1 for info in infos if gps.gps_to_decimal(info) is not None)
+    legacy = sum(1 for info in infos if _legacy_gps_to_decimal(info) is not None)
+    print(f"{label}: {len(infos)} GPS blocks, decoded gps={decoded} legacy={legacy}")
+    print(f"  {'decoder':<22} {'total ms':>9} {'us/item':>8}")
+    for name, fn in timings.items():
+        best = min(timeit.repeat(fn, repeat=repeat, number=1))
+        print(f"  {name:<22} {best * 1000:>9.2f} {best / len(infos) * 1e6:>8.2f}")
+
+
+def run(repeat: int, copies: int) -> None:
+    _time("mixed corpus", [info for _, info, _ in CORPUS] * copies, repeat)
+    for label, info, _ in CORPUS[:2]:
+        _time(label, [info] * (copies * 10), repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decode a corpus of real-world EXIF GPS encodings.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--copies", type=int, default=500, help="times the corpus is repeated per run")
+    args = parser.parse_args()
+    run(args.repeat, args.copies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import glob
+import os
+import timeit
+from typing import List
+
+import ddg_parser
+from osint_core import OSINTCore
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "fixtures")
+
+
+def run(repeat: int, number: int, max_results_options: List[int]) -> None:
+    paths = sorted(glob.glob(os.path.join(FIXTURES, "ddg_*.html")))
+    print(f"{'fixture':<24} {'backend':<8} {'max':>4} {'best ms':>9} {'vs bs4':>7}")
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            html = handle.read()
+        name = os.path.basename(path)
+        for max_results in max_results_options:
+            timings = {}
+            for backend in ddg_parser.available_backends():
+                core = OSINTCore(parser=backend)
+                samples = timeit.repeat(
+                    lambda: core._parse_results(html, max_results),
+                    repeat=repeat,
+                    number=number,
+                )
+                timings[backend] = min(samples) / number * 1000
+            baseline = timings.get("bs4")
+            for backend, best_ms in timings.items():
+                speedup = f"{baseline / best_ms:6.1f}x" if baseline else "    n/a"
+                print(f"{name:<24} {backend:<8} {max_results:>4} {best_ms:>9.3f} {speedup:>7}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare DuckDuckGo result parser backends.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--max-results", type=int, nargs="+", default=[5, 20, 100])
+    args = parser.parse_args()
+    run(args.repeat, args.number, args.max_results)
+
+
+if __name__ == "__main__":
+    main()
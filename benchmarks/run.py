@@ -0,0 +1,184 @@
+import argparse
+import functools
+import json
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+from app import extract_exif, fetch_image, link_table
+from benchmarks.standin_server import StandInServer, make_profile_loader
+from osint_core import OSINTCore
+from rate_limiter import RateLimiter
+from results_store import ResultsStore
+
+SCENARIOS = (
+    "search_web",
+    "advanced_google_hacking",
+    "fetch_image",
+    "extract_exif",
+    "link_table_cold",
+    "link_table",
+    "profile_lookup",
+    "profile_lookup_cold",
+)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(name: str, fn: Callable[[int], object], iterations: int, warmup: int = 2) -> Dict[str, object]:
+    for i in range(warmup):
+        try:
+            fn(i)
+        except Exception:
+            pass
+    samples: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        try:
+            fn(i)
+        except Exception:
+            errors += 1
+        samples.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    return {
+        "scenario": name,
+        "iterations": iterations,
+        "errors": errors,
+        "throughput_per_s": iterations / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def _synthetic_dork_results(per_dork: int = 30) -> Dict[str, object]:
+    dork_types = ["Fotos e Imagens", "Perfis em Redes Sociais", "Fotos em Redes Sociais", "Mencoes Publicas"]
+    return {
+        "target": "bench",
+        "dorks": [
+            {
+                "type": dork_type,
+                "query": dork_type,
+                "urls": [f"https://site{i}.example.com/{dork_type[:5]}/{i}.jpg" for i in range(per_dork)],
+            }
+            for dork_type in dork_types
+        ],
+    }
+
+
+def _populated_store(dork_results: Dict[str, object]) -> ResultsStore:
+    store = ResultsStore()
+    for entry in dork_results["dorks"]:
+        store.add_dork(entry)
+    return store
+
+
+def build_scenarios(server: StandInServer, min_interval: float) -> Dict[str, Callable[[int], object]]:
+    core = OSINTCore(
+        search_url=f"{server.url}/html/",
+        rate_limiter=RateLimiter(min_interval=min_interval),
+        max_retries=0,
+    )
+    loader_factory = functools.partial(make_profile_loader, server.url)
+    profile_core = OSINTCore(profile_loader_factory=loader_factory)
+    headers = core._get_headers()
+    exif_bytes = server.images["exif.jpg"][1]
+    dork_results = _synthetic_dork_results()
+    store = _populated_store(dork_results)
+
+    def run_fetch_image(i: int) -> object:
+        _, status = fetch_image(f"{server.url}/images/exif.jpg", headers, core.session)
+        if status != "ok":
+            raise RuntimeError(status)
+        return status
+
+    def run_search_web(i: int) -> object:
+        urls = core.search_web(f"bench query {i}")
+        if not urls:
+            raise RuntimeError("no results")
+        return urls
+
+    def run_profile_lookup(core_for_lookup: OSINTCore, i: int) -> object:
+        profile = core_for_lookup.get_profile_metadata(f"user{i}")
+        if "error" in profile:
+            raise RuntimeError(profile["error"])
+        return profile
+
+    def run_profile_lookup_cold(i: int) -> object:
+        with OSINTCore(profile_loader_factory=loader_factory) as cold_core:
+            return run_profile_lookup(cold_core, i)
+
+    return {
+        "search_web": run_search_web,
+        "advanced_google_hacking": lambda i: core.advanced_google_hacking(f"target{i}"),
+        "fetch_image": run_fetch_image,
+        "extract_exif": lambda i: extract_exif(exif_bytes),
+        "link_table_cold": lambda i: link_table(_populated_store(dork_results)),
+        "link_table": lambda i: link_table(store),
+        "profile_lookup": functools.partial(run_profile_lookup, profile_core),
+        "profile_lookup_cold": run_profile_lookup_cold,
+    }
+
+
+def run(
+    scenarios: List[str],
+    iterations: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+    min_interval: float,
+    seed: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    results = []
+    with StandInServer(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed) as server:
+        available = build_scenarios(server, min_interval)
+        for name in scenarios:
+            results.append(measure(name, available[name], iterations))
+    return results
+
+
+def print_report(results: List[Dict[str, object]]) -> None:
+    print(f"{'scenario':<26} {'iter':>5} {'err':>4} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for row in results:
+        print(
+            f"{row['scenario']:<26} {row['iterations']:>5} {row['errors']:>4} "
+            f"{row['throughput_per_s']:>9.1f} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline OSINT benchmarks against a local stand-in server.")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--min-interval", type=float, default=0.0, help="rate limiter spacing per host")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", dest="json_path", default=None, help="also write results to this file")
+    args = parser.parse_args()
+    results = run(
+        args.scenario or list(SCENARIOS),
+        args.iterations,
+        args.latency,
+        args.jitter,
+        args.error_rate,
+        args.min_interval,
+        args.seed,
+    )
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import functools
+import io
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
+
+try:
+    import instaloader
+except ImportError:  # pragma: no cover
+    instaloader = None  # type: ignore[assignment]
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "fixtures")
+
+
+@functools.lru_cache(maxsize=None)
+def make_image(
+    fmt: str = "JPEG",
+    with_exif: bool = True,
+    size: Tuple[int, int] = (640, 480),
+    noise: bool = False,
+) -> bytes:
+    if noise:
+        image = Image.effect_noise(size, 64).convert("RGB")
+    else:
+        image = Image.new("RGB", size, (40, 90, 160))
+    buf = io.BytesIO()
+    if with_exif:
+        exif = Image.Exif()
+        exif[271] = "Canon"
+        exif[272] = "EOS 80D"
+        exif[306] = "2024:05:01 10:00:00"
+        exif[0x8825] = {1: "S", 2: (23.0, 33.0, 1.2), 3: "W", 4: (46.0, 38.0, 10.0)}
+        image.save(buf, format=fmt, exif=exif)
+    else:
+        image.save(buf, format=fmt)
+    return buf.getvalue()
+
+
+def _load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as handle:
+        return handle.read()
+
+
+class RewriteAdapter(HTTPAdapter):
+    def __init__(self, base_url: str) -> None:
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+
+    def send(self, request: requests.PreparedRequest, **kwargs: object) -> requests.Response:
+        parsed = urlparse(request.url)
+        request.url = f"{self.base_url}{parsed.path}" + (f"?{parsed.query}" if parsed.query else "")
+        return super().send(request, **kwargs)
+
+
+def make_profile_loader(base_url: str) -> object:
+    class UnthrottledRateController(instaloader.RateController):
+        def query_waittime(self, query_type: str, current_time: float, untracked_queries: bool = False) -> float:
+            return 0.0
+
+    loader = instaloader.Instaloader(
+        sleep=False,
+        quiet=True,
+        max_connection_attempts=1,
+        rate_controller=UnthrottledRateController,
+    )
+    loader.context._session.mount("https://www.instagram.com/", RewriteAdapter(base_url))
+    return loader
+
+
+class StandInServer:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+        support_ranges: bool = True,
+    ) -> None:
+        self.support_ranges = support_ranges
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self._counters_lock = threading.Lock()
+        self.pages = {
+            "results": _load_fixture("ddg_results.html"),
+            "empty": _load_fixture("ddg_no_results.html"),
+            "anomaly": _load_fixture("ddg_anomaly.html"),
+        }
+        self.images = {
+            "exif.jpg": ("image/jpeg", make_image("JPEG", with_exif=True)),
+            "plain.jpg": ("image/jpeg", make_image("JPEG", with_exif=False)),
+            "plain.png": ("image/png", make_image("PNG", with_exif=False)),
+            "large.jpg": ("image/jpeg", make_image("JPEG", with_exif=True, size=(2000, 1500), noise=True)),
+        }
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, route: str) -> None:
+        with self._counters_lock:
+            self.counters[route] = self.counters.get(route, 0) + 1
+
+    def _delay(self) -> float:
+        with self._random_lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def _should_fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.error_rate
+
+    def profile_payload(self, username: str) -> Dict[str, object]:
+        return {
+            "data": {
+                "user": {
+                    "username": username,
+                    "biography": f"stand-in profile for {username}",
+                    "edge_followed_by": {"count": 1200 + len(username)},
+                    "edge_follow": {"count": 300},
+                    "id": str(zlib.crc32(username.encode("utf-8"))),
+                    "profile_pic_url": f"{self.url}/images/plain.jpg",
+                    "profile_pic_url_hd": f"{self.url}/images/plain.jpg",
+                    "is_private": username.endswith("_private"),
+                }
+            },
+            "status": "ok",
+        }
+
+    def _route(self, path: str, query: Dict[str, list]) -> Tuple[int, str, bytes]:
+        if path in ("/html", "/html/"):
+            self._count("search")
+            text = (query.get("q") or [""])[0]
+            if "blocked" in text:
+                return 202, "text/html; charset=utf-8", self.pages["anomaly"]
+            page = self.pages["empty"] if "noresults" in text else self.pages["results"]
+            return 200, "text/html; charset=utf-8", page
+        if path.startswith("/images/"):
+            self._count("image")
+            entry = self.images.get(path[len("/images/"):])
+            if entry is None:
+                return 404, "text/plain", b"not found"
+            return 200, entry[0], entry[1]
+        if path.startswith("/api/v1/users/web_profile_info"):
+            self._count("profile")
+            username = (query.get("username") or [""])[0]
+            body = json.dumps(self.profile_payload(username)).encode("utf-8")
+            return 200, "application/json", body
+        return 404, "text/plain", b"not found"
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self, include_body: bool) -> None:
+                parsed = urlparse(self.path)
+                delay = server._delay()
+                if delay:
+                    time.sleep(delay)
+                if server._should_fail():
+                    server._count("error")
+                    status, content_type, body = server.error_status, "text/plain", b"injected error"
+                else:
+                    status, content_type, body = server._route(parsed.path, parse_qs(parsed.query))
+                total = len(body)
+                byte_range = self.headers.get("Range") if server.support_ranges else None
+                content_range = None
+                if status == 200 and byte_range and byte_range.startswith("bytes="):
+                    first, _, last = byte_range[len("bytes="):].partition("-")
+                    start = int(first or 0)
+                    end = min(int(last) if last else total - 1, total - 1)
+                    body = body[start : end + 1]
+                    status = 206
+                    content_range = f"bytes {start}-{end}/{total}"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body) if include_body else total))
+                if server.support_ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+                if content_range:
+                    self.send_header("Content-Range", content_range)
+                self.end_headers()
+                if include_body:
+                    self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                self._respond(include_body=True)
+
+            def do_HEAD(self) -> None:
+                self._respond(include_body=False)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "StandInServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
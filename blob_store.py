@@ -0,0 +1,183 @@
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class BlobStore:
+    def __init__(
+        self,
+        root: str,
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._clock = clock
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " digest TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_index ("
+            " url TEXT PRIMARY KEY,"
+            " digest TEXT NOT NULL,"
+            " stored_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS url_index_digest ON url_index (digest)")
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.dedup_hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def digest_of(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _write_blob(self, digest: str, data: bytes) -> bool:
+        path = self.path_for(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+        return True
+
+    def put(self, url: str, data: bytes) -> str:
+        digest = self.digest_of(data)
+        written = self._write_blob(digest, data)
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blobs (digest, size, created_at) VALUES (?, ?, ?)",
+                (digest, len(data), now),
+            )
+            self._conn.execute("UPDATE blobs SET created_at = ? WHERE digest = ?", (now, digest))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO url_index (url, digest, stored_at) VALUES (?, ?, ?)",
+                (url, digest, now),
+            )
+            self._evict(digest)
+            self._conn.commit()
+            if written:
+                self.writes += 1
+            else:
+                self.dedup_hits += 1
+        return digest
+
+    def _evict(self, keep: str) -> None:
+        if self.max_bytes is None:
+            return
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT digest, size FROM blobs WHERE digest != ? ORDER BY created_at, rowid", (keep,)
+        ).fetchall()
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM url_index WHERE digest = ?", (digest,))
+            self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            try:
+                os.remove(self.path_for(digest))
+            except OSError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    def digest_for(self, url: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM url_index WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    @contextmanager
+    def open_digest(self, digest: str) -> Iterator[Optional[memoryview]]:
+        try:
+            handle = open(self.path_for(digest), "rb")
+        except OSError:
+            yield None
+            return
+        with handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                mapped = None
+            else:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped is None:
+            yield memoryview(b"")
+            return
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            mapped.close()
+
+    @contextmanager
+    def open(self, url: str) -> Iterator[Optional[memoryview]]:
+        digest = self.digest_for(url)
+        if digest is None:
+            with self._lock:
+                self.misses += 1
+            yield None
+            return
+        with self.open_digest(digest) as view:
+            with self._lock:
+                if view is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            yield view
+
+    def get(self, url: str) -> Optional[bytes]:
+        with self.open(url) as view:
+            return None if view is None else bytes(view)
+
+    def entries(self) -> List[Tuple[str, str]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT url, digest FROM url_index ORDER BY stored_at, rowid").fetchall()
+        return [(url, self.path_for(digest)) for url, digest in rows]
+
+    def __contains__(self, url: str) -> bool:
+        digest = self.digest_for(url)
+        return digest is not None and os.path.exists(self.path_for(digest))
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM url_index").fetchone()
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            (urls,) = self._conn.execute("SELECT COUNT(*) FROM url_index").fetchone()
+            blobs, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "dedup_hits": self.dedup_hits,
+            "evictions": self.evictions,
+            "urls": urls,
+            "blobs": blobs,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,154 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+from retry_scheduler import RetryExhausted
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RetryExhausted):
+    def __init__(self, key: str, ready_at: float) -> None:
+        super().__init__(key, 0, None, ready_at)
+        self.args = (f"circuit open for {key}",)
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "trips", "rejected")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.trips = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def _refresh(self, circuit: _Circuit, now: float) -> None:
+        if circuit.state == OPEN and now - circuit.opened_at >= self.reset_timeout:
+            circuit.state = HALF_OPEN
+            circuit.probes = 0
+
+    def state(self, key: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            self._refresh(circuit, self._clock())
+            return circuit.state
+
+    def retry_in(self, key: str) -> float:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state != OPEN:
+                return 0.0
+            return max(0.0, circuit.opened_at + self.reset_timeout - self._clock())
+
+    def allow(self, key: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            circuit = self._circuit(key)
+            self._refresh(circuit, now)
+            if circuit.state == CLOSED:
+                return True
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                return True
+            circuit.rejected += 1
+            return False
+
+    def before_call(self, key: str) -> None:
+        if not self.allow(key):
+            raise CircuitOpenError(key, self._clock() + self.retry_in(key))
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuit(key)
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probes = 0
+
+    def record_failure(self, key: str) -> None:
+        now = self._clock()
+        with self._lock:
+            circuit = self._circuit(key)
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state != OPEN:
+                    circuit.trips += 1
+                circuit.state = OPEN
+                circuit.opened_at = now
+                circuit.probes = 0
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    @contextmanager
+    def guard(self, key: str, is_failure: Callable[[BaseException], bool]) -> Iterator[None]:
+        self.before_call(key)
+        try:
+            yield
+        except Exception as exc:
+            if is_failure(exc):
+                self.record_failure(key)
+            else:
+                self.record_success(key)
+            raise
+        except BaseException:
+            self.release(key)
+            raise
+        self.record_success(key)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        now = self._clock()
+        rows: List[Dict[str, object]] = []
+        with self._lock:
+            for key in sorted(self._circuits):
+                circuit = self._circuits[key]
+                self._refresh(circuit, now)
+                retry_in = circuit.opened_at + self.reset_timeout - now if circuit.state == OPEN else 0.0
+                rows.append(
+                    {
+                        "upstream": key,
+                        "state": circuit.state,
+                        "failures": circuit.failures,
+                        "trips": circuit.trips,
+                        "rejected": circuit.rejected,
+                        "retry_in": round(max(0.0, retry_in), 1),
+                    }
+                )
+        return rows
@@ -0,0 +1,129 @@
+from collections import deque
+from html.parser import HTMLParser
+from typing import Deque, Iterator, List
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # pragma: no cover
+    BeautifulSoup = None  # type: ignore[assignment,misc]
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover
+    etree = None  # type: ignore[assignment]
+
+RESULT_ANCHOR_CLASS = "result__a"
+PARSER_BACKENDS = ("auto", "lxml", "stream", "bs4")
+
+RESULTS = "results"
+EMPTY = "empty"
+DEGRADED = "degraded"
+UNKNOWN = "unknown"
+PAGE_KINDS = (RESULTS, EMPTY, DEGRADED, UNKNOWN)
+NO_RESULTS_MARKER = 'class="no-results"'
+INTERSTITIAL_MARKERS = (
+    'class="anomaly-modal',
+    'id="challenge-form"',
+    'class="g-recaptcha"',
+    'class="h-captcha"',
+)
+
+
+class _ResultAnchorParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.hrefs: Deque[str] = deque()
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]) -> None:
+        if tag != "a":
+            return
+        href = None
+        is_result = False
+        for name, value in attrs:
+            if name == "class" and value and RESULT_ANCHOR_CLASS in value.split():
+                is_result = True
+            elif name == "href":
+                href = value
+        if is_result and href:
+            self.hrefs.append(href)
+
+
+def available_backends() -> List[str]:
+    backends = ["stream"]
+    if etree is not None:
+        backends.insert(0, "lxml")
+    if BeautifulSoup is not None:
+        backends.append("bs4")
+    return backends
+
+
+def resolve_backend(backend: str) -> str:
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"unknown parser backend: {backend!r}")
+    if backend == "auto":
+        return available_backends()[0]
+    return backend
+
+
+def is_available(backend: str) -> bool:
+    return resolve_backend(backend) in available_backends()
+
+
+def _iter_bs4(html: str) -> Iterator[str]:
+    soup = BeautifulSoup(html, "html.parser")
+    for link in soup.select(f"a.{RESULT_ANCHOR_CLASS}"):
+        href = link.get("href")
+        if href:
+            yield href
+
+
+def _iter_stream(html: str, chunk_size: int) -> Iterator[str]:
+    parser = _ResultAnchorParser()
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start : start + chunk_size])
+        while parser.hrefs:
+            yield parser.hrefs.popleft()
+    parser.close()
+    while parser.hrefs:
+        yield parser.hrefs.popleft()
+
+
+def _read_lxml_hrefs(parser: "etree.HTMLPullParser") -> Iterator[str]:
+    for _, element in parser.read_events():
+        if RESULT_ANCHOR_CLASS in (element.get("class") or "").split():
+            href = element.get("href")
+            if href:
+                yield href
+
+
+def _iter_lxml(html: str, chunk_size: int) -> Iterator[str]:
+    if not html:
+        return
+    parser = etree.HTMLPullParser(events=("start",), tag="a")
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start : start + chunk_size])
+        yield from _read_lxml_hrefs(parser)
+    parser.close()
+    yield from _read_lxml_hrefs(parser)
+
+
+def iter_result_hrefs(html: str, backend: str = "auto", chunk_size: int = 8192) -> Iterator[str]:
+    resolved = resolve_backend(backend)
+    if resolved == "lxml" and etree is not None:
+        return _iter_lxml(html, chunk_size)
+    if resolved == "bs4" and BeautifulSoup is not None:
+        return _iter_bs4(html)
+    if resolved == "stream":
+        return _iter_stream(html, chunk_size)
+    return iter(())
+
+
+def classify_page(html: str, status: int = 200, backend: str = "auto") -> str:
+    if status == 202 or any(marker in html for marker in INTERSTITIAL_MARKERS):
+        return DEGRADED
+    hrefs = iter_result_hrefs(html, backend)
+    if next(hrefs, None) is not None:
+        return RESULTS
+    if NO_RESULTS_MARKER in html:
+        return EMPTY
+    return UNKNOWN
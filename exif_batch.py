@@ -0,0 +1,101 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+import exif_reader
+import gps
+
+Source = Union[bytes, bytearray, memoryview, str]
+
+COLUMNS = ["source", "format", "make", "model", "datetime", "tag_count", "latitude", "longitude"]
+
+
+def _read_source(source: Source, prefix_bytes: int) -> bytes:
+    if not isinstance(source, str):
+        return bytes(source)
+    with open(source, "rb") as handle:
+        data = handle.read(prefix_bytes)
+        status, _, needed = exif_reader.locate_exif(data)
+        while status == exif_reader.INCOMPLETE and needed > len(data):
+            chunk = handle.read(needed - len(data))
+            if not chunk:
+                break
+            data += chunk
+            status, _, needed = exif_reader.locate_exif(data)
+        if exif_reader.sniff_format(data) is None:
+            data += handle.read()
+    return data
+
+
+def _read_exif_any(data: bytes) -> Dict[object, object]:
+    if exif_reader.sniff_format(data) is not None:
+        return exif_reader.read_exif(data)
+    try:
+        raw = Image.open(io.BytesIO(data)).getexif().tobytes()
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return {}
+    if raw.startswith(exif_reader.EXIF_HEADER):
+        raw = raw[len(exif_reader.EXIF_HEADER) :]
+    return exif_reader.parse_tiff(raw)
+
+
+def extract_row(source: Source, prefix_bytes: int = 65536) -> Dict[str, object]:
+    label = source if isinstance(source, str) else None
+    try:
+        data = _read_source(source, prefix_bytes)
+    except OSError:
+        data = b""
+    exif = _read_exif_any(data) if data else {}
+    gps_info = exif.get("GPSInfo")
+    if not isinstance(gps_info, dict):
+        gps_info = {}
+    lat, lat_ref = gps.axis_fields(gps_info, gps.LATITUDE)
+    lon, lon_ref = gps.axis_fields(gps_info, gps.LONGITUDE)
+    return {
+        "source": label,
+        "format": exif_reader.sniff_format(data) if data else None,
+        "make": exif.get("Make"),
+        "model": exif.get("Model"),
+        "datetime": exif.get("DateTimeOriginal") or exif.get("DateTime"),
+        "tag_count": len(exif),
+        "lat_ref": lat_ref,
+        "lat": gps.dms_components(lat),
+        "lon_ref": lon_ref,
+        "lon": gps.dms_components(lon),
+    }
+
+
+def rows_to_frame(rows: List[Dict[str, object]]) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame(columns=COLUMNS)
+    latitude, longitude = gps.mask_invalid_pairs(
+        gps.degrees_array(np.array([row["lat"] for row in rows]), [row["lat_ref"] for row in rows], gps.LATITUDE),
+        gps.degrees_array(np.array([row["lon"] for row in rows]), [row["lon_ref"] for row in rows], gps.LONGITUDE),
+    )
+    frame = pd.DataFrame({column: [row[column] for row in rows] for column in COLUMNS[:-2]})
+    frame["latitude"] = latitude
+    frame["longitude"] = longitude
+    return frame
+
+
+def extract_batch(
+    sources: Sequence[Source],
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+    prefix_bytes: int = 65536,
+    min_parallel: int = 32,
+) -> pd.DataFrame:
+    if max_workers == 1 or len(sources) < min_parallel:
+        rows = [extract_row(source, prefix_bytes) for source in sources]
+    else:
+        workers = max_workers or min(os.cpu_count() or 1, 8)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(
+                executor.map(extract_row, sources, [prefix_bytes] * len(sources), chunksize=chunksize)
+            )
+    return rows_to_frame(rows)
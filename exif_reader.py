@@ -0,0 +1,185 @@
+import struct
+from typing import Dict, Optional, Tuple, Union
+
+try:
+    from PIL import ExifTags
+except ImportError:  # pragma: no cover
+    ExifTags = None  # type: ignore[assignment]
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+JPEG_SOI = b"\xff\xd8"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+EXIF_HEADER = b"Exif\x00\x00"
+EXIF_IFD_POINTER = 0x8769
+GPS_IFD_POINTER = 0x8825
+MAX_OPAQUE_BYTES = 64
+
+FOUND = "found"
+ABSENT = "absent"
+INCOMPLETE = "incomplete"
+
+_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4, 10: 8, 11: 4, 12: 8}
+_OPAQUE_TYPES = frozenset({1, 6, 7})
+_TYPE_FORMATS = {3: "H", 4: "I", 8: "h", 9: "i", 11: "f", 12: "d"}
+_JPEG_STANDALONE_MARKERS = {0x01} | set(range(0xD0, 0xD8))
+
+
+def _tag_name(tag_id: int, gps: bool = False) -> object:
+    if ExifTags is None:
+        return tag_id
+    table = ExifTags.GPSTAGS if gps else ExifTags.TAGS
+    return table.get(tag_id, tag_id)
+
+
+def _locate_jpeg(view: memoryview) -> Tuple[str, Optional[memoryview], int]:
+    offset = 2
+    size = len(view)
+    while True:
+        if offset + 4 > size:
+            return INCOMPLETE, None, offset + 4
+        if view[offset] != 0xFF:
+            return ABSENT, None, offset
+        marker = view[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            return ABSENT, None, offset
+        (length,) = struct.unpack_from(">H", view, offset + 2)
+        end = offset + 2 + length
+        if marker == 0xE1:
+            if end > size:
+                return INCOMPLETE, None, end
+            payload = view[offset + 4 : end]
+            if bytes(payload[:6]) == EXIF_HEADER:
+                return FOUND, payload[6:], end
+        offset = end
+
+
+def _locate_png(view: memoryview) -> Tuple[str, Optional[memoryview], int]:
+    offset = len(PNG_SIGNATURE)
+    size = len(view)
+    while True:
+        if offset + 8 > size:
+            return INCOMPLETE, None, offset + 8
+        (length,) = struct.unpack_from(">I", view, offset)
+        chunk_type = bytes(view[offset + 4 : offset + 8])
+        data_start = offset + 8
+        end = data_start + length + 4
+        if chunk_type == b"eXIf":
+            if end > size:
+                return INCOMPLETE, None, end
+            return FOUND, view[data_start : data_start + length], end
+        if chunk_type in (b"IDAT", b"IEND"):
+            return ABSENT, None, offset
+        offset = end
+
+
+def sniff_format(data: Buffer) -> Optional[str]:
+    head = bytes(memoryview(data)[:8])
+    if head.startswith(JPEG_SOI):
+        return "jpeg"
+    if head == PNG_SIGNATURE:
+        return "png"
+    return None
+
+
+def locate_exif(data: Buffer) -> Tuple[str, Optional[memoryview], int]:
+    view = memoryview(data)
+    if len(view) < 8:
+        return INCOMPLETE, None, 8
+    image_format = sniff_format(view)
+    if image_format == "jpeg":
+        return _locate_jpeg(view)
+    if image_format == "png":
+        return _locate_png(view)
+    return ABSENT, None, 0
+
+
+def _read_value(tiff: memoryview, endian: str, type_id: int, count: int, value_offset: int) -> object:
+    if type_id == 2:
+        raw = bytes(tiff[value_offset : value_offset + count])
+        return raw.split(b"\x00", 1)[0].decode("utf-8", "replace")
+    if type_id in (1, 6, 7):
+        raw = bytes(tiff[value_offset : value_offset + count])
+        if type_id == 7:
+            return raw
+        return raw[0] if count == 1 else tuple(raw)
+    if type_id in (5, 10):
+        fmt = "i" if type_id == 10 else "I"
+        values = struct.unpack_from(f"{endian}{2 * count}{fmt}", tiff, value_offset)
+        pairs = tuple((values[i], values[i + 1]) for i in range(0, len(values), 2))
+        return pairs[0] if count == 1 else pairs
+    fmt = _TYPE_FORMATS[type_id]
+    values = struct.unpack_from(f"{endian}{count}{fmt}", tiff, value_offset)
+    return values[0] if count == 1 else values
+
+
+def _read_ifd(tiff: memoryview, endian: str, offset: int) -> Dict[int, object]:
+    entries: Dict[int, object] = {}
+    if offset + 2 > len(tiff):
+        return entries
+    (count,) = struct.unpack_from(f"{endian}H", tiff, offset)
+    for index in range(count):
+        entry = offset + 2 + index * 12
+        if entry + 12 > len(tiff):
+            break
+        tag_id, type_id, value_count = struct.unpack_from(f"{endian}HHI", tiff, entry)
+        unit = _TYPE_SIZES.get(type_id)
+        if unit is None:
+            continue
+        total = unit * value_count
+        if type_id in _OPAQUE_TYPES and total > MAX_OPAQUE_BYTES:
+            continue
+        if total <= 4:
+            value_offset = entry + 8
+        else:
+            (value_offset,) = struct.unpack_from(f"{endian}I", tiff, entry + 8)
+        if value_offset + total > len(tiff):
+            continue
+        entries[tag_id] = _read_value(tiff, endian, type_id, value_count, value_offset)
+    return entries
+
+
+def parse_tiff(tiff: Buffer) -> Dict[object, object]:
+    view = memoryview(tiff)
+    if len(view) < 8:
+        return {}
+    byte_order = bytes(view[:2])
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        return {}
+    (ifd0_offset,) = struct.unpack_from(f"{endian}I", view, 4)
+    ifd0 = _read_ifd(view, endian, ifd0_offset)
+    exif_data: Dict[object, object] = {}
+    for tag_id, value in ifd0.items():
+        if tag_id in (EXIF_IFD_POINTER, GPS_IFD_POINTER):
+            continue
+        exif_data[_tag_name(tag_id)] = value
+    exif_offset = ifd0.get(EXIF_IFD_POINTER)
+    if isinstance(exif_offset, int):
+        for tag_id, value in _read_ifd(view, endian, exif_offset).items():
+            exif_data.setdefault(_tag_name(tag_id), value)
+    gps_offset = ifd0.get(GPS_IFD_POINTER)
+    if isinstance(gps_offset, int):
+        gps = _read_ifd(view, endian, gps_offset)
+        if gps:
+            exif_data["GPSInfo"] = {_tag_name(key, gps=True): value for key, value in gps.items()}
+    return exif_data
+
+
+def read_exif(data: Buffer) -> Dict[object, object]:
+    status, tiff, _ = locate_exif(data)
+    if status != FOUND or tiff is None:
+        return {}
+    try:
+        return parse_tiff(tiff)
+    except (struct.error, KeyError, IndexError):
+        return {}
@@ -0,0 +1,192 @@
+import math
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+Components = Tuple[float, float, float]
+
+LATITUDE = "lat"
+LONGITUDE = "lon"
+
+_NAN_COMPONENTS: Components = (math.nan, math.nan, math.nan)
+_LIMITS = {LATITUDE: 90.0, LONGITUDE: 180.0}
+_NEGATIVE_REFS = {LATITUDE: "S", LONGITUDE: "W"}
+_POSITIVE_REFS = {LATITUDE: "N", LONGITUDE: "E"}
+_KEYS = {
+    LATITUDE: ("GPSLatitude", 2, "GPSLatitudeRef", 1),
+    LONGITUDE: ("GPSLongitude", 4, "GPSLongitudeRef", 3),
+}
+_PLAIN_REFS = frozenset(("N", "S", "E", "W"))
+_WEIGHTS = np.array([1.0, 1.0 / 60.0, 1.0 / 3600.0])
+
+
+_NUMBER_TYPES = (int, float)
+
+
+def rational_to_float(value: object) -> float:
+    kind = type(value)
+    if kind is tuple:
+        if len(value) != 2:
+            return math.nan
+        numerator, denominator = value
+        if type(numerator) not in _NUMBER_TYPES or type(denominator) not in _NUMBER_TYPES:
+            return math.nan
+        if not denominator:
+            return math.nan
+        return numerator / denominator
+    if kind is int or kind is float:
+        return float(value)
+    if kind is bool:
+        return math.nan
+    numerator = getattr(value, "numerator", None)
+    denominator = getattr(value, "denominator", None)
+    if type(numerator) in _NUMBER_TYPES and type(denominator) in _NUMBER_TYPES:
+        return numerator / denominator if denominator else math.nan
+    return math.nan
+
+
+def dms_components(value: object) -> Components:
+    if type(value) is tuple and len(value) == 3:
+        return (rational_to_float(value[0]), rational_to_float(value[1]), rational_to_float(value[2]))
+    if isinstance(value, (tuple, list)):
+        if len(value) == 2 and all(isinstance(part, int) and not isinstance(part, bool) for part in value):
+            return (rational_to_float(tuple(value)), 0.0, 0.0)
+        if not 1 <= len(value) <= 3:
+            return _NAN_COMPONENTS
+        parts = [rational_to_float(part) for part in value]
+        parts.extend([0.0] * (3 - len(parts)))
+        return (parts[0], parts[1], parts[2])
+    degrees = rational_to_float(value)
+    if math.isnan(degrees):
+        return _NAN_COMPONENTS
+    return (degrees, 0.0, 0.0)
+
+
+def normalize_ref(ref: object) -> str:
+    if type(ref) is str and ref in _PLAIN_REFS:
+        return ref
+    if isinstance(ref, bytes):
+        ref = ref.decode("ascii", "ignore")
+    if not isinstance(ref, str):
+        return ""
+    return ref.strip("\x00 ").upper()[:1]
+
+
+def components_to_degrees(components: Components, ref: object, axis: str) -> float:
+    degrees, minutes, seconds = components
+    if not (0.0 <= minutes < 60.0 and 0.0 <= seconds < 60.0):
+        return math.nan
+    value = abs(degrees) + minutes / 60.0 + seconds / 3600.0
+    if math.isnan(value) or value > _LIMITS[axis]:
+        return math.nan
+    if degrees < 0 or _is_negative_ref(ref, axis):
+        return -value
+    return value
+
+
+def _is_negative_ref(ref: object, axis: str) -> bool:
+    if ref == _NEGATIVE_REFS[axis]:
+        return True
+    if ref == _POSITIVE_REFS[axis]:
+        return False
+    return normalize_ref(ref) == _NEGATIVE_REFS[axis]
+
+
+def _field(gps_info: Mapping[object, object], name: str, tag_id: int) -> object:
+    value = gps_info.get(name)
+    return gps_info.get(tag_id) if value is None else value
+
+
+def axis_fields(gps_info: Mapping[object, object], axis: str) -> Tuple[object, object]:
+    value_name, value_id, ref_name, ref_id = _KEYS[axis]
+    return _field(gps_info, value_name, value_id), _field(gps_info, ref_name, ref_id)
+
+
+def _is_mapping(value: object) -> bool:
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def gps_to_decimal(gps_info: Mapping[object, object]) -> Optional[Tuple[float, float]]:
+    if not _is_mapping(gps_info):
+        return None
+    lat_value, lat_ref = axis_fields(gps_info, LATITUDE)
+    lat = components_to_degrees(dms_components(lat_value), lat_ref, LATITUDE)
+    if math.isnan(lat):
+        return None
+    lon_value, lon_ref = axis_fields(gps_info, LONGITUDE)
+    lon = components_to_degrees(dms_components(lon_value), lon_ref, LONGITUDE)
+    if math.isnan(lon):
+        return None
+    if lat == 0.0 and lon == 0.0:
+        return None
+    return lat, lon
+
+
+def _negative_refs(refs: Sequence[object], axis: str) -> np.ndarray:
+    column = np.empty(len(refs), dtype=object)
+    for index, ref in enumerate(refs):
+        column[index] = ref
+    negative_ref = _NEGATIVE_REFS[axis]
+    negative = column == negative_ref
+    positive = column == _POSITIVE_REFS[axis]
+    irregular = np.flatnonzero(~(negative | positive))
+    for index in irregular:
+        negative[index] = normalize_ref(column[index]) == negative_ref
+    return negative
+
+
+def degrees_array(components: np.ndarray, refs: Sequence[object], axis: str) -> np.ndarray:
+    parts = np.asarray(components, dtype=float).reshape(-1, 3)
+    values = np.abs(parts[:, 0]) + parts[:, 1:] @ _WEIGHTS[1:]
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (parts[:, 1] >= 0.0)
+            & (parts[:, 1] < 60.0)
+            & (parts[:, 2] >= 0.0)
+            & (parts[:, 2] < 60.0)
+            & (values <= _LIMITS[axis])
+        )
+        negative = (parts[:, 0] < 0) | _negative_refs(refs, axis)
+    return np.where(valid, np.where(negative, -values, values), np.nan)
+
+
+def _is_numeric_tuple(value: object) -> bool:
+    if type(value) is not tuple or not value:
+        return False
+    return type(value[0]) in (tuple, int, float)
+
+
+def components_array(values: Sequence[object]) -> np.ndarray:
+    if len(values) and _is_numeric_tuple(values[0]):
+        try:
+            raw = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            raw = None
+        if raw is not None and raw.shape == (len(values), 3, 2):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(raw[:, :, 1] != 0, raw[:, :, 0] / raw[:, :, 1], np.nan)
+        if raw is not None and raw.shape == (len(values), 3):
+            return raw
+    return np.array([dms_components(value) for value in values], dtype=float).reshape(-1, 3)
+
+
+def _column(gps_infos: Sequence[Mapping[object, object]], name: str, tag_id: int) -> List[object]:
+    values = [info.get(name) for info in gps_infos]
+    for index in [index for index, value in enumerate(values) if value is None]:
+        values[index] = gps_infos[index].get(tag_id)
+    return values
+
+
+def mask_invalid_pairs(lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    invalid = np.isnan(lat) | np.isnan(lon) | ((lat == 0.0) & (lon == 0.0))
+    return np.where(invalid, np.nan, lat), np.where(invalid, np.nan, lon)
+
+
+def decode_batch(gps_infos: Sequence[Mapping[object, object]]) -> Tuple[np.ndarray, np.ndarray]:
+    infos = [info if _is_mapping(info) else {} for info in gps_infos]
+    decoded = []
+    for axis in (LATITUDE, LONGITUDE):
+        value_name, value_id, ref_name, ref_id = _KEYS[axis]
+        components = components_array(_column(infos, value_name, value_id))
+        decoded.append(degrees_array(components, _column(infos, ref_name, ref_id), axis))
+    return mask_invalid_pairs(decoded[0], decoded[1])
@@ -0,0 +1,137 @@
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class Instrumentation:
+    @contextmanager
+    def span(self, name: str, **attributes: object) -> Iterator[Dict[str, object]]:
+        start_wall = time.time()
+        start = time.perf_counter()
+        try:
+            yield attributes
+        except BaseException as exc:
+            attributes.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, start_wall=start_wall, **attributes)
+
+    def record(self, name: str, duration: float, start_wall: Optional[float] = None, **attributes: object) -> None:
+        pass
+
+
+class InMemoryInstrumentation(Instrumentation):
+    def __init__(self, max_samples: int = 1000) -> None:
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, object]] = {}
+
+    def record(self, name: str, duration: float, start_wall: Optional[float] = None, **attributes: object) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = {
+                    "count": 0,
+                    "total": 0.0,
+                    "min": math.inf,
+                    "max": 0.0,
+                    "errors": 0,
+                    "samples": deque(maxlen=self.max_samples),
+                }
+                self._stats[name] = stats
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["min"] = min(stats["min"], duration)
+            stats["max"] = max(stats["max"], duration)
+            if "error" in attributes:
+                stats["errors"] += 1
+            stats["samples"].append(duration)
+
+    @staticmethod
+    def _percentile(ordered: List[float], pct: float) -> float:
+        if not ordered:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> List[Dict[str, object]]:
+        rows = []
+        with self._lock:
+            items = [(name, dict(stats), sorted(stats["samples"])) for name, stats in self._stats.items()]
+        for name, stats, ordered in sorted(items):
+            rows.append(
+                {
+                    "span": name,
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "total_ms": stats["total"] * 1000,
+                    "mean_ms": stats["total"] / stats["count"] * 1000,
+                    "min_ms": stats["min"] * 1000,
+                    "p50_ms": self._percentile(ordered, 50) * 1000,
+                    "p95_ms": self._percentile(ordered, 95) * 1000,
+                    "max_ms": stats["max"] * 1000,
+                }
+            )
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def write_prometheus(self, path: str, prefix: str = "osint") -> None:
+        lines = [
+            f"# HELP {prefix}_span_seconds Time spent in each OSINTCore phase.",
+            f"# TYPE {prefix}_span_seconds summary",
+        ]
+        for row in self.summary():
+            label = '{span="%s"}' % row["span"]
+            quantile_label = '{span="%s",quantile="%s"}'
+            lines.append(f"{prefix}_span_seconds{quantile_label % (row['span'], '0.5')} {row['p50_ms'] / 1000:.6f}")
+            lines.append(f"{prefix}_span_seconds{quantile_label % (row['span'], '0.95')} {row['p95_ms'] / 1000:.6f}")
+            lines.append(f"{prefix}_span_seconds_sum{label} {row['total_ms'] / 1000:.6f}")
+            lines.append(f"{prefix}_span_seconds_count{label} {row['count']}")
+            lines.append(f"{prefix}_span_errors_total{label} {row['errors']}")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+
+class JsonlSpanExporter(Instrumentation):
+    def __init__(self, path: str, service_name: str = "osint_app") -> None:
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def record(self, name: str, duration: float, start_wall: Optional[float] = None, **attributes: object) -> None:
+        start_wall = start_wall if start_wall is not None else time.time() - duration
+        start_ns = int(start_wall * 1e9)
+        span = {
+            "name": name,
+            "span_id": uuid.uuid4().hex[:16],
+            "start_time_unix_nano": start_ns,
+            "end_time_unix_nano": start_ns + int(duration * 1e9),
+            "duration_ms": duration * 1000,
+            "status": "ERROR" if "error" in attributes else "OK",
+            "resource": {"service.name": self.service_name},
+            "attributes": {key: value for key, value in attributes.items()},
+        }
+        line = json.dumps(span, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+
+class CompositeInstrumentation(Instrumentation):
+    def __init__(self, *sinks: Instrumentation) -> None:
+        self.sinks = sinks
+
+    def record(self, name: str, duration: float, start_wall: Optional[float] = None, **attributes: object) -> None:
+        for sink in self.sinks:
+            sink.record(name, duration, start_wall=start_wall, **attributes)
@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
+
+import requests
+
+from osint_core import DDG_HTML_URL, DORK_TEMPLATES, OSINTCore
+from rate_limiter import RateLimiter
+from retry_scheduler import RetryExhausted, RetryScheduler
+from search_cache import SearchCache
+
+
+def read_targets(lines: Iterable[str]) -> List[str]:
+    targets: List[str] = []
+    seen: Set[str] = set()
+    for line in lines:
+        target = line.strip()
+        if not target or target.startswith("#") or target in seen:
+            continue
+        seen.add(target)
+        targets.append(target)
+    return targets
+
+
+class Checkpoint:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.completed: Set[Tuple[str, str]] = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                        self.completed.add((entry["target"], entry["type"]))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        self._handle = open(path, "a", encoding="utf-8")
+
+    def is_done(self, target: str, dork_type: str) -> bool:
+        return (target, dork_type) in self.completed
+
+    def mark(self, target: str, dork_type: str) -> None:
+        self.completed.add((target, dork_type))
+        self._handle.write(json.dumps({"target": target, "type": dork_type}, ensure_ascii=False) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def run_batch(
+    core: OSINTCore,
+    targets: List[str],
+    output: TextIO,
+    dork_types: Optional[List[str]] = None,
+    max_results: int = 20,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Dict[str, int]:
+    counts = {"queries": 0, "skipped": 0, "urls": 0, "empty": 0, "deferred": 0, "failed": 0}
+    scheduler = core.retry_scheduler
+
+    def run_query(target: str, dork_type: str, query: str) -> None:
+        task = (target, dork_type, query)
+        try:
+            urls = core.search_web(query, max_results=max_results, strict=True)
+        except RetryExhausted as exc:
+            if scheduler.defer(exc.key, task, exc.ready_at):
+                counts["deferred"] += 1
+            else:
+                counts["failed"] += 1
+            return
+        except requests.RequestException:
+            scheduler.forget(task)
+            counts["failed"] += 1
+            return
+        scheduler.forget(task)
+        record = {
+            "target": target,
+            "type": dork_type,
+            "query": query,
+            "urls": urls,
+            "fetched_at": time.time(),
+        }
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        if checkpoint is not None:
+            checkpoint.mark(target, dork_type)
+        counts["queries"] += 1
+        counts["urls"] += len(urls)
+        if not urls:
+            counts["empty"] += 1
+
+    for target in targets:
+        for dork_type, query in core._dork_queries(target, dork_types):
+            if checkpoint is not None and checkpoint.is_done(target, dork_type):
+                counts["skipped"] += 1
+                continue
+            run_query(target, dork_type, query)
+    while scheduler.pending():
+        for task in scheduler.wait_ready():
+            run_query(*task)
+    return counts
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run OSINTCore dorks for a file of targets and emit JSON Lines.")
+    parser.add_argument("targets", help="file with one target per line, or - for stdin")
+    parser.add_argument("--dork", action="append", choices=list(DORK_TEMPLATES), help="dork type (repeatable)")
+    parser.add_argument("--max-results", type=int, default=20)
+    parser.add_argument("-o", "--output", default="-", help="JSONL destination (default stdout)")
+    parser.add_argument("--checkpoint", default=None, help="record completed queries here and skip them on restart")
+    parser.add_argument("--min-interval", type=float, default=3.0, help="seconds between requests per host")
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--max-attempts", type=int, default=3, help="tries per query before it is deferred")
+    parser.add_argument("--max-deferrals", type=int, default=3, help="times a query is requeued before it is dropped")
+    parser.add_argument("--cache", default=None, help="SQLite search cache path")
+    parser.add_argument("--cache-ttl", type=float, default=3600.0)
+    parser.add_argument("--search-url", default=DDG_HTML_URL)
+    parser.add_argument("--parser", default="auto")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.targets == "-":
+        targets = read_targets(sys.stdin)
+    else:
+        with open(args.targets, "r", encoding="utf-8") as handle:
+            targets = read_targets(handle)
+    cache = SearchCache(path=args.cache, ttl=args.cache_ttl) if args.cache else None
+    core = OSINTCore(
+        cache=cache,
+        rate_limiter=RateLimiter(min_interval=args.min_interval, burst=args.burst),
+        search_url=args.search_url,
+        parser=args.parser,
+        retry_scheduler=RetryScheduler(max_attempts=args.max_attempts, max_deferrals=args.max_deferrals),
+    )
+    checkpoint = Checkpoint(args.checkpoint) if args.checkpoint else None
+    output = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+    status = 0
+    counts: Dict[str, int] = {}
+    try:
+        counts = run_batch(core, targets, output, args.dork, args.max_results, checkpoint)
+    except KeyboardInterrupt:
+        status = 130
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if checkpoint is not None:
+            checkpoint.close()
+        core.close()
+        if cache is not None:
+            cache.close()
+    if counts:
+        summary = ", ".join(f"{key}={value}" for key, value in counts.items())
+        print(f"{len(targets)} targets: {summary}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
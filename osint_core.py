@@ -1,20 +1,68 @@
 import json
+import logging
 import random
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 from urllib.parse import parse_qs, unquote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 
 try:
     import instaloader
 except ImportError:  # pragma: no cover
     instaloader = None  # type: ignore[assignment]
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:  # pragma: no cover
-    BeautifulSoup = None  # type: ignore[assignment,misc]
+import ddg_parser
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from instrumentation import Instrumentation
+from profile_cache import ProfileCache
+from rate_limiter import RateLimiter
+from retry_scheduler import (
+    PERMANENT,
+    TRANSIENT,
+    TRANSIENT_STATUSES,
+    RetryExhausted,
+    RetryScheduler,
+    TransientError,
+    classify,
+    parse_retry_after,
+)
+from search_cache import SearchCache
+
+logger = logging.getLogger(__name__)
+
+DDG_HTML_URL = "https://duckduckgo.com/html/"
+INSTAGRAM_HOST = "www.instagram.com"
+INSTAGRAM_RATE_LIMIT_COOLDOWN = 300.0
+DEGRADED_PAGE_COOLDOWN = 120.0
+ADAPTER_RETRY_AFTER_MAX = 5.0
+PROFILE_PAUSE_MESSAGES = {
+    "circuit_open": "Instagram is failing repeatedly; lookups paused for {retry_after} s.",
+    "rate_limited": "Rate limited by Instagram (429). Try again in {retry_after} s.",
+}
+
+DORK_TEMPLATES = {
+    "Fotos e Imagens": '"{target}" (filetype:jpg OR filetype:png OR filetype:jpeg)',
+    "Perfis em Redes Sociais": '"{target}" site:facebook.com OR site:twitter.com OR site:linkedin.com OR site:instagram.com',
+    "Fotos em Redes Sociais": '"{target}" (foto OR photo OR profile) site:facebook.com OR site:instagram.com',
+    "Mencoes Publicas": '"{target}" intext:"tagged" OR intext:"mentioned"',
+}
+
+
+class CappedRetry(Retry):
+    """Adapter retry policy that gives up when Retry-After exceeds ADAPTER_RETRY_AFTER_MAX."""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > ADAPTER_RETRY_AFTER_MAX:
+                reason = ResponseError(f"Retry-After of {retry_after:.0f} s exceeds the adapter cap")
+                raise MaxRetryError(_pool, url, reason)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
 
 
 class OSINTCore:
@@ -23,9 +71,35 @@ class OSINTCore:
         delay_range: tuple = (3, 7),
         user_agents: Optional[List[str]] = None,
         request_timeout: int = 15,
+        cache: Optional[SearchCache] = None,
+        pool_maxsize: int = 10,
+        max_retries: int = 2,
+        rate_limiter: Optional[RateLimiter] = None,
+        parser: str = "auto",
+        search_url: str = DDG_HTML_URL,
+        instrumentation: Optional[Instrumentation] = None,
+        profile_loader_factory: Optional[Callable[[], Any]] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        retry_scheduler: Optional[RetryScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
+        self.search_url = search_url
+        self.instrumentation = instrumentation or Instrumentation()
+        ddg_parser.resolve_backend(parser)
+        self.parser = parser
         self.delay_range = delay_range
+        self.rate_limiter = rate_limiter or RateLimiter(min_interval=delay_range[0])
         self.request_timeout = request_timeout
+        self.cache = cache
+        self.profile_cache = profile_cache
+        self.session = self._build_session(pool_maxsize, max_retries, search_url)
+        self.retry_scheduler = retry_scheduler or RetryScheduler(max_attempts=max_retries + 1)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.page_counts: Dict[str, int] = dict.fromkeys(ddg_parser.PAGE_KINDS, 0)
+        self._page_counts_lock = threading.Lock()
+        self.profile_loader_factory = profile_loader_factory
+        self._profile_loader: Optional[Any] = None
+        self._profile_lock = threading.RLock()
         self.user_agents = user_agents or [
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -33,9 +107,88 @@ class OSINTCore:
             "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0",
         ]
 
-    def _sleep_random(self) -> None:
-        delay = random.uniform(self.delay_range[0], self.delay_range[1])
-        time.sleep(delay)
+    @staticmethod
+    def _build_session(pool_maxsize: int, max_retries: int, search_url: str) -> requests.Session:
+        retry = CappedRetry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=TRANSIENT_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        search_adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount(search_url, search_adapter)
+        return session
+
+    def pool_stats(self) -> List[Dict[str, object]]:
+        stats: List[Dict[str, object]] = []
+        adapters = {id(a): a for a in self.session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats.append(
+                    {
+                        "scheme": pool.scheme,
+                        "host": pool.host,
+                        "port": pool.port,
+                        "connections_opened": pool.num_connections,
+                        "requests": pool.num_requests,
+                        "idle_connections": pool.pool.qsize() if pool.pool else 0,
+                    }
+                )
+        return stats
+
+    def _connections_opened(self) -> int:
+        return sum(int(stats["connections_opened"]) for stats in self.pool_stats())
+
+    def _default_profile_loader(self) -> Any:
+        return instaloader.Instaloader(
+            max_connection_attempts=1,
+            request_timeout=self.request_timeout,
+        )
+
+    def profile_loader(self) -> Any:
+        with self._profile_lock:
+            if self._profile_loader is None:
+                with self.instrumentation.span("profile.loader_init"):
+                    factory = self.profile_loader_factory or self._default_profile_loader
+                    self._profile_loader = factory()
+            return self._profile_loader
+
+    def close_profile_loader(self) -> None:
+        with self._profile_lock:
+            loader, self._profile_loader = self._profile_loader, None
+        if loader is not None:
+            loader.close()
+
+    def close(self) -> None:
+        self.close_profile_loader()
+        self.session.close()
+
+    def __enter__(self) -> "OSINTCore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _throttle(self, url: str) -> float:
+        return self.rate_limiter.acquire(RateLimiter.host_of(url))
 
     def _get_headers(self) -> Dict[str, str]:
         return {
@@ -53,52 +206,128 @@ class OSINTCore:
             return unquote(params["uddg"][0])
         return href
 
-    def search_web(self, query: str, max_results: int = 20) -> List[str]:
-        if BeautifulSoup is None:
-            return []
-        url = "https://duckduckgo.com/html/"
+    def _iter_results(self, html: str, max_results: int) -> Iterator[str]:
+        if max_results <= 0:
+            return
+        count = 0
+        for href in ddg_parser.iter_result_hrefs(html, self.parser):
+            yield self._extract_ddg_url(href)
+            count += 1
+            if count >= max_results:
+                break
+
+    def _parse_results(self, html: str, max_results: int) -> List[str]:
+        return list(self._iter_results(html, max_results))
+
+    @staticmethod
+    def _dork_queries(target: str, dork_types: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        selected = dork_types or list(DORK_TEMPLATES.keys())
+        queries: List[Tuple[str, str]] = []
+        for dork_type in selected:
+            template = DORK_TEMPLATES.get(dork_type)
+            if not template:
+                continue
+            queries.append((dork_type, template.format(target=target)))
+        return queries
+
+    def _count_page(self, kind: str) -> None:
+        with self._page_counts_lock:
+            self.page_counts[kind] += 1
+        if kind == ddg_parser.UNKNOWN:
+            logger.warning("unrecognised search page layout from %s", self.search_url)
+
+    def _fetch_search_page(self, params: Dict[str, str]) -> Tuple[str, str]:
+        with self.circuit_breaker.guard(RateLimiter.host_of(self.search_url), self._is_upstream_failure):
+            with self.instrumentation.span("search.throttle") as span:
+                span["wait"] = self._throttle(self.search_url)
+            connections_before = self._connections_opened()
+            with self.instrumentation.span("search.request") as span:
+                response = self.session.get(
+                    self.search_url,
+                    params=params,
+                    headers=self._get_headers(),
+                    timeout=self.request_timeout,
+                    stream=True,
+                )
+                span["status"] = response.status_code
+                span["new_connection"] = self._connections_opened() > connections_before
+                if not response.ok:
+                    response.close()
+                if response.status_code in TRANSIENT_STATUSES:
+                    raise TransientError(
+                        f"{response.status_code} from {self.search_url}",
+                        status=response.status_code,
+                        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                response.raise_for_status()
+            with self.instrumentation.span("search.download") as span:
+                html = response.text
+                kind = ddg_parser.classify_page(html, response.status_code, self.parser)
+                span["bytes"] = len(html)
+                span["page"] = kind
+            self._count_page(kind)
+            if kind == ddg_parser.DEGRADED:
+                raise TransientError(
+                    f"degraded page from {self.search_url}",
+                    status=response.status_code,
+                    retry_after=DEGRADED_PAGE_COOLDOWN,
+                )
+        return html, kind
+
+    @staticmethod
+    def _is_upstream_failure(error: BaseException) -> bool:
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code == 403 or error.response.status_code in TRANSIENT_STATUSES
+        return classify(error) == TRANSIENT
+
+    def iter_search_web(self, query: str, max_results: int = 20, strict: bool = False) -> Iterator[str]:
+        if not ddg_parser.is_available(self.parser):
+            return
+        if self.cache is not None:
+            with self.instrumentation.span("search.cache_lookup") as span:
+                cached = self.cache.get(query, max_results)
+                span["hit"] = cached is not None
+            if cached is not None:
+                yield from cached
+                return
         params = {"q": query}
-        self._sleep_random()
+        host = RateLimiter.host_of(self.search_url)
         try:
-            response = requests.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=self.request_timeout,
-            )
-            response.raise_for_status()
-        except requests.RequestException:
-            return []
-        soup = BeautifulSoup(response.text, "html.parser")
+            html, kind = self.retry_scheduler.call(host, lambda: self._fetch_search_page(params))
+        except (RetryExhausted, requests.RequestException):
+            if strict:
+                raise
+            return
         results: List[str] = []
-        for link in soup.select("a.result__a"):
-            href = link.get("href")
-            if not href:
-                continue
-            results.append(self._extract_ddg_url(href))
-            if len(results) >= max_results:
+        parse_time = 0.0
+        parsed = self._iter_results(html, max_results) if kind == ddg_parser.RESULTS else iter(())
+        while True:
+            started = time.perf_counter()
+            url = next(parsed, None)
+            parse_time += time.perf_counter() - started
+            if url is None:
                 break
-        return results
+            results.append(url)
+            yield url
+        self.instrumentation.record("search.parse", parse_time, results=len(results), page=kind)
+        if self.cache is not None and kind != ddg_parser.UNKNOWN:
+            self.cache.set(query, max_results, results)
+
+    def search_web(self, query: str, max_results: int = 20, strict: bool = False) -> List[str]:
+        return list(self.iter_search_web(query, max_results=max_results, strict=strict))
+
+    def iter_dorks(
+        self, target: str, dork_types: Optional[List[str]] = None, max_results: int = 20
+    ) -> Iterator[Dict[str, object]]:
+        for dork_type, query in self._dork_queries(target, dork_types):
+            urls = self.search_web(query, max_results=max_results)
+            yield {"type": dork_type, "query": query, "urls": urls}
 
     def advanced_google_hacking(
         self, target: str, dork_types: Optional[List[str]] = None, max_results: int = 20
     ) -> Dict[str, List[Dict[str, object]]]:
-        dorks = {
-            "Fotos e Imagens": '"{target}" (filetype:jpg OR filetype:png OR filetype:jpeg)',
-            "Perfis em Redes Sociais": '"{target}" site:facebook.com OR site:twitter.com OR site:linkedin.com OR site:instagram.com',
-            "Fotos em Redes Sociais": '"{target}" (foto OR photo OR profile) site:facebook.com OR site:instagram.com',
-            "Mencoes Publicas": '"{target}" intext:"tagged" OR intext:"mentioned"',
-        }
-        selected = dork_types or list(dorks.keys())
-        results: List[Dict[str, object]] = []
-        for dork_type in selected:
-            template = dorks.get(dork_type)
-            if not template:
-                continue
-            query = template.format(target=target)
-            urls = self.search_web(query, max_results=max_results)
-            results.append({"type": dork_type, "query": query, "urls": urls})
-        return {"target": target, "dorks": results}
+        dorks = list(self.iter_dorks(target, dork_types, max_results=max_results))
+        return {"target": target, "dorks": dorks}
 
     def image_dork(self, target: str, max_results: int = 24) -> Dict[str, object]:
         query = '"{target}" (filetype:jpg OR filetype:png OR filetype:jpeg)'.format(
@@ -108,31 +337,103 @@ class OSINTCore:
         image_urls = [u for u in urls if u.lower().endswith((".jpg", ".jpeg", ".png"))]
         return {"target": target, "query": query, "urls": image_urls}
 
-    def get_profile_metadata(self, username: str) -> Dict[str, object]:
+    def get_profile_metadata(self, username: str, force_refresh: bool = False) -> Dict[str, object]:
         if instaloader is None:
             return {"username": username, "error": "instaloader is not installed"}
-        loader = instaloader.Instaloader(
-            max_connection_attempts=1,
-            request_timeout=self.request_timeout,
+        if self.profile_cache is not None and not force_refresh:
+            with self.instrumentation.span("profile.cache_lookup") as span:
+                cached = self.profile_cache.get(username)
+                if cached is not None and "retry_at" in cached:
+                    cached = self._refresh_pause(cached)
+                span["hit"] = cached is not None
+            if cached is not None:
+                return cached
+        profile = self._lookup_profile(username)
+        if self.profile_cache is not None:
+            self.profile_cache.set(username, profile)
+        return profile
+
+    @staticmethod
+    def _paused_profile(username: str, reason: str, retry_after: float, error: str = "") -> Dict[str, object]:
+        retry_after = round(retry_after)
+        template = PROFILE_PAUSE_MESSAGES.get(reason)
+        profile: Dict[str, object] = {
+            "username": username,
+            "error": template.format(retry_after=retry_after) if template else error,
+            "reason": reason,
+            "retry_after": retry_after,
+        }
+        if retry_after > 0:
+            profile["retry_at"] = time.time() + retry_after
+        return profile
+
+    @classmethod
+    def _refresh_pause(cls, profile: Dict[str, object]) -> Optional[Dict[str, object]]:
+        retry_after = float(profile["retry_at"]) - time.time()
+        if round(retry_after) <= 0:
+            return None
+        refreshed = cls._paused_profile(
+            str(profile["username"]), str(profile.get("reason", "")), retry_after, str(profile["error"])
         )
-        try:
-            profile = instaloader.Profile.from_username(loader.context, username)
-            return {
-                "username": profile.username,
-                "bio": profile.biography or "",
-                "followers": profile.followers,
-                "following": profile.followees,
-                "id": profile.userid,
-                "profile_pic_url": profile.profile_pic_url,
-                "is_private": profile.is_private,
-            }
-        except instaloader.TooManyRequestsException:
-            return {
-                "username": username,
-                "error": "Rate limited by Instagram (429). Try again in a few minutes.",
-            }
-        except Exception as exc:  # pragma: no cover - runtime dependent
-            return {"username": username, "error": str(exc)}
+        refreshed["retry_at"] = profile["retry_at"]
+        return refreshed
+
+    @staticmethod
+    def _classify_profile_error(error: BaseException) -> str:
+        if isinstance(error, instaloader.QueryReturnedNotFoundException):
+            return PERMANENT
+        if isinstance(error, instaloader.ConnectionException):
+            return TRANSIENT
+        return classify(error)
+
+    @classmethod
+    def _is_profile_failure(cls, error: BaseException) -> bool:
+        return cls._classify_profile_error(error) == TRANSIENT
+
+    def _fetch_profile(self, username: str) -> Dict[str, object]:
+        with self.circuit_breaker.guard(INSTAGRAM_HOST, self._is_profile_failure):
+            try:
+                with self._profile_lock:
+                    profile = instaloader.Profile.from_username(self.profile_loader().context, username)
+                    return {
+                        "username": profile.username,
+                        "bio": profile.biography or "",
+                        "followers": profile.followers,
+                        "following": profile.followees,
+                        "id": profile.userid,
+                        "profile_pic_url": profile.profile_pic_url,
+                        "is_private": profile.is_private,
+                    }
+            except instaloader.ConnectionException as exc:
+                if isinstance(exc, instaloader.TooManyRequestsException) or isinstance(
+                    exc.__cause__, instaloader.TooManyRequestsException
+                ):
+                    raise TransientError(str(exc), status=429, retry_after=INSTAGRAM_RATE_LIMIT_COOLDOWN) from exc
+                raise
+
+    def _lookup_profile(self, username: str) -> Dict[str, object]:
+        with self.instrumentation.span("profile.lookup") as span:
+            try:
+                profile = self.retry_scheduler.call(
+                    INSTAGRAM_HOST,
+                    lambda: self._fetch_profile(username),
+                    self._classify_profile_error,
+                )
+                span["status"] = "ok"
+                return profile
+            except CircuitOpenError:
+                span["error"] = "circuit_open"
+                return self._paused_profile(username, "circuit_open", self.circuit_breaker.retry_in(INSTAGRAM_HOST))
+            except RetryExhausted as exc:
+                retry_after = self.retry_scheduler.cooldown_remaining(INSTAGRAM_HOST)
+                if exc.status == 429 or exc.last_error is None:
+                    span["error"] = "rate_limited"
+                    return self._paused_profile(username, "rate_limited", retry_after)
+                span["error"] = "unavailable"
+                return self._paused_profile(username, "unavailable", retry_after, str(exc.last_error))
+            except Exception as exc:  # pragma: no cover - runtime dependent
+                span["error"] = type(exc).__name__
+                return {"username": username, "error": str(exc)}
 
     def private_sniffer(self, username: str, max_results: int = 20) -> Dict[str, object]:
         query = (
@@ -142,9 +443,9 @@ class OSINTCore:
         return {"username": username, "query": query, "urls": urls}
 
     def monitor_followers(
-        self, username: str, previous_followers: int
+        self, username: str, previous_followers: int, force_refresh: bool = False
     ) -> Dict[str, object]:
-        profile = self.get_profile_metadata(username)
+        profile = self.get_profile_metadata(username, force_refresh=force_refresh)
         if "error" in profile:
             return {
                 "username": username,
@@ -165,3 +466,32 @@ class OSINTCore:
     @staticmethod
     def to_json(data: Dict[str, object]) -> str:
         return json.dumps(data, ensure_ascii=True, indent=2)
+
+    @staticmethod
+    def iter_json(data: Dict[str, object], indent: int = 2) -> Iterator[str]:
+        encoder = json.JSONEncoder(ensure_ascii=True, indent=indent)
+        if not isinstance(data, dict) or not data:
+            yield from encoder.iterencode(data)
+            return
+        pad = " " * indent
+        separator = "{"
+        for key, value in data.items():
+            yield f"{separator}\n{pad}{encoder.encode(str(key))}: "
+            separator = ","
+            if isinstance(value, (str, bytes, list, tuple, dict)) or not isinstance(value, Iterable):
+                for chunk in encoder.iterencode(value):
+                    yield chunk.replace("\n", "\n" + pad)
+                continue
+            opened = False
+            for item in value:
+                yield ("," if opened else "[") + "\n" + pad * 2
+                opened = True
+                for chunk in encoder.iterencode(item):
+                    yield chunk.replace("\n", "\n" + pad * 2)
+            yield f"\n{pad}]" if opened else "[]"
+        yield "\n}"
+
+    @classmethod
+    def write_json(cls, data: Dict[str, object], handle: TextIO, indent: int = 2) -> None:
+        for chunk in cls.iter_json(data, indent):
+            handle.write(chunk)
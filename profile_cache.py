@@ -0,0 +1,44 @@
+import time
+from typing import Callable, Dict, Optional
+
+from sqlite_cache import SQLiteCache
+
+
+class ProfileCache(SQLiteCache):
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: float = 900.0,
+        error_ttl: float = 120.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(path, "profile_cache", ttl, max_entries, clock)
+        self.error_ttl = error_ttl
+        self.negative_hits = 0
+
+    @staticmethod
+    def make_key(username: str) -> str:
+        return username.strip().lstrip("@").casefold()
+
+    def _record_hit(self, value: object) -> None:
+        if isinstance(value, dict) and "error" in value:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+
+    def get(self, username: str) -> Optional[Dict[str, object]]:
+        return self._fetch(self.make_key(username))
+
+    def set(self, username: str, profile: Dict[str, object]) -> None:
+        self._store(self.make_key(username), profile, self.error_ttl if "error" in profile else self.ttl)
+
+    def invalidate(self, username: str) -> None:
+        self._delete(self.make_key(username))
+
+    def stats(self) -> Dict[str, float]:
+        stats = super().stats()
+        lookups = self.hits + self.negative_hits + self.misses
+        stats["negative_hits"] = self.negative_hits
+        stats["hit_rate"] = (self.hits + self.negative_hits) / lookups if lookups else 0.0
+        return stats
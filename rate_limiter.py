@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        min_interval: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.min_interval = max(0.0, float(min_interval))
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.total_wait = 0.0
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower() or url
+
+    def reserve(self, host: str) -> float:
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._buckets.get(host, (float(self.burst), now))
+            if self.min_interval > 0:
+                tokens = min(float(self.burst), tokens + (now - updated) / self.min_interval)
+            else:
+                tokens = float(self.burst)
+            tokens -= 1
+            self._buckets[host] = (tokens, now)
+            wait = -tokens * self.min_interval if tokens < 0 else 0.0
+            self.acquisitions += 1
+            self.total_wait += wait
+        return wait
+
+    def acquire(self, host: str) -> float:
+        wait = self.reserve(host)
+        if wait > 0:
+            (self._sleep or time.sleep)(wait)
+        return wait
+
+    async def acquire_async(self, host: str) -> float:
+        wait = self.reserve(host)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "acquisitions": self.acquisitions,
+            "total_wait": self.total_wait,
+            "hosts": len(self._buckets),
+        }
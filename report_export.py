@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime, timezone
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Dict, Iterable, Iterator, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+from results_store import COLUMNS
+
+Chunk = Dict[str, list]
+
+CSV_COLUMNS = ("tipo", "url", "source", "query", "timestamp")
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+MIME_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def available_formats() -> List[str]:
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or pq is not None]
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def iter_csv(chunks: Iterable[Chunk]) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_COLUMNS)
+    for chunk in chunks:
+        kinds = [dork_type or source for source, dork_type in zip(chunk["source"], chunk["dork_type"])]
+        timestamps = [_isoformat(value) for value in chunk["timestamp"]]
+        writer.writerows(zip(kinds, chunk["url"], chunk["source"], chunk["query"], timestamps))
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def iter_jsonl(chunks: Iterable[Chunk]) -> Iterator[str]:
+    for chunk in chunks:
+        lines = []
+        for source, dork_type, query, url, timestamp in zip(
+            chunk["source"], chunk["dork_type"], chunk["query"], chunk["url"], chunk["timestamp"]
+        ):
+            row = {
+                "source": source,
+                "dork_type": dork_type,
+                "query": query,
+                "url": url,
+                "timestamp": _isoformat(timestamp),
+            }
+            lines.append(json.dumps(row, ensure_ascii=False) + "\n")
+        yield "".join(lines)
+
+
+def write_parquet(chunks: Iterable[Chunk], handle: BinaryIO) -> int:
+    if pq is None:
+        raise RuntimeError("pyarrow is not installed")
+    schema = pa.schema(
+        [
+            ("source", pa.string()),
+            ("dork_type", pa.string()),
+            ("query", pa.string()),
+            ("url", pa.string()),
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    rows = 0
+    with pq.ParquetWriter(handle, schema) as writer:
+        for chunk in chunks:
+            micros = [int(value * 1_000_000) for value in chunk["timestamp"]]
+            batch = pa.record_batch(
+                [pa.array(chunk[name], type=pa.string()) for name in COLUMNS[:-1]]
+                + [pa.array(micros, type=pa.timestamp("us", tz="UTC"))],
+                schema=schema,
+            )
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def write_report(chunks: Iterable[Chunk], fmt: str, handle: BinaryIO) -> None:
+    if fmt == "parquet":
+        write_parquet(chunks, handle)
+        return
+    if fmt == "csv":
+        pieces = iter_csv(chunks)
+    elif fmt == "jsonl":
+        pieces = iter_jsonl(chunks)
+    else:
+        raise ValueError(f"unknown export format: {fmt}")
+    for piece in pieces:
+        handle.write(piece.encode("utf-8"))
+
+
+def export_report(chunks: Iterable[Chunk], fmt: str, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    with NamedTemporaryFile(
+        mode="wb", dir=directory, prefix="osint_results_", suffix=f".{fmt}", delete=False
+    ) as handle:
+        try:
+            write_report(chunks, fmt, handle)
+        except Exception:
+            handle.close()
+            os.remove(handle.name)
+            raise
+    return handle.name
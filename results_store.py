@@ -0,0 +1,207 @@
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ("source", "dork_type", "query", "url", "timestamp")
+
+T = TypeVar("T")
+
+
+class ResultRecord:
+    __slots__ = COLUMNS
+
+    def __init__(self, source: str, dork_type: str, query: str, url: str, timestamp: float) -> None:
+        self.source = source
+        self.dork_type = dork_type
+        self.query = query
+        self.url = url
+        self.timestamp = timestamp
+
+    def as_dict(self) -> Dict[str, object]:
+        return {column: getattr(self, column) for column in COLUMNS}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResultRecord):
+            return NotImplemented
+        return all(getattr(self, column) == getattr(other, column) for column in COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"ResultRecord({self.source!r}, {self.dork_type!r}, {self.query!r}, {self.url!r}, {self.timestamp!r})"
+
+
+class ResultsStore:
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._labels: List[str] = []
+        self._label_codes: Dict[str, int] = {}
+        self._reset_columns()
+        self.version = 0
+        self._views: Dict[str, Tuple[int, object]] = {}
+        self.view_builds: Dict[str, int] = {}
+
+    def _reset_columns(self) -> None:
+        self._sources = array("I")
+        self._dork_types = array("I")
+        self._queries = array("I")
+        self._urls: List[str] = []
+        self._timestamps = array("d")
+
+    def _code(self, label: str) -> int:
+        code = self._label_codes.get(label)
+        if code is None:
+            code = len(self._labels)
+            self._labels.append(label)
+            self._label_codes[label] = code
+        return code
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def extend(
+        self,
+        source: str,
+        urls: Iterable[str],
+        dork_type: str = "",
+        query: str = "",
+        timestamp: Optional[float] = None,
+    ) -> int:
+        urls = list(urls)
+        if not urls:
+            return 0
+        timestamp = self._clock() if timestamp is None else timestamp
+        with self._lock:
+            count = len(urls)
+            self._sources.extend([self._code(source)] * count)
+            self._dork_types.extend([self._code(dork_type)] * count)
+            self._queries.extend([self._code(query)] * count)
+            self._timestamps.extend([timestamp] * count)
+            self._urls.extend(urls)
+            self.version += 1
+        return count
+
+    def append(
+        self,
+        source: str,
+        url: str,
+        dork_type: str = "",
+        query: str = "",
+        timestamp: Optional[float] = None,
+    ) -> None:
+        self.extend(source, [url], dork_type, query, timestamp)
+
+    def add_dork(self, entry: Dict[str, object], source: str = "google_dorks") -> int:
+        return self.extend(source, entry.get("urls", []), entry.get("type", ""), entry.get("query", ""))
+
+    def remove_source(self, source: str) -> int:
+        with self._lock:
+            code = self._label_codes.get(source)
+            if code is None or code not in self._sources:
+                return 0
+            keep = [index for index, value in enumerate(self._sources) if value != code]
+            removed = len(self._urls) - len(keep)
+            sources, dork_types, queries = self._sources, self._dork_types, self._queries
+            urls, timestamps = self._urls, self._timestamps
+            self._reset_columns()
+            self._sources.extend(sources[index] for index in keep)
+            self._dork_types.extend(dork_types[index] for index in keep)
+            self._queries.extend(queries[index] for index in keep)
+            self._urls.extend(urls[index] for index in keep)
+            self._timestamps.extend(timestamps[index] for index in keep)
+            self.version += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset_columns()
+            self.version += 1
+
+    def record(self, index: int) -> ResultRecord:
+        labels = self._labels
+        return ResultRecord(
+            labels[self._sources[index]],
+            labels[self._dork_types[index]],
+            labels[self._queries[index]],
+            self._urls[index],
+            self._timestamps[index],
+        )
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def iter_chunks(self, chunk_rows: int = 1000) -> Iterator[Dict[str, list]]:
+        start = 0
+        while True:
+            with self._lock:
+                end = min(start + chunk_rows, len(self._urls))
+                if start >= end:
+                    return
+                labels = self._labels
+                chunk = {
+                    "source": [labels[code] for code in self._sources[start:end]],
+                    "dork_type": [labels[code] for code in self._dork_types[start:end]],
+                    "query": [labels[code] for code in self._queries[start:end]],
+                    "url": self._urls[start:end],
+                    "timestamp": self._timestamps[start:end].tolist(),
+                }
+            yield chunk
+            start = end
+
+    def urls(self, source: Optional[str] = None) -> List[str]:
+        with self._lock:
+            if source is None:
+                return list(self._urls)
+            code = self._label_codes.get(source)
+            return [url for value, url in zip(self._sources, self._urls) if value == code]
+
+    def has_source(self, source: str) -> bool:
+        code = self._label_codes.get(source)
+        return code is not None and code in self._sources
+
+    def dork_results(self, source: str = "google_dorks") -> Dict[str, object]:
+        code = self._label_codes.get(source)
+        dorks: Dict[tuple, Dict[str, object]] = {}
+        for index, value in enumerate(self._sources):
+            if value != code:
+                continue
+            key = (self._dork_types[index], self._queries[index])
+            entry = dorks.get(key)
+            if entry is None:
+                entry = {"type": self._labels[key[0]], "query": self._labels[key[1]], "urls": []}
+                dorks[key] = entry
+            entry["urls"].append(self._urls[index])
+        return {"dorks": list(dorks.values())}
+
+    def view(self, name: str, builder: Callable[["ResultsStore"], T]) -> T:
+        with self._lock:
+            cached = self._views.get(name)
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            value = builder(self)
+            self._views[name] = (self.version, value)
+            self.view_builds[name] = self.view_builds.get(name, 0) + 1
+        return value
+
+    @property
+    def frame_builds(self) -> int:
+        return self.view_builds.get("frame", 0)
+
+    def _build_frame(self) -> pd.DataFrame:
+        labels = np.array(self._labels, dtype=object)
+        return pd.DataFrame(
+            {
+                "source": labels[np.array(self._sources, dtype=np.intp)],
+                "dork_type": labels[np.array(self._dork_types, dtype=np.intp)],
+                "query": labels[np.array(self._queries, dtype=np.intp)],
+                "url": np.array(self._urls, dtype=object),
+                "timestamp": pd.to_datetime(np.array(self._timestamps), unit="s", utc=True),
+            }
+        )
+
+    def frame(self) -> pd.DataFrame:
+        return self.view("frame", ResultsStore._build_frame)
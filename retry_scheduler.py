@@ -0,0 +1,277 @@
+import asyncio
+import heapq
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+TRANSIENT = "transient"
+PERMANENT = "permanent"
+TRANSIENT_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+Classifier = Callable[[BaseException], str]
+
+
+class TransientError(Exception):
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RetryExhausted(Exception):
+    def __init__(self, key: str, attempts: int, last_error: Optional[BaseException], ready_at: float) -> None:
+        super().__init__(f"{key} unavailable after {attempts} attempt(s): {last_error}")
+        self.key = key
+        self.attempts = attempts
+        self.last_error = last_error
+        self.ready_at = ready_at
+
+    @property
+    def status(self) -> Optional[int]:
+        return getattr(self.last_error, "status", None)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if when is None:
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = when.timestamp() - (time.time() if now is None else now)
+    if seconds != seconds:
+        return None
+    return max(0.0, seconds)
+
+
+def classify(error: BaseException) -> str:
+    if isinstance(error, TransientError):
+        return TRANSIENT
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        if response is not None and response.status_code in TRANSIENT_STATUSES:
+            return TRANSIENT
+        return PERMANENT
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return TRANSIENT
+    return PERMANENT
+
+
+class RetryScheduler:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_cooldown: float = 600.0,
+        max_deferrals: int = 3,
+        classifier: Classifier = classify,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_cooldown = max_cooldown
+        self.max_deferrals = max_deferrals
+        self._classifier = classifier
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._cooldowns: Dict[str, float] = {}
+        self._queue: List[Tuple[float, int, str, Hashable]] = []
+        self._queued: Set[Hashable] = set()
+        self._deferrals: Dict[Hashable, int] = {}
+        self._sequence = 0
+        self.attempts = 0
+        self.retries = 0
+        self.successes = 0
+        self.transient_failures = 0
+        self.permanent_failures = 0
+        self.exhausted = 0
+        self.fast_failures = 0
+        self.deferred = 0
+        self.dropped = 0
+        self.backoff_time = 0.0
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = ceiling * self._rng()
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_cooldown))
+        return delay
+
+    def cooldown_remaining(self, key: str) -> float:
+        with self._lock:
+            until = self._cooldowns.get(key)
+        if until is None:
+            return 0.0
+        return max(0.0, until - self._clock())
+
+    def cooldowns(self) -> Dict[str, float]:
+        now = self._clock()
+        with self._lock:
+            return {key: until - now for key, until in self._cooldowns.items() if until > now}
+
+    def _cool_down(self, key: str, delay: float) -> float:
+        with self._lock:
+            until = max(self._cooldowns.get(key, 0.0), self._clock() + delay)
+            self._cooldowns[key] = until
+        return until
+
+    def _before_attempt(self, key: str) -> float:
+        remaining = self.cooldown_remaining(key)
+        if remaining > self.max_delay:
+            with self._lock:
+                self.fast_failures += 1
+            raise RetryExhausted(key, 0, None, self._clock() + remaining)
+        with self._lock:
+            self.attempts += 1
+            self.backoff_time += remaining
+        return remaining
+
+    def _after_failure(self, key: str, attempt: int, error: Exception, classifier: Optional[Classifier]) -> None:
+        if isinstance(error, RetryExhausted):
+            raise error
+        if (classifier or self._classifier)(error) != TRANSIENT:
+            with self._lock:
+                self.permanent_failures += 1
+            raise error
+        retry_after = getattr(error, "retry_after", None)
+        until = self._cool_down(key, self.backoff(attempt, retry_after))
+        with self._lock:
+            self.transient_failures += 1
+            if attempt + 1 < self.max_attempts and (retry_after or 0.0) <= self.max_delay:
+                self.retries += 1
+                return
+            self.exhausted += 1
+        raise RetryExhausted(key, attempt + 1, error, until) from error
+
+    def _succeeded(self) -> None:
+        with self._lock:
+            self.successes += 1
+
+    def call(self, key: str, fn: Callable[[], T], classifier: Optional[Classifier] = None) -> T:
+        attempt = 0
+        while True:
+            wait = self._before_attempt(key)
+            if wait > 0:
+                (self._sleep or time.sleep)(wait)
+            try:
+                result = fn()
+            except Exception as exc:
+                self._after_failure(key, attempt, exc, classifier)
+                attempt += 1
+                continue
+            self._succeeded()
+            return result
+
+    async def call_async(
+        self, key: str, fn: Callable[[], Awaitable[T]], classifier: Optional[Classifier] = None
+    ) -> T:
+        attempt = 0
+        while True:
+            wait = self._before_attempt(key)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                result = await fn()
+            except Exception as exc:
+                self._after_failure(key, attempt, exc, classifier)
+                attempt += 1
+                continue
+            self._succeeded()
+            return result
+
+    def defer(self, key: str, task: Hashable, ready_at: Optional[float] = None) -> bool:
+        with self._lock:
+            count = self._deferrals.get(task, 0) + 1
+            if count > self.max_deferrals:
+                self._deferrals.pop(task, None)
+                self.dropped += 1
+                return False
+            self._deferrals[task] = count
+            if ready_at is None:
+                ready_at = max(self._clock(), self._cooldowns.get(key, 0.0))
+            if task not in self._queued:
+                self._sequence += 1
+                heapq.heappush(self._queue, (ready_at, self._sequence, key, task))
+                self._queued.add(task)
+            self.deferred += 1
+        return True
+
+    def forget(self, task: Hashable) -> None:
+        with self._lock:
+            self._deferrals.pop(task, None)
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def is_deferred(self, task: Hashable) -> bool:
+        return task in self._queued
+
+    def _next_ready_at(self) -> Optional[float]:
+        with self._lock:
+            return self._queue[0][0] if self._queue else None
+
+    def next_ready_in(self) -> Optional[float]:
+        ready_at = self._next_ready_at()
+        if ready_at is None:
+            return None
+        return max(0.0, ready_at - self._clock())
+
+    def pop_ready(self, now: Optional[float] = None) -> List[Hashable]:
+        now = self._clock() if now is None else now
+        ready: List[Hashable] = []
+        with self._lock:
+            while self._queue and self._queue[0][0] <= now:
+                _, _, _, task = heapq.heappop(self._queue)
+                self._queued.discard(task)
+                ready.append(task)
+        return ready
+
+    def wait_ready(self) -> List[Hashable]:
+        ready_at = self._next_ready_at()
+        if ready_at is None:
+            return []
+        delay = ready_at - self._clock()
+        if delay > 0:
+            (self._sleep or time.sleep)(delay)
+            with self._lock:
+                self.backoff_time += delay
+        return self.pop_ready(max(self._clock(), ready_at))
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "successes": self.successes,
+                "transient_failures": self.transient_failures,
+                "permanent_failures": self.permanent_failures,
+                "exhausted": self.exhausted,
+                "fast_failures": self.fast_failures,
+                "deferred": self.deferred,
+                "dropped": self.dropped,
+                "pending": len(self._queue),
+                "backoff_time": self.backoff_time,
+            }
@@ -0,0 +1,26 @@
+import time
+from typing import Callable, List, Optional
+
+from sqlite_cache import SQLiteCache
+
+
+class SearchCache(SQLiteCache):
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: float = 3600.0,
+        max_entries: int = 512,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(path, "search_cache", ttl, max_entries, clock)
+
+    @staticmethod
+    def make_key(query: str, max_results: int) -> str:
+        normalized = " ".join(query.split()).casefold()
+        return f"{max_results}:{normalized}"
+
+    def get(self, query: str, max_results: int) -> Optional[List[str]]:
+        return self._fetch(self.make_key(query, max_results))
+
+    def set(self, query: str, max_results: int, urls: List[str]) -> None:
+        self._store(self.make_key(query, max_results), urls, self.ttl)
@@ -1,9 +1,34 @@
 import io
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+import requests
 
-from app import build_link_table, extract_exif, extract_image_urls_from_dorks, fetch_image, gps_to_decimal
+from app import (
+    build_link_table,
+    extract_exif,
+    extract_image_urls_from_dorks,
+    fetch_image,
+    fetch_images,
+    gps_to_decimal,
+    build_probe_table,
+    image_urls_from_store,
+    iter_fetch_images,
+    link_table,
+    probe_image,
+    probe_images,
+    report_download,
+)
+from benchmarks.standin_server import StandInServer
+from blob_store import BlobStore
+from circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from image_cache import ImageCache, ProbeCache
+from instrumentation import InMemoryInstrumentation
+from osint_core import OSINTCore
+from results_store import ResultsStore
 
 
 class TestBuildLinkTable:
@@ -33,6 +58,48 @@ class TestBuildLinkTable:
         assert len(df) == 3
 
 
+class TestMemoizedViews:
+    def _store(self):
+        store = ResultsStore()
+        store.add_dork({"type": "Fotos e Imagens", "query": "q", "urls": ["https://a.com/1.jpg", "https://a.com/2"]})
+        return store
+
+    def test_link_table_rebuilt_only_when_results_change(self):
+        store = self._store()
+        for _ in range(5):
+            table = link_table(store)
+        assert store.view_builds["link_table"] == 1
+        assert len(table) == 2
+
+        store.add_dork({"type": "Mencoes Publicas", "query": "q2", "urls": ["https://b.com"]})
+        for _ in range(5):
+            table = link_table(store)
+        assert store.view_builds["link_table"] == 2
+        assert store.frame_builds == 2
+        assert list(table["Tipo da Dork"]) == ["Fotos e Imagens", "Fotos e Imagens", "Mencoes Publicas"]
+
+    def test_link_table_matches_dict_builder(self):
+        store = self._store()
+        store.append("instagram_collab", "https://ig.com/p/1")
+        expected = build_link_table(store.dork_results())
+        assert link_table(store).to_dict("records") == expected.to_dict("records")
+
+    def test_image_urls_rebuilt_only_when_results_change(self):
+        store = self._store()
+        store.add_dork({"type": "Fotos em Redes Sociais", "query": "q3", "urls": ["https://c.com/X.PNG"]})
+        assert image_urls_from_store(store) == ["https://a.com/1.jpg", "https://c.com/X.PNG"]
+        assert image_urls_from_store(store) == extract_image_urls_from_dorks(store.dork_results())
+        assert store.view_builds["image_urls"] == 1
+        store.remove_source("google_dorks")
+        assert image_urls_from_store(store) == []
+        assert store.view_builds["image_urls"] == 2
+
+    def test_empty_store_views(self):
+        store = ResultsStore()
+        assert link_table(store).empty
+        assert image_urls_from_store(store) == []
+
+
 class TestFetchImage:
     @patch("app.requests.get")
     def test_success(self, mock_get):
@@ -56,12 +123,306 @@ class TestFetchImage:
         assert status == "forbidden"
         assert data == b""
 
+    def test_cache_hit_skips_network(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"\xff\xd8"
+        cache = ImageCache()
+
+        first = fetch_image("https://img.com/a.jpg", {}, session, cache)
+        second = fetch_image("https://img.com/a.jpg", {}, session, cache)
+        assert first == second == (b"\xff\xd8", "ok")
+        assert session.get.call_count == 1
+
+    def test_emits_image_spans(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"1234"
+        metrics = InMemoryInstrumentation()
+
+        fetch_image("https://img.com/a.jpg", {}, session, ImageCache(), metrics)
+        fetch_image("https://img.com/a.jpg", {}, session, ImageCache(), metrics)
+        counts = {row["span"]: row["count"] for row in metrics.summary()}
+        assert counts == {"image.cache_lookup": 2, "image.request": 2, "image.download": 2}
+
+    def test_failed_fetch_not_cached(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 403
+        cache = ImageCache()
+
+        fetch_image("https://img.com/a.jpg", {}, session, cache)
+        assert len(cache) == 0
+
+    def test_routes_through_session(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"\xff\xd8"
+
+        data, status = fetch_image("https://img.com/a.jpg", {"User-Agent": "x"}, session)
+        assert status == "ok"
+        assert data == b"\xff\xd8"
+        session.get.assert_called_once_with(
+            "https://img.com/a.jpg", headers={"User-Agent": "x"}, timeout=12, stream=True
+        )
+
+    def test_writes_through_blob_store(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"\xff\xd8blob"
+        store = BlobStore(str(tmp_path))
+
+        cache = ImageCache()
+
+        fetch_image("https://img.com/a.jpg", {}, session, store=store)
+        data, status = fetch_image("https://img.com/a.jpg", {}, session, cache, store=store)
+        assert status == "ok"
+        assert data == b"\xff\xd8blob"
+        assert type(cache.get("https://img.com/a.jpg")) is bytes
+        assert session.get.call_count == 1
+        assert store.stats()["hits"] == 1
+
+    def test_forbidden_not_stored(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value.status_code = 403
+        store = BlobStore(str(tmp_path))
+
+        fetch_image("https://img.com/a.jpg", {}, session, store=store)
+        assert len(store) == 0
+
     @patch("app.requests.get", side_effect=Exception("timeout"))
     def test_error(self, mock_get):
         data, status = fetch_image("https://img.com/a.png", {})
         assert status == "error"
         assert data == b""
 
+    def test_open_circuit_skips_failing_host(self):
+        session = MagicMock()
+        session.get.side_effect = requests.ConnectionError("reset")
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        statuses = [fetch_image(f"https://img.com/{name}.jpg", {}, session, breaker=breaker)[1] for name in "abc"]
+        assert statuses == ["error", "error", "unavailable"]
+        assert session.get.call_count == 2
+        assert breaker.state("img.com") == OPEN
+        session.get.side_effect = None
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"ok"
+        assert fetch_image("https://other.com/a.jpg", {}, session, breaker=breaker)[1] == "ok"
+
+    def test_forbidden_does_not_trip_circuit(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 403
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        fetch_image("https://img.com/a.jpg", {}, session, breaker=breaker)
+        assert breaker.state("img.com") == CLOSED
+
+    def test_failed_body_read_records_one_failure(self):
+        response = MagicMock(status_code=200)
+        type(response).content = PropertyMock(side_effect=requests.exceptions.ChunkedEncodingError("cut"))
+        session = MagicMock()
+        session.get.return_value = response
+        breaker = MagicMock()
+        breaker.allow.return_value = True
+
+        assert fetch_image("https://img.com/a.jpg", {}, session, breaker=breaker) == (b"", "error")
+        breaker.record_failure.assert_called_once_with("img.com")
+        breaker.record_success.assert_not_called()
+        response.close.assert_called_once()
+
+    def test_success_recorded_after_body_read(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"ok"
+        breaker = MagicMock()
+        breaker.allow.return_value = True
+
+        assert fetch_image("https://img.com/a.jpg", {}, session, breaker=breaker) == (b"ok", "ok")
+        breaker.record_success.assert_called_once_with("img.com")
+        breaker.record_failure.assert_not_called()
+
+    def test_transient_status_records_failure(self):
+        session = MagicMock()
+        session.get.return_value.status_code = 503
+        session.get.return_value.raise_for_status.side_effect = requests.HTTPError(response=session.get.return_value)
+        breaker = MagicMock()
+        breaker.allow.return_value = True
+
+        assert fetch_image("https://img.com/a.jpg", {}, session, breaker=breaker)[1] == "error"
+        breaker.record_failure.assert_called_once_with("img.com")
+        breaker.record_success.assert_not_called()
+
+    @pytest.mark.parametrize("retry_after, expected_hits, budget", [("600", 1, 1.0), ("0", 3, 5.0)])
+    def test_retry_after_beyond_cap_is_not_retried(self, retry_after, expected_hits, budget):
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", retry_after)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/a.jpg"
+        try:
+            with OSINTCore(max_retries=2) as core:
+                start = time.monotonic()
+                assert fetch_image(url, {}, core.session) == (b"", "error")
+                elapsed = time.monotonic() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(hits) == expected_hits
+        assert elapsed < budget
+
+
+class TestFetchImages:
+    @patch("app.fetch_image")
+    def test_returns_results_in_input_order(self, mock_fetch):
+        def fake_fetch(url, headers, session=None, cache=None, instrumentation=None, store=None, breaker=None):
+            time.sleep(0.05 if url.endswith("slow.jpg") else 0)
+            return url.encode(), "ok"
+
+        mock_fetch.side_effect = fake_fetch
+        urls = ["https://a.com/slow.jpg", "https://b.com/fast.jpg", "https://c.com/x.jpg"]
+        results = fetch_images(urls, {})
+        assert [data for data, _ in results] == [u.encode() for u in urls]
+
+    @patch("app.fetch_image")
+    def test_yields_as_each_image_arrives(self, mock_fetch):
+        def fake_fetch(url, headers, session=None, cache=None, instrumentation=None, store=None, breaker=None):
+            time.sleep(0.2 if url.endswith("slow.jpg") else 0)
+            return b"x", "ok"
+
+        mock_fetch.side_effect = fake_fetch
+        urls = ["https://a.com/slow.jpg", "https://b.com/fast.jpg"]
+        order = [idx for idx, _, _ in iter_fetch_images(urls, {}, max_workers=2)]
+        assert order == [1, 0]
+
+    @patch("app.fetch_image")
+    def test_per_host_concurrency_cap(self, mock_fetch):
+        active = {"count": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def fake_fetch(url, headers, session=None, cache=None, instrumentation=None, store=None, breaker=None):
+            with lock:
+                active["count"] += 1
+                active["peak"] = max(active["peak"], active["count"])
+            time.sleep(0.02)
+            with lock:
+                active["count"] -= 1
+            return b"x", "ok"
+
+        mock_fetch.side_effect = fake_fetch
+        urls = [f"https://same.com/{i}.jpg" for i in range(8)]
+        results = fetch_images(urls, {}, max_workers=8, per_host=2)
+        assert len(results) == 8
+        assert active["peak"] <= 2
+
+
+class TestProbeImage:
+    def test_range_request_reads_only_header(self):
+        with StandInServer() as server:
+            url = f"{server.url}/images/large.jpg"
+            probe = probe_image(url, {}, requests.Session(), probe_bytes=4096)
+            full_size = len(server.images["large.jpg"][1])
+        assert probe["status"] == "ok"
+        assert probe["content_type"] == "image/jpeg"
+        assert probe["size"] == full_size
+        assert probe["bytes_read"] <= 4096
+        assert probe["exif_status"] == "found"
+        assert probe["metadata"]["Make"] == "Canon"
+        assert "GPSInfo" in probe["metadata"]
+
+    def test_streams_and_stops_when_ranges_unsupported(self):
+        with StandInServer(support_ranges=False) as server:
+            probe = probe_image(f"{server.url}/images/large.jpg", {}, requests.Session())
+            full_size = len(server.images["large.jpg"][1])
+        assert probe["exif_status"] == "found"
+        assert probe["bytes_read"] < full_size
+        assert probe["metadata"]["Model"] == "EOS 80D"
+
+    def test_falls_back_to_stream_when_prefix_too_short(self):
+        with StandInServer() as server:
+            probe = probe_image(f"{server.url}/images/exif.jpg", {}, requests.Session(), probe_bytes=16)
+        assert probe["exif_status"] == "found"
+        assert probe["metadata"]["Make"] == "Canon"
+
+    def test_image_without_exif(self):
+        with StandInServer() as server:
+            probe = probe_image(f"{server.url}/images/plain.png", {}, requests.Session())
+        assert probe["status"] == "ok"
+        assert probe["exif_status"] == "absent"
+        assert probe["metadata"] == {}
+
+    def test_cached_probe_skips_network(self):
+        cache = ProbeCache()
+        with StandInServer() as server:
+            urls = [f"{server.url}/images/exif.jpg", f"{server.url}/images/plain.png"]
+            first = probe_images(urls, {}, requests.Session(), probe_cache=cache)
+            hits = dict(server.counters)
+            second = probe_images(urls, {}, requests.Session(), probe_cache=cache)
+            assert dict(server.counters) == hits
+        assert second == first
+        assert cache.hits == 2
+
+    def test_reads_bytes_already_held_locally(self, tmp_path):
+        with StandInServer() as server:
+            url = f"{server.url}/images/exif.jpg"
+            data = server.images["exif.jpg"][1]
+        store = BlobStore(str(tmp_path))
+        store.put(url, data)
+        session = MagicMock()
+        probe = probe_image(url, {}, session, cache=ImageCache(), store=store)
+        session.head.assert_not_called()
+        session.get.assert_not_called()
+        assert probe["status"] == "ok"
+        assert probe["content_type"] == "image/jpeg"
+        assert probe["size"] == len(data)
+        assert probe["bytes_read"] == 0
+        assert probe["metadata"]["Make"] == "Canon"
+
+    def test_failed_probe_not_cached(self):
+        cache = ProbeCache()
+        session = MagicMock()
+        session.head.return_value.status_code = 403
+        probe_image("https://img.com/a.jpg", {}, session, probe_cache=cache)
+        assert len(cache) == 0
+
+    def test_forbidden(self):
+        session = MagicMock()
+        session.head.return_value.status_code = 403
+        probe = probe_image("https://img.com/a.jpg", {}, session)
+        assert probe["status"] == "forbidden"
+        session.get.assert_not_called()
+
+    def test_probe_table(self):
+        table = build_probe_table(
+            [
+                {
+                    "url": "https://a.com/x.jpg",
+                    "status": "ok",
+                    "size": 2048,
+                    "bytes_read": 512,
+                    "metadata": {
+                        "Make": "Canon",
+                        "GPSInfo": {"GPSLatitude": ((1, 1), (0, 1), (0, 1)), "GPSLongitude": ((2, 1), (0, 1), (0, 1))},
+                    },
+                },
+                {"url": "https://b.com/y.jpg", "status": "error", "metadata": {}},
+            ]
+        )
+        assert table.iloc[0]["Camera"] == "Canon"
+        assert table.iloc[0]["GPS"] == "https://maps.google.com/?q=1.0,2.0"
+        assert table.iloc[0]["Tamanho (KB)"] == 2.0
+        assert table.iloc[1]["GPS"] == ""
+
 
 class TestExtractExif:
     def test_empty_bytes(self):
@@ -75,6 +436,18 @@ class TestExtractExif:
         result = extract_exif(buf.getvalue())
         assert result == {}
 
+    def test_gps_ifd_is_resolved(self):
+        from PIL import Image
+
+        exif = Image.Exif()
+        exif[271] = "Canon"
+        exif[0x8825] = {1: "N", 2: (40.0, 26.0, 46.0)}
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, format="JPEG", exif=exif)
+        result = extract_exif(buf.getvalue())
+        assert result["Make"] == "Canon"
+        assert result["GPSInfo"]["GPSLatitudeRef"] == "N"
+
 
 class TestGpsToDecimal:
     def test_north_east(self):
@@ -156,3 +529,16 @@ class TestExtractImageUrlsFromDorks:
         }
         result = extract_image_urls_from_dorks(data)
         assert result == ["https://a.com/x.jpg", "https://c.com/z.png"]
+
+
+class TestReportDownload:
+    def test_builds_report_on_call_and_removes_file(self, tmp_path):
+        store = ResultsStore()
+        store.add_dork({"type": "Fotos e Imagens", "query": "q", "urls": ["https://a.com/1.jpg"]})
+        build = report_download(store, "csv", str(tmp_path))
+        assert list(tmp_path.iterdir()) == []
+
+        data = build()
+        assert data.decode().splitlines()[0].startswith("tipo,url")
+        assert "https://a.com/1.jpg" in data.decode()
+        assert list(tmp_path.iterdir()) == []
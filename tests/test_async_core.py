@@ -0,0 +1,145 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from async_core import AsyncOSINTCore
+from retry_scheduler import RetryScheduler
+from search_cache import SearchCache
+
+
+def _ddg_page(query: str) -> str:
+    return (
+        "<html><body>"
+        f'<a class="result__a" href="https://example.com/{len(query)}/1">1</a>'
+        f'<a class="result__a" href="https://example.com/{len(query)}/2">2</a>'
+        "</body></html>"
+    )
+
+
+def _client(latency: float = 0.0, status: int = 200, calls: list = None) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if calls is not None:
+            calls.append((time.monotonic(), request.url.params.get("q")))
+        await asyncio.sleep(latency)
+        return httpx.Response(status, text=_ddg_page(request.url.params.get("q", "")))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestAsyncSearchWeb:
+    def test_parses_results(self):
+        async def run():
+            async with AsyncOSINTCore(delay_range=(0, 0), client=_client()) as core:
+                return await core.async_search_web("query", max_results=1)
+
+        assert asyncio.run(run()) == ["https://example.com/5/1"]
+
+    def test_http_error_returns_empty(self):
+        calls = []
+
+        async def run():
+            scheduler = RetryScheduler(max_attempts=2, base_delay=0)
+            client = _client(status=503, calls=calls)
+            async with AsyncOSINTCore(delay_range=(0, 0), client=client, retry_scheduler=scheduler) as core:
+                return await core.async_search_web("query")
+
+        assert asyncio.run(run()) == []
+        assert len(calls) == 2
+
+    def test_permanent_error_is_not_retried(self):
+        calls = []
+
+        async def run():
+            async with AsyncOSINTCore(delay_range=(0, 0), client=_client(status=404, calls=calls)) as core:
+                return await core.async_search_web("query")
+
+        assert asyncio.run(run()) == []
+        assert len(calls) == 1
+
+    def test_aclose_releases_sync_resources(self):
+        loader = MagicMock()
+
+        async def run():
+            core = AsyncOSINTCore(delay_range=(0, 0), client=_client(), profile_loader_factory=lambda: loader)
+            core.profile_loader()
+            with patch.object(core.session, "close") as close_session:
+                async with core:
+                    pass
+            return core, close_session
+
+        core, close_session = asyncio.run(run())
+        close_session.assert_called_once()
+        loader.close.assert_called_once()
+        assert core._profile_loader is None
+
+    def test_cache_hit_skips_request(self):
+        calls = []
+
+        async def run():
+            core = AsyncOSINTCore(delay_range=(0, 0), client=_client(calls=calls), cache=SearchCache())
+            await core.async_search_web("query")
+            return await core.async_search_web("query")
+
+        assert len(asyncio.run(run())) == 2
+        assert len(calls) == 1
+
+
+class TestAsyncAdvancedGoogleHacking:
+    def test_runs_all_dorks_in_order(self):
+        async def run():
+            core = AsyncOSINTCore(delay_range=(0, 0), client=_client())
+            return await core.async_advanced_google_hacking("johndoe")
+
+        result = asyncio.run(run())
+        assert result["target"] == "johndoe"
+        assert [d["type"] for d in result["dorks"]] == [
+            "Fotos e Imagens",
+            "Perfis em Redes Sociais",
+            "Fotos em Redes Sociais",
+            "Mencoes Publicas",
+        ]
+        assert all("johndoe" in d["query"] for d in result["dorks"])
+        assert all(len(d["urls"]) == 2 for d in result["dorks"])
+
+    def test_requests_are_spaced_by_host_rate_limit(self):
+        calls = []
+
+        async def run():
+            core = AsyncOSINTCore(delay_range=(0.05, 0.1), client=_client(calls=calls))
+            await core.async_advanced_google_hacking("johndoe")
+
+        asyncio.run(run())
+        starts = sorted(t for t, _ in calls)
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert len(gaps) == 3
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_latency_overlaps_with_rate_limit_wait(self):
+        async def run():
+            core = AsyncOSINTCore(delay_range=(0.05, 0.05), client=_client(latency=0.2))
+            started = time.monotonic()
+            await core.async_advanced_google_hacking("johndoe")
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(run())
+        assert elapsed < 4 * (0.05 + 0.2)
+
+
+class TestAsyncIterDorks:
+    def test_yields_entries_in_completion_order(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            query = request.url.params.get("q", "")
+            await asyncio.sleep(0.2 if "filetype" in query else 0)
+            return httpx.Response(200, text=_ddg_page(query))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            core = AsyncOSINTCore(delay_range=(0, 0), client=client)
+            return [
+                entry["type"]
+                async for entry in core.aiter_dorks("johndoe", ["Fotos e Imagens", "Mencoes Publicas"])
+            ]
+
+        assert asyncio.run(run()) == ["Mencoes Publicas", "Fotos e Imagens"]
@@ -0,0 +1,81 @@
+import requests
+
+from app import extract_exif, fetch_image
+from benchmarks.run import _populated_store, _synthetic_dork_results, build_scenarios, measure, percentile
+from benchmarks.standin_server import StandInServer
+from osint_core import OSINTCore
+from rate_limiter import RateLimiter
+
+
+class TestStandInServer:
+    def test_serves_ddg_page_parsed_by_core(self):
+        with StandInServer() as server:
+            core = OSINTCore(search_url=f"{server.url}/html/", rate_limiter=RateLimiter(0))
+            assert len(core.search_web("johndoe", max_results=30)) == 30
+            assert core.search_web("noresults here") == []
+            assert server.counters["search"] == 2
+            assert core.page_counts == {"results": 1, "empty": 1, "degraded": 0, "unknown": 0}
+
+    def test_serves_block_page(self):
+        with StandInServer() as server:
+            core = OSINTCore(search_url=f"{server.url}/html/", rate_limiter=RateLimiter(0))
+            assert core.search_web("blocked query") == []
+            assert core.search_web("johndoe") == []
+            assert server.counters["search"] == 1
+            assert core.page_counts["degraded"] == 1
+
+    def test_serves_images_with_and_without_exif(self):
+        with StandInServer() as server:
+            session = requests.Session()
+            with_exif, status = fetch_image(f"{server.url}/images/exif.jpg", {}, session)
+            assert status == "ok"
+            assert extract_exif(with_exif)["Make"] == "Canon"
+            plain, status = fetch_image(f"{server.url}/images/plain.png", {}, session)
+            assert status == "ok"
+            assert extract_exif(plain) == {}
+            _, status = fetch_image(f"{server.url}/images/missing.jpg", {}, session)
+            assert status == "error"
+
+    def test_serves_profile_json(self):
+        with StandInServer() as server:
+            payload = requests.get(
+                f"{server.url}/api/v1/users/web_profile_info/?username=alice_private", timeout=5
+            ).json()
+        assert payload["data"]["user"]["username"] == "alice_private"
+        assert payload["data"]["user"]["is_private"] is True
+
+    def test_error_injection(self):
+        with StandInServer(error_rate=1.0, error_status=429) as server:
+            response = requests.get(f"{server.url}/html/?q=x", timeout=5)
+        assert response.status_code == 429
+        assert server.counters["error"] == 1
+
+
+class TestMeasure:
+    def test_percentile_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99) == 99
+        assert percentile([], 50) == 0.0
+
+    def test_measure_counts_errors(self):
+        def flaky(i):
+            if i % 2:
+                raise RuntimeError("boom")
+
+        report = measure("flaky", flaky, iterations=10, warmup=0)
+        assert report["iterations"] == 10
+        assert report["errors"] == 5
+        assert report["throughput_per_s"] > 0
+        assert report["p50_ms"] <= report["p95_ms"] <= report["p99_ms"]
+
+
+class TestScenarios:
+    def test_link_table_scenario_uses_memoized_store_view(self):
+        with StandInServer() as server:
+            scenarios = build_scenarios(server, min_interval=0.0)
+            first = scenarios["link_table"](0)
+            assert scenarios["link_table"](1) is first
+        assert len(first) == len(_populated_store(_synthetic_dork_results()))
+        assert len(scenarios["link_table_cold"](0)) == len(first)
@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+from blob_store import BlobStore
+
+
+class TestBlobStore:
+    def test_miss_then_hit(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        assert store.get("https://a.com/1.jpg") is None
+        store.put("https://a.com/1.jpg", b"abc")
+        data = store.get("https://a.com/1.jpg")
+        assert data == b"abc"
+        assert store.hits == 1
+        assert store.misses == 1
+
+    def test_content_addressed_layout(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        digest = store.put("https://a.com/1.jpg", b"abc")
+        assert digest == BlobStore.digest_of(b"abc")
+        assert os.path.isfile(os.path.join(str(tmp_path), digest[:2], digest))
+
+    def test_identical_payloads_are_stored_once(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        first = store.put("https://a.com/1.jpg", b"same")
+        second = store.put("https://mirror.com/copy.jpg", b"same")
+        assert first == second
+        stats = store.stats()
+        assert stats["urls"] == 2
+        assert stats["blobs"] == 1
+        assert stats["bytes"] == 4
+        assert stats["writes"] == 1
+        assert stats["dedup_hits"] == 1
+
+    def test_url_repointed_to_new_content(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        store.put("https://a.com/1.jpg", b"old")
+        store.put("https://a.com/1.jpg", b"new")
+        assert store.get("https://a.com/1.jpg") == b"new"
+        assert len(store) == 1
+
+    def test_index_survives_reopen(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        store.put("https://a.com/1.jpg", b"persisted")
+        store.close()
+        reopened = BlobStore(str(tmp_path))
+        assert "https://a.com/1.jpg" in reopened
+        assert reopened.get("https://a.com/1.jpg") == b"persisted"
+
+    def test_missing_file_is_a_miss(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        digest = store.put("https://a.com/1.jpg", b"gone")
+        os.remove(store.path_for(digest))
+        assert "https://a.com/1.jpg" not in store
+        assert store.get("https://a.com/1.jpg") is None
+
+    def test_empty_payload(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        store.put("https://a.com/empty", b"")
+        assert store.get("https://a.com/empty") == b""
+
+    def test_entries_list_urls_with_blob_paths(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        digest = store.put("https://a.com/1.jpg", b"abc")
+        store.put("https://b.com/2.jpg", b"abc")
+        entries = store.entries()
+        assert [url for url, _ in entries] == ["https://a.com/1.jpg", "https://b.com/2.jpg"]
+        assert {path for _, path in entries} == {store.path_for(digest)}
+
+    def test_open_yields_view_released_on_exit(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        store.put("https://a.com/1.jpg", b"mapped")
+        with store.open("https://a.com/1.jpg") as view:
+            assert isinstance(view, memoryview)
+            assert bytes(view[:3]) == b"map"
+        with pytest.raises(ValueError):
+            view.tobytes()
+        assert store.hits == 1
+
+    def test_open_miss_yields_none(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        with store.open("https://a.com/1.jpg") as view:
+            assert view is None
+        assert store.misses == 1
+
+    def test_max_bytes_evicts_oldest_blobs(self, tmp_path, clock):
+        store = BlobStore(str(tmp_path), max_bytes=8, clock=clock)
+        first = store.put("https://a.com/1.jpg", b"aaaa")
+        clock.now += 1
+        store.put("https://a.com/2.jpg", b"bbbb")
+        clock.now += 1
+        store.put("https://a.com/3.jpg", b"cccc")
+        assert "https://a.com/1.jpg" not in store
+        assert not os.path.exists(store.path_for(first))
+        assert store.get("https://a.com/3.jpg") == b"cccc"
+        stats = store.stats()
+        assert stats["bytes"] == 8
+        assert stats["evictions"] == 1
+
+    def test_rewritten_blob_counts_as_recent(self, tmp_path, clock):
+        store = BlobStore(str(tmp_path), max_bytes=8, clock=clock)
+        store.put("https://a.com/1.jpg", b"aaaa")
+        clock.now += 1
+        store.put("https://a.com/2.jpg", b"bbbb")
+        clock.now += 1
+        store.put("https://mirror.com/1.jpg", b"aaaa")
+        clock.now += 1
+        store.put("https://a.com/3.jpg", b"cccc")
+        assert "https://a.com/2.jpg" not in store
+        assert store.get("https://a.com/1.jpg") == b"aaaa"
@@ -0,0 +1,94 @@
+import pytest
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from retry_scheduler import RetryExhausted
+
+
+def _trip(breaker, key="ddg", times=None):
+    for _ in range(times or breaker.failure_threshold):
+        breaker.record_failure(key)
+
+
+class TestCircuitBreaker:
+    def test_rejects_zero_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, clock=clock)
+        _trip(breaker, times=2)
+        assert breaker.state("ddg") == CLOSED
+        breaker.record_success("ddg")
+        _trip(breaker, times=2)
+        assert breaker.state("ddg") == CLOSED
+        breaker.record_failure("ddg")
+        assert breaker.state("ddg") == OPEN
+        assert not breaker.allow("ddg")
+        assert breaker.allow("instagram")
+
+    def test_open_circuit_fails_fast_with_ready_time(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+        _trip(breaker)
+        clock.now += 15
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.before_call("ddg")
+        assert isinstance(excinfo.value, RetryExhausted)
+        assert excinfo.value.ready_at == 1060
+        assert breaker.retry_in("ddg") == 45
+
+    def test_half_open_admits_one_probe(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+        _trip(breaker)
+        clock.now += 60
+        assert breaker.state("ddg") == HALF_OPEN
+        assert breaker.allow("ddg")
+        assert not breaker.allow("ddg")
+        breaker.record_success("ddg")
+        assert breaker.state("ddg") == CLOSED
+        assert breaker.allow("ddg")
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock)
+        _trip(breaker)
+        clock.now += 60
+        assert breaker.allow("ddg")
+        breaker.record_failure("ddg")
+        assert breaker.state("ddg") == OPEN
+        assert breaker.retry_in("ddg") == 60
+        assert breaker.snapshot()[0]["trips"] == 2
+
+    def test_guard_classifies_outcomes(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+        with pytest.raises(KeyError):
+            with breaker.guard("ddg", lambda error: isinstance(error, ConnectionError)):
+                raise KeyError("parse")
+        assert breaker.state("ddg") == CLOSED
+        with pytest.raises(ConnectionError):
+            with breaker.guard("ddg", lambda error: isinstance(error, ConnectionError)):
+                raise ConnectionError("reset")
+        assert breaker.state("ddg") == OPEN
+        with pytest.raises(CircuitOpenError):
+            with breaker.guard("ddg", lambda error: True):
+                pytest.fail("guarded block must not run while open")
+
+    def test_interrupted_probe_is_released(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        _trip(breaker)
+        clock.now += 10
+        with pytest.raises(KeyboardInterrupt):
+            with breaker.guard("ddg", lambda error: True):
+                raise KeyboardInterrupt
+        assert breaker.state("ddg") == HALF_OPEN
+        assert breaker.allow("ddg")
+
+    def test_snapshot_and_reset(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+        _trip(breaker, "ddg")
+        breaker.record_failure("img.com")
+        breaker.allow("ddg")
+        assert breaker.snapshot() == [
+            {"upstream": "ddg", "state": OPEN, "failures": 2, "trips": 1, "rejected": 1, "retry_in": 30.0},
+            {"upstream": "img.com", "state": CLOSED, "failures": 1, "trips": 0, "rejected": 0, "retry_in": 0.0},
+        ]
+        breaker.reset("ddg")
+        assert breaker.state("ddg") == CLOSED
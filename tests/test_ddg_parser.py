@@ -0,0 +1,108 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+import ddg_parser
+from osint_core import OSINTCore
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as handle:
+        return handle.read()
+
+
+class TestBackends:
+    @pytest.mark.parametrize("backend", ddg_parser.available_backends())
+    def test_backends_agree_with_bs4(self, backend):
+        html = _fixture("ddg_results.html")
+        expected = list(ddg_parser.iter_result_hrefs(html, "bs4"))
+        assert len(expected) == 30
+        assert list(ddg_parser.iter_result_hrefs(html, backend)) == expected
+
+    @pytest.mark.parametrize("backend", ddg_parser.available_backends())
+    def test_no_results_page(self, backend):
+        html = _fixture("ddg_no_results.html")
+        assert list(ddg_parser.iter_result_hrefs(html, backend)) == []
+
+    @pytest.mark.parametrize("backend", ddg_parser.available_backends())
+    def test_ignores_other_anchors_and_empty_hrefs(self, backend):
+        html = (
+            '<a class="result__url" href="https://skip.com">x</a>'
+            '<a class="result__a" href="">empty</a>'
+            '<a class="result__a extra" href="https://a.com/?x=1&amp;y=2">a</a>'
+        )
+        assert list(ddg_parser.iter_result_hrefs(html, backend)) == ["https://a.com/?x=1&y=2"]
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            ddg_parser.resolve_backend("regex")
+        with pytest.raises(ValueError):
+            OSINTCore(parser="regex")
+
+    def test_auto_prefers_lxml_then_stream(self):
+        assert ddg_parser.resolve_backend("auto") == ddg_parser.available_backends()[0]
+        with patch("ddg_parser.etree", None):
+            assert ddg_parser.resolve_backend("auto") == "stream"
+
+    def test_stream_stops_feeding_once_consumer_stops(self):
+        html = _fixture("ddg_results.html")
+        fed = []
+        original_feed = ddg_parser._ResultAnchorParser.feed
+
+        def counting_feed(self, data):
+            fed.append(len(data))
+            return original_feed(self, data)
+
+        with patch.object(ddg_parser._ResultAnchorParser, "feed", counting_feed):
+            hrefs = ddg_parser.iter_result_hrefs(html, "stream", chunk_size=4096)
+            next(hrefs)
+            hrefs.close()
+        assert sum(fed) < len(html)
+
+
+class TestClassifyPage:
+    @pytest.mark.parametrize(
+        "name, status, expected",
+        [
+            ("ddg_results.html", 200, ddg_parser.RESULTS),
+            ("ddg_no_results.html", 200, ddg_parser.EMPTY),
+            ("ddg_anomaly.html", 200, ddg_parser.DEGRADED),
+            ("ddg_anomaly.html", 202, ddg_parser.DEGRADED),
+            ("ddg_results.html", 202, ddg_parser.DEGRADED),
+        ],
+    )
+    def test_fixtures(self, name, status, expected):
+        assert ddg_parser.classify_page(_fixture(name), status) == expected
+
+    def test_unrecognised_page_is_unknown(self):
+        assert ddg_parser.classify_page("<html><body>Service unavailable</body></html>") == ddg_parser.UNKNOWN
+        assert ddg_parser.classify_page("") == ddg_parser.UNKNOWN
+
+    @pytest.mark.parametrize("backend", ddg_parser.available_backends())
+    def test_result_class_must_be_a_class_token(self, backend):
+        lookalikes = (
+            '<a class="result__advert" href="https://ad.com">ad</a>'
+            "<p>search for result__a anchors</p>"
+        )
+        assert ddg_parser.classify_page(lookalikes, backend=backend) == ddg_parser.UNKNOWN
+        html = '<a class="link result__a" href="https://a.com">a</a>'
+        assert ddg_parser.classify_page(html, backend=backend) == ddg_parser.RESULTS
+
+    def test_escaped_marker_in_snippet_is_not_a_block(self):
+        html = (
+            '<a class="result__a" href="https://a.com">a</a>'
+            '<a class="result__snippet">use class=&quot;g-recaptcha&quot; on the form</a>'
+        )
+        assert ddg_parser.classify_page(html) == ddg_parser.RESULTS
+
+
+class TestCoreParser:
+    @pytest.mark.parametrize("backend", ddg_parser.available_backends())
+    def test_parse_results_decodes_redirects_and_caps(self, backend):
+        core = OSINTCore(parser=backend)
+        results = core._parse_results(_fixture("ddg_results.html"), max_results=5)
+        assert len(results) == 5
+        assert all(url.startswith("https://www.") for url in results)
@@ -0,0 +1,57 @@
+import io
+import math
+
+import numpy as np
+from PIL import Image
+
+from benchmarks.standin_server import make_image
+from exif_batch import COLUMNS, extract_batch, extract_row
+
+
+def _webp_with_exif():
+    source = Image.open(io.BytesIO(make_image("JPEG", with_exif=True)))
+    buf = io.BytesIO()
+    source.save(buf, format="WEBP", exif=source.getexif())
+    return buf.getvalue()
+
+
+class TestExtractRow:
+    def test_reads_gps_rationals(self):
+        row = extract_row(make_image("JPEG", with_exif=True))
+        assert row["make"] == "Canon"
+        assert row["lat_ref"] == "S"
+        assert row["lat"] == (23.0, 33.0, 1.2)
+
+    def test_missing_file(self, tmp_path):
+        row = extract_row(str(tmp_path / "missing.jpg"))
+        assert row["format"] is None
+        assert row["tag_count"] == 0
+
+    def test_falls_back_to_pil_for_other_formats(self):
+        row = extract_row(_webp_with_exif())
+        assert row["model"] == "EOS 80D"
+        assert row["lon_ref"] == "W"
+
+
+class TestExtractBatch:
+    def test_columnar_result(self, tmp_path):
+        path = tmp_path / "exif.jpg"
+        path.write_bytes(make_image("JPEG", with_exif=True, size=(2000, 1500), noise=True))
+        frame = extract_batch([str(path), make_image("PNG", with_exif=False), b"not an image"])
+        assert list(frame.columns) == COLUMNS
+        assert frame.loc[0, "source"] == str(path)
+        assert math.isclose(frame.loc[0, "latitude"], -23.550333, rel_tol=1e-6)
+        assert math.isclose(frame.loc[0, "longitude"], -46.636111, rel_tol=1e-6)
+        assert np.isnan(frame.loc[1, "latitude"])
+        assert frame.loc[2, "tag_count"] == 0
+
+    def test_process_pool_matches_inline(self):
+        sources = [make_image("JPEG", with_exif=True), make_image("JPEG", with_exif=False)] * 4
+        inline = extract_batch(sources, max_workers=1)
+        pooled = extract_batch(sources, max_workers=2, chunksize=2, min_parallel=0)
+        assert inline.equals(pooled)
+
+    def test_empty_batch(self):
+        frame = extract_batch([])
+        assert frame.empty
+        assert list(frame.columns) == COLUMNS
@@ -0,0 +1,132 @@
+import io
+import struct
+
+import pytest
+from PIL import Image
+
+import exif_reader
+from app import extract_exif, extract_exif_pil, gps_to_decimal
+
+
+def _image_with_exif(fmt: str, size=(64, 48)) -> bytes:
+    exif = Image.Exif()
+    exif[271] = "Canon"
+    exif[272] = "EOS 80D"
+    exif[0x8825] = {1: "N", 2: (40.0, 26.0, 46.0), 3: "W", 4: (79.0, 58.0, 56.0)}
+    exif.get_ifd(0x8769)[36867] = "2024:05:01 09:59:00"
+    buf = io.BytesIO()
+    Image.new("RGB", size, (10, 20, 30)).save(buf, format=fmt, exif=exif)
+    return buf.getvalue()
+
+
+def _big_endian_tiff() -> bytes:
+    make = b"Nikon\x00"
+    ifd0_offset = 8
+    ifd0_size = 2 + 2 * 12 + 4
+    make_offset = ifd0_offset + ifd0_size
+    gps_offset = make_offset + len(make)
+    ifd0 = struct.pack(">H", 2)
+    ifd0 += struct.pack(">HHII", 271, 2, len(make), make_offset)
+    ifd0 += struct.pack(">HHII", 0x8825, 4, 1, gps_offset)
+    ifd0 += struct.pack(">I", 0)
+    gps_size = 2 + 2 * 12 + 4
+    lat_offset = gps_offset + gps_size
+    gps = struct.pack(">H", 2)
+    gps += struct.pack(">HHI2sxx", 1, 2, 2, b"S\x00")
+    gps += struct.pack(">HHII", 2, 5, 3, lat_offset)
+    gps += struct.pack(">I", 0)
+    lat = struct.pack(">6I", 23, 1, 33, 1, 12, 10)
+    return b"MM\x00\x2a" + struct.pack(">I", ifd0_offset) + ifd0 + make + gps + lat
+
+
+class TestLocateExif:
+    def test_jpeg_app1_found(self):
+        status, tiff, end = exif_reader.locate_exif(_image_with_exif("JPEG"))
+        assert status == exif_reader.FOUND
+        assert bytes(tiff[:2]) in (b"II", b"MM")
+        assert end > 0
+
+    def test_png_exif_chunk_found(self):
+        status, tiff, _ = exif_reader.locate_exif(_image_with_exif("PNG"))
+        assert status == exif_reader.FOUND
+        assert bytes(tiff[:2]) in (b"II", b"MM")
+
+    def test_truncated_prefix_reports_bytes_needed(self):
+        data = _image_with_exif("JPEG")
+        status, tiff, needed = exif_reader.locate_exif(data[:30])
+        assert status == exif_reader.INCOMPLETE
+        assert tiff is None
+        assert 30 < needed <= len(data)
+        assert exif_reader.locate_exif(data[:needed])[0] == exif_reader.FOUND
+
+    def test_jpeg_without_exif_is_absent(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(buf, format="JPEG")
+        assert exif_reader.locate_exif(buf.getvalue())[0] == exif_reader.ABSENT
+
+    def test_unknown_format_is_absent(self):
+        assert exif_reader.locate_exif(b"GIF89a" + b"\x00" * 20)[0] == exif_reader.ABSENT
+        assert exif_reader.sniff_format(b"GIF89a") is None
+
+
+class TestReadExif:
+    @pytest.mark.parametrize("fmt", ["JPEG", "PNG"])
+    def test_reads_tags_and_gps(self, fmt):
+        exif = exif_reader.read_exif(_image_with_exif(fmt))
+        assert exif["Make"] == "Canon"
+        assert exif["Model"] == "EOS 80D"
+        assert exif["DateTimeOriginal"] == "2024:05:01 09:59:00"
+        assert exif["GPSInfo"]["GPSLatitudeRef"] == "N"
+        assert exif["GPSInfo"]["GPSLatitude"] == ((40, 1), (26, 1), (46, 1))
+
+    def test_reads_from_memoryview_prefix_of_large_image(self):
+        data = _image_with_exif("JPEG", size=(1600, 1200))
+        prefix = memoryview(data)[:65536]
+        assert exif_reader.read_exif(prefix)["Make"] == "Canon"
+
+    def test_big_endian_tiff(self):
+        exif = exif_reader.parse_tiff(_big_endian_tiff())
+        assert exif["Make"] == "Nikon"
+        assert exif["GPSInfo"]["GPSLatitudeRef"] == "S"
+        assert exif["GPSInfo"]["GPSLatitude"] == ((23, 1), (33, 1), (12, 10))
+
+    def test_skips_large_opaque_blobs(self):
+        exif = Image.Exif()
+        exif[271] = "Canon"
+        exif.get_ifd(0x8769)[36867] = "2024:05:01 09:59:00"
+        exif.get_ifd(0x8769)[0x927C] = b"\x01" * 25600
+        exif.get_ifd(0x8769)[0x9000] = b"0231"
+        exif[700] = b"<x:xmpmeta/>" * 200
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(buf, format="JPEG", exif=exif)
+        data = extract_exif(buf.getvalue())
+        assert "MakerNote" not in data
+        assert "XMLPacket" not in data
+        assert data["ExifVersion"] == b"0231"
+        assert data["DateTimeOriginal"] == "2024:05:01 09:59:00"
+
+    def test_corrupt_offsets_do_not_raise(self):
+        tiff = bytearray(_big_endian_tiff())
+        struct.pack_into(">I", tiff, 4, 10_000)
+        assert exif_reader.parse_tiff(bytes(tiff)) == {}
+        assert exif_reader.parse_tiff(b"XX\x00\x2a") == {}
+
+    def test_matches_pil_path(self):
+        data = _image_with_exif("JPEG")
+        fast = exif_reader.read_exif(data)
+        slow = extract_exif_pil(data)
+        for key in ("Make", "Model", "DateTime"):
+            if key in slow:
+                assert fast[key] == slow[key]
+        assert gps_to_decimal(fast["GPSInfo"]) == pytest.approx((40.446111, -79.982222), abs=1e-4)
+
+
+class TestExtractExifDispatch:
+    def test_uses_header_reader_for_jpeg(self):
+        exif = extract_exif(_image_with_exif("JPEG"))
+        assert exif["GPSInfo"]["GPSLatitude"] == ((40, 1), (26, 1), (46, 1))
+
+    def test_falls_back_to_pil_for_other_formats(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(buf, format="GIF")
+        assert extract_exif(buf.getvalue()) == {}
@@ -0,0 +1,109 @@
+import math
+
+import numpy as np
+import pytest
+from PIL.TiffImagePlugin import IFDRational
+
+from benchmarks.bench_gps import CORPUS
+from gps import (
+    LATITUDE,
+    LONGITUDE,
+    components_array,
+    components_to_degrees,
+    decode_batch,
+    dms_components,
+    gps_to_decimal,
+    normalize_ref,
+    rational_to_float,
+)
+
+
+class TestRationalToFloat:
+    def test_accepts_tuples_ifdrational_and_numbers(self):
+        assert rational_to_float((6, 5)) == 1.2
+        assert rational_to_float(IFDRational(3013, 100)) == 30.13
+        assert rational_to_float(7) == 7.0
+        assert rational_to_float(2.5) == 2.5
+
+    def test_bad_values_are_nan(self):
+        assert math.isnan(rational_to_float((1, 0)))
+        assert math.isnan(rational_to_float(IFDRational(1, 0)))
+        assert math.isnan(rational_to_float("12"))
+        assert math.isnan(rational_to_float(None))
+        assert math.isnan(rational_to_float(True))
+
+
+class TestDmsComponents:
+    def test_pads_short_sequences(self):
+        assert dms_components((10.5,)) == (10.5, 0.0, 0.0)
+        assert dms_components([(12, 1), (30, 1)]) == (12.0, 30.0, 0.0)
+
+    def test_single_rational_pair_is_degrees(self):
+        assert dms_components((51500729, 1000000)) == (51.500729, 0.0, 0.0)
+
+    def test_invalid_shapes(self):
+        assert all(math.isnan(part) for part in dms_components(()))
+        assert all(math.isnan(part) for part in dms_components((1, 2, 3, 4)))
+        assert all(math.isnan(part) for part in dms_components(None))
+
+
+class TestComponentsToDegrees:
+    def test_range_validation(self):
+        assert math.isnan(components_to_degrees((91.0, 0.0, 0.0), "N", LATITUDE))
+        assert components_to_degrees((179.0, 0.0, 0.0), "E", LONGITUDE) == 179.0
+        assert math.isnan(components_to_degrees((10.0, 60.0, 0.0), "N", LATITUDE))
+        assert math.isnan(components_to_degrees((10.0, 0.0, -1.0), "N", LATITUDE))
+
+    def test_ref_overrides_sign(self):
+        assert components_to_degrees((10.0, 30.0, 0.0), "S", LATITUDE) == -10.5
+        assert components_to_degrees((-10.0, 30.0, 0.0), "", LATITUDE) == -10.5
+
+    def test_normalize_ref(self):
+        assert normalize_ref(b"W\x00") == "W"
+        assert normalize_ref(" s") == "S"
+        assert normalize_ref(None) == ""
+
+
+class TestGpsToDecimal:
+    @pytest.mark.parametrize("label,gps_info,expected", CORPUS, ids=[label for label, _, _ in CORPUS])
+    def test_corpus(self, label, gps_info, expected):
+        result = gps_to_decimal(gps_info)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == pytest.approx(expected, abs=1e-5)
+
+    def test_non_mapping_input(self):
+        assert gps_to_decimal(34853) is None
+
+
+class TestDecodeBatch:
+    def test_matches_scalar_decoder_on_corpus(self):
+        infos = [gps_info for _, gps_info, _ in CORPUS]
+        lat, lon = decode_batch(infos)
+        for index, gps_info in enumerate(infos):
+            expected = gps_to_decimal(gps_info)
+            if expected is None:
+                assert np.isnan(lat[index]) and np.isnan(lon[index])
+            else:
+                assert (lat[index], lon[index]) == pytest.approx(expected)
+
+    def test_uniform_rationals_take_vectorized_path(self):
+        values = [((23, 1), (33, 1), (6, 5)), ((0, 0), (0, 1), (0, 1))]
+        parts = components_array(values)
+        assert parts.shape == (2, 3)
+        assert parts[0].tolist() == [23.0, 33.0, 1.2]
+        assert np.isnan(parts[1, 0])
+
+    def test_irregular_refs_match_scalar_decoder(self):
+        value = ((10, 1), (30, 1), (0, 1))
+        infos = [
+            {"GPSLatitudeRef": ref, "GPSLatitude": value, "GPSLongitudeRef": "E", "GPSLongitude": value}
+            for ref in ("S", "N", b"S\x00", " s", None, ["S"])
+        ]
+        lat, _ = decode_batch(infos)
+        assert lat.tolist() == [gps_to_decimal(info)[0] for info in infos] == [-10.5, 10.5, -10.5, -10.5, 10.5, 10.5]
+
+    def test_empty(self):
+        lat, lon = decode_batch([])
+        assert lat.shape == lon.shape == (0,)
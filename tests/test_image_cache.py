@@ -0,0 +1,56 @@
+from image_cache import ImageCache, ProbeCache
+
+
+class TestImageCache:
+    def test_miss_then_hit(self):
+        cache = ImageCache(max_bytes=100)
+        assert cache.get("https://a.com/1.jpg") is None
+        cache.put("https://a.com/1.jpg", b"abc")
+        assert cache.get("https://a.com/1.jpg") == b"abc"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used_within_budget(self):
+        cache = ImageCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+        assert "b" not in cache
+        assert "a" in cache
+        assert "c" in cache
+        assert cache.size_bytes == 8
+
+    def test_replacing_entry_updates_size(self):
+        cache = ImageCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("a", b"12")
+        assert cache.size_bytes == 2
+        assert len(cache) == 1
+
+    def test_oversized_payload_is_dropped(self):
+        cache = ImageCache(max_bytes=2)
+        cache.put("big", b"123456")
+        assert cache.get("big") is None
+        assert cache.size_bytes == 0
+
+
+class TestProbeCache:
+    def test_entries_expire_after_ttl(self, clock):
+        cache = ProbeCache(ttl=10, clock=clock)
+        cache.put("a", {"status": "ok"})
+        clock.now += 9
+        assert cache.get("a") == {"status": "ok"}
+        clock.now += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 0}
+
+    def test_evicts_least_recently_used(self):
+        cache = ProbeCache(max_entries=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+        assert cache.get("b") is None
+        assert cache.get("a") == {}
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from instrumentation import (
+    CompositeInstrumentation,
+    InMemoryInstrumentation,
+    Instrumentation,
+    JsonlSpanExporter,
+)
+
+
+class TestNoop:
+    def test_span_yields_mutable_attributes(self):
+        with Instrumentation().span("x", a=1) as span:
+            span["b"] = 2
+        assert span == {"a": 1, "b": 2}
+
+    def test_span_reraises(self):
+        with pytest.raises(RuntimeError):
+            with Instrumentation().span("x"):
+                raise RuntimeError("boom")
+
+
+class TestInMemory:
+    def test_aggregates_per_span(self):
+        metrics = InMemoryInstrumentation()
+        for duration in (0.01, 0.02, 0.03):
+            metrics.record("search.request", duration)
+        metrics.record("search.parse", 0.001)
+        rows = {row["span"]: row for row in metrics.summary()}
+        assert rows["search.request"]["count"] == 3
+        assert rows["search.request"]["total_ms"] == pytest.approx(60)
+        assert rows["search.request"]["p50_ms"] == pytest.approx(20)
+        assert rows["search.request"]["max_ms"] == pytest.approx(30)
+        assert rows["search.parse"]["count"] == 1
+
+    def test_counts_errors(self):
+        metrics = InMemoryInstrumentation()
+        with pytest.raises(ValueError):
+            with metrics.span("image.request"):
+                raise ValueError("bad")
+        metrics.record("image.request", 0.1, error="timeout")
+        assert metrics.summary()[0]["errors"] == 2
+
+    def test_sample_window_is_bounded(self):
+        metrics = InMemoryInstrumentation(max_samples=3)
+        for duration in (10, 1, 1, 1):
+            metrics.record("x", duration)
+        row = metrics.summary()[0]
+        assert row["count"] == 4
+        assert row["p95_ms"] == pytest.approx(1000)
+        assert row["max_ms"] == pytest.approx(10000)
+
+    def test_write_prometheus(self, tmp_path):
+        metrics = InMemoryInstrumentation()
+        metrics.record("search.request", 0.5)
+        path = tmp_path / "metrics.prom"
+        metrics.write_prometheus(str(path))
+        text = path.read_text()
+        assert '# TYPE osint_span_seconds summary' in text
+        assert 'osint_span_seconds_count{span="search.request"} 1' in text
+        assert 'osint_span_seconds_sum{span="search.request"} 0.500000' in text
+
+
+class TestExporters:
+    def test_jsonl_exporter_writes_otel_like_spans(self, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        exporter = JsonlSpanExporter(str(path))
+        with exporter.span("profile.lookup", username="u") as span:
+            span["status"] = "ok"
+        exporter.record("search.parse", 0.002, results=3)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["profile.lookup", "search.parse"]
+        assert lines[0]["attributes"] == {"username": "u", "status": "ok"}
+        assert lines[0]["end_time_unix_nano"] >= lines[0]["start_time_unix_nano"]
+        assert lines[1]["status"] == "OK"
+
+    def test_composite_fans_out(self, tmp_path):
+        first, second = InMemoryInstrumentation(), InMemoryInstrumentation()
+        CompositeInstrumentation(first, second).record("x", 0.1)
+        assert first.summary()[0]["count"] == second.summary()[0]["count"] == 1
@@ -0,0 +1,143 @@
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from benchmarks.standin_server import StandInServer
+from osint_batch import Checkpoint, main, read_targets, run_batch
+from osint_core import DORK_TEMPLATES, OSINTCore
+from rate_limiter import RateLimiter
+from retry_scheduler import RetryExhausted, RetryScheduler
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestReadTargets:
+    def test_skips_blanks_comments_and_duplicates(self):
+        assert read_targets(["alice\n", "\n", "# note\n", " bob \n", "alice\n"]) == ["alice", "bob"]
+
+
+class TestRunBatch:
+    def test_streams_one_record_per_query(self):
+        core = OSINTCore(rate_limiter=RateLimiter(min_interval=0))
+        output = io.StringIO()
+        with patch.object(OSINTCore, "search_web", return_value=["https://a.com"]):
+            counts = run_batch(core, ["alice"], output, ["Fotos e Imagens", "Mencoes Publicas"])
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [record["type"] for record in records] == ["Fotos e Imagens", "Mencoes Publicas"]
+        assert records[0]["query"] == DORK_TEMPLATES["Fotos e Imagens"].format(target="alice")
+        assert counts == {"queries": 2, "skipped": 0, "urls": 2, "empty": 0, "deferred": 0, "failed": 0}
+
+    def test_unavailable_queries_are_retried_after_cooldown(self, clock):
+        scheduler = RetryScheduler(max_deferrals=1, clock=clock, sleep=clock.sleep)
+        core = OSINTCore(rate_limiter=RateLimiter(min_interval=0), retry_scheduler=scheduler)
+        output = io.StringIO()
+        outcomes = {
+            "alice": [RetryExhausted("duckduckgo.com", 1, None, clock.now + 60), ["https://a.com"]],
+            "bob": [RetryExhausted("duckduckgo.com", 1, None, clock.now + 30)] * 2,
+        }
+
+        def fake_search(self, query, max_results=20, strict=False):
+            outcome = outcomes["alice" if "alice" in query else "bob"].pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch.object(OSINTCore, "search_web", fake_search):
+            counts = run_batch(core, ["alice", "bob"], output, ["Fotos e Imagens"])
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [record["target"] for record in records] == ["alice"]
+        assert counts["deferred"] == 2
+        assert counts["failed"] == 1
+        assert clock.now == 1060.0
+        assert scheduler.pending() == 0
+
+    def test_blocked_queries_are_not_checkpointed(self, tmp_path):
+        checkpoint = Checkpoint(str(tmp_path / "ckpt.jsonl"))
+        core = OSINTCore(rate_limiter=RateLimiter(min_interval=0))
+        output = io.StringIO()
+        blocked = requests.HTTPError("403 error", response=MagicMock(status_code=403))
+        with patch.object(OSINTCore, "search_web", side_effect=[blocked, ["https://a.com"]]):
+            counts = run_batch(core, ["alice"], output, ["Fotos e Imagens", "Mencoes Publicas"], checkpoint=checkpoint)
+        checkpoint.close()
+        assert counts["failed"] == 1
+        assert counts["queries"] == 1
+        assert [json.loads(line)["type"] for line in output.getvalue().splitlines()] == ["Mencoes Publicas"]
+        assert Checkpoint(str(tmp_path / "ckpt.jsonl")).completed == {("alice", "Mencoes Publicas")}
+
+    def test_checkpoint_skips_completed_queries(self, tmp_path):
+        checkpoint = Checkpoint(str(tmp_path / "ckpt.jsonl"))
+        checkpoint.mark("alice", "Fotos e Imagens")
+        core = OSINTCore(rate_limiter=RateLimiter(min_interval=0))
+        output = io.StringIO()
+        with patch.object(OSINTCore, "search_web", return_value=[]) as mock_search:
+            counts = run_batch(core, ["alice"], output, ["Fotos e Imagens", "Mencoes Publicas"], checkpoint=checkpoint)
+        assert mock_search.call_count == 1
+        assert counts["skipped"] == 1
+        assert counts["empty"] == 1
+        checkpoint.close()
+        assert Checkpoint(str(tmp_path / "ckpt.jsonl")).completed == {
+            ("alice", "Fotos e Imagens"),
+            ("alice", "Mencoes Publicas"),
+        }
+
+
+    def test_checkpoint_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "ckpt.jsonl"
+        path.write_text(
+            '{"target": "alice", "type": "Fotos e Imagens"}\n'
+            '{"target": "bob", "typ\n'
+            '{"target": "bob"}\n'
+            '["bob", "Fotos e Imagens"]\n'
+            '{"target": ["bob"], "type": "Fotos e Imagens"}\n'
+            '{"target": "carol", "type": "Mencoes Publicas"}\n',
+            encoding="utf-8",
+        )
+        checkpoint = Checkpoint(str(path))
+        checkpoint.close()
+        assert checkpoint.completed == {("alice", "Fotos e Imagens"), ("carol", "Mencoes Publicas")}
+
+
+class TestMain:
+    def test_resumes_after_interrupt(self, tmp_path, capsys):
+        targets = tmp_path / "targets.txt"
+        targets.write_text("alice\nbob\n", encoding="utf-8")
+        output = tmp_path / "out.jsonl"
+        checkpoint = tmp_path / "ckpt.jsonl"
+        with StandInServer() as server:
+            argv = [
+                str(targets),
+                "--dork", "Fotos e Imagens",
+                "--dork", "Mencoes Publicas",
+                "--output", str(output),
+                "--checkpoint", str(checkpoint),
+                "--min-interval", "0",
+                "--search-url", f"{server.url}/html/",
+            ]
+            real_search = OSINTCore.search_web
+            calls = []
+
+            def interrupt_third(self, query, max_results=20, strict=False):
+                calls.append(query)
+                if len(calls) == 3:
+                    raise KeyboardInterrupt
+                return real_search(self, query, max_results, strict)
+
+            with patch.object(OSINTCore, "search_web", interrupt_third):
+                assert main(argv) == 130
+            assert len(_lines(output)) == 2
+
+            assert main(argv) == 0
+            assert server.counters["search"] == 4
+        records = _lines(output)
+        assert [(record["target"], record["type"]) for record in records] == [
+            ("alice", "Fotos e Imagens"),
+            ("alice", "Mencoes Publicas"),
+            ("bob", "Fotos e Imagens"),
+            ("bob", "Mencoes Publicas"),
+        ]
+        assert all(len(record["urls"]) == 20 for record in records)
+        assert "skipped=2" in capsys.readouterr().err
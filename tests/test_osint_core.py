@@ -1,12 +1,29 @@
 import io
 import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import instaloader
 import pytest
 import requests
 
-from osint_core import OSINTCore
+from benchmarks.standin_server import StandInServer
+from osint_core import DEGRADED_PAGE_COOLDOWN, OSINTCore
+from circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+from instrumentation import InMemoryInstrumentation
+from profile_cache import ProfileCache
+from rate_limiter import RateLimiter
+from retry_scheduler import RetryExhausted, RetryScheduler
+from search_cache import SearchCache
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as handle:
+        return handle.read()
 
 
 class TestOSINTCoreInit:
@@ -23,6 +40,65 @@ class TestOSINTCoreInit:
         assert core.user_agents == ["UA1"]
 
 
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSession:
+    def test_session_mounts_pooled_adapter(self):
+        core = OSINTCore(pool_maxsize=4, max_retries=3)
+        adapter = core.session.get_adapter("https://duckduckgo.com/html/")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+        assert core.retry_scheduler.max_attempts == 4
+
+    def test_other_traffic_keeps_adapter_retries(self):
+        core = OSINTCore(pool_maxsize=4, max_retries=3)
+        adapter = core.session.get_adapter("https://img.example.com/a.jpg")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.respect_retry_after_header
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_only_search_requests_skip_adapter_retries(self):
+        with StandInServer(error_rate=1.0) as server:
+            with OSINTCore(max_retries=1, search_url=f"{server.url}/html/") as core:
+                assert core.session.get(f"{server.url}/html/", timeout=5).status_code == 503
+                assert server.counters["error"] == 1
+                assert core.session.get(f"{server.url}/images/plain.jpg", timeout=5).status_code == 503
+                assert server.counters["error"] == 3
+
+    def test_pool_stats_show_connection_reuse(self, local_server):
+        with OSINTCore() as core:
+            for _ in range(3):
+                core.session.get(local_server + "/page", timeout=5).raise_for_status()
+            stats = core.pool_stats()
+        assert len(stats) == 1
+        assert stats[0]["host"] == "127.0.0.1"
+        assert stats[0]["requests"] == 3
+        assert stats[0]["connections_opened"] == 1
+
+
 class TestHelpers:
     def test_get_headers_returns_valid_ua(self):
         core = OSINTCore(user_agents=["TestAgent/1.0"])
@@ -45,18 +121,24 @@ class TestHelpers:
         url = "https://duckduckgo.com/l/?other=val"
         assert core._extract_ddg_url(url) == url
 
-    @patch("osint_core.time.sleep")
-    def test_sleep_random(self, mock_sleep):
-        core = OSINTCore(delay_range=(1, 1))
-        core._sleep_random()
-        mock_sleep.assert_called_once()
-        delay = mock_sleep.call_args[0][0]
-        assert 1.0 <= delay <= 1.0
+    def test_default_rate_limiter_uses_delay_floor(self):
+        core = OSINTCore(delay_range=(2, 5))
+        assert core.rate_limiter.min_interval == 2
+        assert core.rate_limiter.burst == 1
+
+    @patch("rate_limiter.time.sleep")
+    def test_throttle_sleeps_only_for_deficit(self, mock_sleep):
+        clock = MagicMock(side_effect=[100.0, 100.5])
+        core = OSINTCore(rate_limiter=RateLimiter(min_interval=2, clock=clock))
+        assert core._throttle("https://duckduckgo.com/html/") == 0
+        mock_sleep.assert_not_called()
+        core._throttle("https://duckduckgo.com/html/")
+        mock_sleep.assert_called_once_with(1.5)
 
 
 class TestSearchWeb:
-    @patch("osint_core.time.sleep")
-    @patch("osint_core.requests.get")
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get")
     def test_search_web_parses_results(self, mock_get, _mock_sleep):
         html = """
         <html><body>
@@ -73,8 +155,8 @@ class TestSearchWeb:
         results = core.search_web("test query", max_results=10)
         assert results == ["https://example.com/1", "https://example.com/2"]
 
-    @patch("osint_core.time.sleep")
-    @patch("osint_core.requests.get")
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get")
     def test_search_web_respects_max_results(self, mock_get, _mock_sleep):
         html = """
         <html><body>
@@ -92,22 +174,22 @@ class TestSearchWeb:
         results = core.search_web("test", max_results=2)
         assert len(results) == 2
 
-    @patch("osint_core.time.sleep")
-    @patch("osint_core.requests.get", side_effect=requests.ConnectionError("connection refused"))
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get", side_effect=requests.ConnectionError("connection refused"))
     def test_search_web_returns_empty_on_connection_error(self, mock_get, _mock_sleep):
         core = OSINTCore()
         results = core.search_web("test query")
         assert results == []
 
-    @patch("osint_core.time.sleep")
-    @patch("osint_core.requests.get", side_effect=requests.Timeout("request timed out"))
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get", side_effect=requests.Timeout("request timed out"))
     def test_search_web_returns_empty_on_timeout(self, mock_get, _mock_sleep):
         core = OSINTCore()
         results = core.search_web("test query")
         assert results == []
 
-    @patch("osint_core.time.sleep")
-    @patch("osint_core.requests.get")
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get")
     def test_search_web_returns_empty_on_http_error(self, mock_get, _mock_sleep):
         mock_resp = MagicMock()
         mock_resp.raise_for_status.side_effect = requests.HTTPError("403 Forbidden")
@@ -117,13 +199,298 @@ class TestSearchWeb:
         results = core.search_web("test query")
         assert results == []
 
-    @patch("osint_core.BeautifulSoup", None)
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get")
+    def test_search_web_cache_hit_skips_sleep_and_request(self, mock_get, mock_sleep):
+        mock_resp = MagicMock()
+        mock_resp.text = '<a class="result__a" href="https://example.com/1">1</a>'
+        mock_resp.raise_for_status = MagicMock()
+        mock_get.return_value = mock_resp
+
+        core = OSINTCore(cache=SearchCache())
+        first = core.search_web("test query", max_results=10)
+        second = core.search_web("Test  Query", max_results=10)
+        assert first == second == ["https://example.com/1"]
+        assert mock_get.call_count == 1
+        assert core.rate_limiter.acquisitions == 1
+        assert core.cache.hits == 1
+
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get", side_effect=requests.ConnectionError("down"))
+    def test_search_web_does_not_cache_failures(self, mock_get, _mock_sleep):
+        core = OSINTCore(cache=SearchCache(), retry_scheduler=RetryScheduler(max_attempts=1))
+        core.search_web("test query")
+        core.search_web("test query")
+        assert mock_get.call_count == 2
+        assert len(core.cache) == 0
+
+    @patch("ddg_parser.BeautifulSoup", None)
     def test_search_web_returns_empty_when_bs4_missing(self):
-        core = OSINTCore()
+        core = OSINTCore(parser="bs4")
         results = core.search_web("test query")
         assert results == []
 
 
+def _response(status, text="", headers=None):
+    response = MagicMock()
+    response.status_code = status
+    response.ok = status < 400
+    response.text = text
+    response.headers = headers or {}
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status} error", response=response)
+    return response
+
+
+class TestRetryScheduling:
+    def _core(self, clock, **kwargs):
+        scheduler = RetryScheduler(max_attempts=3, clock=clock, sleep=clock.sleep, rng=lambda: 1.0, **kwargs)
+        return OSINTCore(rate_limiter=RateLimiter(0), retry_scheduler=scheduler)
+
+    @patch("osint_core.requests.Session.get")
+    def test_transient_status_is_retried_with_backoff(self, mock_get, clock):
+        mock_get.side_effect = [
+            _response(503),
+            _response(502),
+            _response(200, '<a class="result__a" href="https://a.com">A</a>'),
+        ]
+        core = self._core(clock)
+        assert core.search_web("q") == ["https://a.com"]
+        assert mock_get.call_count == 3
+        assert clock.now == 1000.0 + 0.5 + 1.0
+        stats = core.retry_scheduler.stats()
+        assert stats["retries"] == 2
+        assert stats["successes"] == 1
+
+    @patch("osint_core.requests.Session.get")
+    def test_retry_after_beyond_max_delay_cools_down_without_retrying(self, mock_get, clock):
+        mock_get.return_value = _response(429, headers={"Retry-After": "120"})
+        core = self._core(clock)
+        with pytest.raises(RetryExhausted) as excinfo:
+            core.search_web("q", strict=True)
+        assert excinfo.value.status == 429
+        assert excinfo.value.ready_at == clock.now + 120
+        assert mock_get.call_count == 1
+        assert core.search_web("other") == []
+        assert mock_get.call_count == 1
+        assert core.retry_scheduler.fast_failures == 1
+
+    @patch("osint_core.requests.Session.get")
+    def test_permanent_status_is_not_retried(self, mock_get, clock):
+        mock_get.return_value = _response(403)
+        core = self._core(clock)
+        assert core.search_web("q") == []
+        assert mock_get.call_count == 1
+        assert core.retry_scheduler.permanent_failures == 1
+
+    @patch("osint_core.requests.Session.get")
+    def test_strict_search_raises_permanent_errors(self, mock_get, clock):
+        mock_get.return_value = _response(403)
+        core = self._core(clock)
+        with pytest.raises(requests.HTTPError) as excinfo:
+            core.search_web("q", strict=True)
+        assert excinfo.value.response.status_code == 403
+
+
+class TestPageClassification:
+    def _core(self, clock, **kwargs):
+        scheduler = RetryScheduler(max_attempts=3, clock=clock, sleep=clock.sleep)
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        return OSINTCore(rate_limiter=RateLimiter(0), retry_scheduler=scheduler, circuit_breaker=breaker, **kwargs)
+
+    @patch("osint_core.requests.Session.get")
+    def test_genuinely_empty_page_is_cached_without_parsing(self, mock_get, clock):
+        mock_get.return_value = _response(200, _fixture("ddg_no_results.html"))
+        core = self._core(clock, cache=SearchCache())
+        with patch.object(OSINTCore, "_iter_results") as mock_parse:
+            assert core.search_web("nothing") == []
+            assert core.search_web("nothing") == []
+        mock_parse.assert_not_called()
+        assert mock_get.call_count == 1
+        assert core.page_counts == {"results": 0, "empty": 1, "degraded": 0, "unknown": 0}
+        assert core.circuit_breaker.state("duckduckgo.com") == CLOSED
+
+    @patch("osint_core.requests.Session.get")
+    def test_block_page_is_not_cached_parsed_or_retried(self, mock_get, clock):
+        mock_get.return_value = _response(202, _fixture("ddg_anomaly.html"))
+        metrics = InMemoryInstrumentation()
+        core = self._core(clock, cache=SearchCache(), instrumentation=metrics)
+        with patch.object(OSINTCore, "_iter_results") as mock_parse:
+            with pytest.raises(RetryExhausted) as excinfo:
+                core.search_web("q", strict=True)
+        mock_parse.assert_not_called()
+        assert excinfo.value.status == 202
+        assert mock_get.call_count == 1
+        assert len(core.cache) == 0
+        assert core.page_counts["degraded"] == 1
+        assert core.retry_scheduler.cooldown_remaining("duckduckgo.com") == DEGRADED_PAGE_COOLDOWN
+        assert core.circuit_breaker.snapshot()[0]["failures"] == 1
+        assert core.search_web("other") == []
+        assert mock_get.call_count == 1
+        assert "search.parse" not in {row["span"] for row in metrics.summary()}
+
+    @patch("osint_core.requests.Session.get")
+    def test_unknown_layout_is_counted_but_not_a_failure(self, mock_get, clock, caplog):
+        mock_get.return_value = _response(200, "<html><body>new layout</body></html>")
+        core = self._core(clock, cache=SearchCache())
+        with caplog.at_level("WARNING", logger="osint_core"):
+            assert core.search_web("q", strict=True) == []
+        assert core.page_counts == {"results": 0, "empty": 0, "degraded": 0, "unknown": 1}
+        assert "unrecognised search page layout" in caplog.text
+        assert len(core.cache) == 0
+        assert core.retry_scheduler.cooldown_remaining("duckduckgo.com") == 0
+        assert core.circuit_breaker.snapshot()[0]["failures"] == 0
+        assert mock_get.call_count == 1
+
+    @patch("osint_core.requests.Session.get")
+    def test_interstitial_served_with_200_is_degraded(self, mock_get, clock):
+        mock_get.return_value = _response(200, _fixture("ddg_anomaly.html"))
+        core = self._core(clock)
+        assert core.search_web("q") == []
+        assert core.page_counts["degraded"] == 1
+
+
+class TestCircuitBreaking:
+    @patch("osint_core.requests.Session.get")
+    def test_open_circuit_skips_throttle_and_request(self, mock_get, clock):
+        mock_get.return_value = _response(403)
+        limiter = RateLimiter(min_interval=5, clock=clock, sleep=clock.sleep)
+        core = OSINTCore(
+            rate_limiter=limiter,
+            retry_scheduler=RetryScheduler(max_attempts=1),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60, clock=clock),
+        )
+        for query in ("a", "b", "c", "d"):
+            assert core.search_web(query) == []
+        assert mock_get.call_count == 2
+        assert limiter.acquisitions == 2
+        assert core.circuit_breaker.state("duckduckgo.com") == OPEN
+        with pytest.raises(CircuitOpenError) as excinfo:
+            core.search_web("e", strict=True)
+        assert excinfo.value.ready_at == clock.now + 60
+
+    @patch("osint_core.requests.Session.get")
+    def test_half_open_probe_closes_circuit(self, mock_get, clock):
+        core = OSINTCore(
+            rate_limiter=RateLimiter(0),
+            retry_scheduler=RetryScheduler(max_attempts=1, clock=clock, sleep=clock.sleep),
+            circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock),
+        )
+        mock_get.return_value = _response(503)
+        core.search_web("a")
+        clock.now += 60
+        mock_get.return_value = _response(200, '<a class="result__a" href="https://a.com">A</a>')
+        assert core.search_web("b") == ["https://a.com"]
+        assert core.circuit_breaker.state("duckduckgo.com") == CLOSED
+
+    @patch(
+        "osint_core.instaloader.Profile.from_username",
+        side_effect=instaloader.ConnectionException("connection reset"),
+    )
+    @patch("osint_core.instaloader.Instaloader")
+    def test_profile_lookups_pause_when_instagram_circuit_opens(self, _mock_loader_cls, mock_from_user, clock):
+        core = OSINTCore(
+            retry_scheduler=RetryScheduler(max_attempts=1, clock=clock, sleep=clock.sleep),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60, clock=clock),
+        )
+        core.get_profile_metadata("a")
+        core.get_profile_metadata("b")
+        result = core.get_profile_metadata("c")
+        assert mock_from_user.call_count == 2
+        assert "paused" in result["error"]
+        assert result["retry_after"] == 60
+
+
+class TestInstrumentation:
+    @patch("osint_core.requests.Session.get")
+    def test_search_web_emits_phase_spans(self, mock_get):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = '<a class="result__a" href="https://a.com">A</a>'
+        mock_get.return_value = mock_resp
+
+        metrics = InMemoryInstrumentation()
+        core = OSINTCore(cache=SearchCache(), instrumentation=metrics)
+        core.search_web("q")
+        core.search_web("q")
+        counts = {row["span"]: row["count"] for row in metrics.summary()}
+        assert counts == {
+            "search.cache_lookup": 2,
+            "search.throttle": 1,
+            "search.request": 1,
+            "search.download": 1,
+            "search.parse": 1,
+        }
+
+    @patch("osint_core.requests.Session.get", side_effect=requests.Timeout("slow"))
+    def test_failed_request_span_records_error(self, _mock_get):
+        metrics = InMemoryInstrumentation()
+        scheduler = RetryScheduler(max_attempts=2, sleep=lambda _: None)
+        OSINTCore(instrumentation=metrics, retry_scheduler=scheduler).search_web("q")
+        rows = {row["span"]: row for row in metrics.summary()}
+        assert rows["search.request"]["errors"] == 2
+        assert "search.parse" not in rows
+
+    @patch(
+        "osint_core.instaloader.Profile.from_username",
+        side_effect=instaloader.TooManyRequestsException("429"),
+    )
+    @patch("osint_core.instaloader.Instaloader")
+    def test_profile_lookup_spans(self, _mock_loader, _mock_from_user):
+        metrics = InMemoryInstrumentation()
+        OSINTCore(instrumentation=metrics).get_profile_metadata("u")
+        rows = {row["span"]: row for row in metrics.summary()}
+        assert rows["profile.loader_init"]["count"] == 1
+        assert rows["profile.lookup"]["errors"] == 1
+
+
+class TestStreaming:
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get")
+    def test_iter_search_web_yields_lazily(self, mock_get, _mock_sleep):
+        mock_resp = MagicMock()
+        mock_resp.text = (
+            '<a class="result__a" href="https://a.com">A</a>'
+            '<a class="result__a" href="https://b.com">B</a>'
+        )
+        mock_get.return_value = mock_resp
+
+        core = OSINTCore()
+        stream = core.iter_search_web("q")
+        mock_get.assert_not_called()
+        assert next(stream) == "https://a.com"
+        assert list(stream) == ["https://b.com"]
+
+    @patch("rate_limiter.time.sleep")
+    @patch("osint_core.requests.Session.get")
+    def test_iter_search_web_caches_after_exhaustion(self, mock_get, _mock_sleep):
+        mock_resp = MagicMock()
+        mock_resp.text = '<a class="result__a" href="https://a.com">A</a>'
+        mock_get.return_value = mock_resp
+
+        core = OSINTCore(cache=SearchCache())
+        assert list(core.iter_search_web("q")) == ["https://a.com"]
+        assert list(core.iter_search_web("q")) == ["https://a.com"]
+        assert mock_get.call_count == 1
+
+    def test_iter_dorks_yields_each_entry_when_done(self):
+        core = OSINTCore()
+        seen = []
+
+        def fake_search(query, max_results=20):
+            seen.append(query)
+            return ["https://r.com/" + str(len(seen))]
+
+        with patch.object(core, "search_web", side_effect=fake_search):
+            stream = core.iter_dorks("johndoe", ["Fotos e Imagens", "Mencoes Publicas"])
+            first = next(stream)
+            assert first["type"] == "Fotos e Imagens"
+            assert len(seen) == 1
+            second = next(stream)
+            assert second["urls"] == ["https://r.com/2"]
+            assert list(stream) == []
+
+
 class TestAdvancedGoogleHacking:
     @patch.object(OSINTCore, "search_web", return_value=["https://r.com/1"])
     def test_runs_all_dorks(self, mock_search):
@@ -217,6 +584,121 @@ class TestInstagram:
         assert "error" in result
         assert "429" in result["error"]
 
+    @patch("osint_core.instaloader.Profile.from_username")
+    @patch("osint_core.instaloader.Instaloader")
+    def test_loader_reused_across_lookups(self, mock_loader_cls, mock_from_user):
+        core = OSINTCore()
+        core.get_profile_metadata("a")
+        core.get_profile_metadata("b")
+        assert mock_loader_cls.call_count == 1
+        contexts = {call.args[0] for call in mock_from_user.call_args_list}
+        assert contexts == {mock_loader_cls.return_value.context}
+
+    @patch("osint_core.instaloader.Profile.from_username")
+    @patch("osint_core.instaloader.Instaloader")
+    def test_backoff_does_not_hold_loader_lock(self, _mock_loader_cls, mock_from_user):
+        mock_from_user.side_effect = [instaloader.ConnectionException("reset"), MagicMock()]
+        lock_free = []
+
+        def sleep(_seconds):
+            def probe():
+                acquired = core._profile_lock.acquire(blocking=False)
+                if acquired:
+                    core._profile_lock.release()
+                lock_free.append(acquired)
+
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+
+        core = OSINTCore(retry_scheduler=RetryScheduler(max_attempts=2, sleep=sleep, rng=lambda: 1.0))
+        core.get_profile_metadata("a")
+        assert mock_from_user.call_count == 2
+        assert lock_free == [True]
+
+    @patch("osint_core.instaloader.Profile.from_username")
+    def test_close_releases_loader(self, _mock_from_user):
+        loader = MagicMock()
+        factory = MagicMock(return_value=loader)
+        core = OSINTCore(profile_loader_factory=factory)
+        core.get_profile_metadata("a")
+        core.close()
+        loader.close.assert_called_once()
+        core.get_profile_metadata("b")
+        assert factory.call_count == 2
+
+    @patch("osint_core.instaloader.Profile.from_username")
+    @patch("osint_core.instaloader.Instaloader")
+    def test_profile_cache_serves_repeat_lookups(self, _mock_loader_cls, mock_from_user):
+        mock_from_user.return_value = MagicMock(
+            username="testuser",
+            biography="",
+            followers=1,
+            followees=2,
+            userid=3,
+            profile_pic_url="https://pic.url",
+            is_private=False,
+        )
+        metrics = InMemoryInstrumentation()
+        core = OSINTCore(profile_cache=ProfileCache(), instrumentation=metrics)
+        first = core.get_profile_metadata("testuser")
+        assert core.get_profile_metadata("TestUser") == first
+        assert mock_from_user.call_count == 1
+        rows = {row["span"]: row for row in metrics.summary()}
+        assert rows["profile.cache_lookup"]["count"] == 2
+        core.get_profile_metadata("testuser", force_refresh=True)
+        assert mock_from_user.call_count == 2
+
+    @patch(
+        "osint_core.instaloader.Profile.from_username",
+        side_effect=instaloader.TooManyRequestsException("429"),
+    )
+    @patch("osint_core.instaloader.Instaloader")
+    def test_profile_cache_stores_rate_limit_errors(self, _mock_loader_cls, mock_from_user):
+        cache = ProfileCache()
+        core = OSINTCore(profile_cache=cache)
+        core.get_profile_metadata("u")
+        result = core.monitor_followers("u", 10)
+        assert result["status"] == "error"
+        assert mock_from_user.call_count == 1
+        assert cache.negative_hits == 1
+        refreshed = core.monitor_followers("u", 10, force_refresh=True)
+        assert "429" in refreshed["error"]
+        assert mock_from_user.call_count == 1
+
+    @patch("osint_core.time.time")
+    @patch(
+        "osint_core.instaloader.Profile.from_username",
+        side_effect=[
+            instaloader.TooManyRequestsException("429"),
+            MagicMock(
+                username="u",
+                biography="",
+                followers=1,
+                followees=2,
+                userid=3,
+                profile_pic_url="https://pic.url",
+                is_private=False,
+            ),
+        ],
+    )
+    @patch("osint_core.instaloader.Instaloader")
+    def test_cached_pause_counts_down_and_expires(self, _mock_loader_cls, mock_from_user, mock_time, clock):
+        mock_time.side_effect = clock
+        core = OSINTCore(
+            profile_cache=ProfileCache(error_ttl=600, clock=clock),
+            retry_scheduler=RetryScheduler(clock=clock),
+        )
+        assert "300 s" in core.get_profile_metadata("u")["error"]
+        clock.now += 120
+        cached = core.get_profile_metadata("u")
+        assert cached["retry_after"] == 180
+        assert "180 s" in cached["error"]
+        assert mock_from_user.call_count == 1
+        clock.now += 180
+        assert "error" not in core.get_profile_metadata("u")
+        assert mock_from_user.call_count == 2
+
     @patch("osint_core.instaloader", None)
     def test_get_profile_metadata_missing_instaloader(self):
         core = OSINTCore()
@@ -267,3 +749,33 @@ class TestToJson:
         parsed = json.loads(result)
         assert parsed["key"] == "value"
         assert parsed["num"] == 42
+
+    def test_iter_json_matches_to_json(self):
+        data = {
+            "target": "alvo ç",
+            "dorks": [{"type": "A", "query": "q", "urls": ["https://a.com"]}, {"type": "B", "urls": []}],
+            "meta": {"nested": [1, {"x": None}]},
+            "empty": [],
+        }
+        assert "".join(OSINTCore.iter_json(data)) == OSINTCore.to_json(data)
+        assert "".join(OSINTCore.iter_json({})) == OSINTCore.to_json({})
+
+    def test_write_json_streams_iterators(self):
+        dorks = [{"type": "A", "urls": ["https://a.com"]}, {"type": "B", "urls": []}]
+        consumed = []
+
+        def produce():
+            for entry in dorks:
+                consumed.append(entry["type"])
+                yield entry
+
+        chunks = OSINTCore.iter_json({"target": "x", "dorks": produce()})
+        head = "".join(next(chunks) for _ in range(3))
+        assert head.startswith('{\n  "target": "x"')
+        assert consumed == []
+        assert head + "".join(chunks) == OSINTCore.to_json({"target": "x", "dorks": dorks})
+        assert consumed == ["A", "B"]
+
+        handle = io.StringIO()
+        OSINTCore.write_json({"target": "x", "dorks": iter(dorks)}, handle)
+        assert json.loads(handle.getvalue()) == {"target": "x", "dorks": dorks}
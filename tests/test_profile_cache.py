@@ -0,0 +1,59 @@
+from profile_cache import ProfileCache
+
+
+class TestProfileCache:
+    def test_miss_then_hit(self):
+        cache = ProfileCache()
+        assert cache.get("alice") is None
+        cache.set("alice", {"username": "alice", "followers": 10})
+        assert cache.get("alice") == {"username": "alice", "followers": 10}
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_normalizes_username(self):
+        cache = ProfileCache()
+        cache.set(" @Alice ", {"username": "alice"})
+        assert cache.get("alice") == {"username": "alice"}
+
+    def test_positive_entry_expires_after_ttl(self, clock):
+        cache = ProfileCache(ttl=60, error_ttl=10, clock=clock)
+        cache.set("alice", {"username": "alice"})
+        clock.now += 59
+        assert cache.get("alice") is not None
+        clock.now += 1
+        assert cache.get("alice") is None
+        assert len(cache) == 0
+
+    def test_negative_entry_uses_error_ttl(self, clock):
+        cache = ProfileCache(ttl=60, error_ttl=10, clock=clock)
+        cache.set("ghost", {"username": "ghost", "error": "Rate limited by Instagram (429)."})
+        clock.now += 5
+        assert cache.get("ghost")["error"].startswith("Rate limited")
+        assert cache.negative_hits == 1
+        clock.now += 5
+        assert cache.get("ghost") is None
+
+    def test_lru_eviction(self, clock):
+        cache = ProfileCache(max_entries=2, clock=clock)
+        cache.set("a", {"username": "a"})
+        clock.now += 1
+        cache.set("b", {"username": "b"})
+        clock.now += 1
+        cache.get("a")
+        clock.now += 1
+        cache.set("c", {"username": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.evictions == 1
+
+    def test_invalidate_and_stats(self):
+        cache = ProfileCache()
+        cache.set("a", {"username": "a"})
+        cache.get("a")
+        cache.invalidate("A")
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 0
+        assert stats["hit_rate"] == 0.5
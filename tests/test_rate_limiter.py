@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+
+from rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    def test_rejects_zero_burst(self):
+        with pytest.raises(ValueError):
+            RateLimiter(min_interval=1, burst=0)
+
+    def test_host_of(self):
+        assert RateLimiter.host_of("https://DuckDuckGo.com/html/?q=x") == "duckduckgo.com"
+
+    def test_first_request_is_free(self, clock):
+        limiter = RateLimiter(min_interval=3, clock=clock)
+        assert limiter.reserve("a") == 0
+
+    def test_back_to_back_requests_wait_full_interval(self, clock):
+        limiter = RateLimiter(min_interval=3, clock=clock)
+        limiter.reserve("a")
+        assert limiter.reserve("a") == pytest.approx(3)
+        assert limiter.reserve("a") == pytest.approx(6)
+
+    def test_waits_only_for_remaining_deficit(self, clock):
+        limiter = RateLimiter(min_interval=3, clock=clock)
+        limiter.reserve("a")
+        clock.now += 2.0
+        assert limiter.reserve("a") == pytest.approx(1)
+
+    def test_idle_host_does_not_wait(self, clock):
+        limiter = RateLimiter(min_interval=3, clock=clock)
+        limiter.reserve("a")
+        clock.now += 60.0
+        assert limiter.reserve("a") == 0
+
+    def test_burst_allows_initial_requests(self, clock):
+        limiter = RateLimiter(min_interval=2, burst=3, clock=clock)
+        assert [limiter.reserve("a") for _ in range(4)] == [0, 0, 0, pytest.approx(2)]
+
+    def test_idle_time_does_not_exceed_burst(self, clock):
+        limiter = RateLimiter(min_interval=1, burst=2, clock=clock)
+        clock.now += 100.0
+        waits = [limiter.reserve("a") for _ in range(3)]
+        assert waits == [0, 0, pytest.approx(1)]
+
+    def test_hosts_are_independent(self, clock):
+        limiter = RateLimiter(min_interval=3, clock=clock)
+        limiter.reserve("a")
+        assert limiter.reserve("b") == 0
+
+    def test_acquire_sleeps_for_wait(self, clock):
+        sleeps = []
+        limiter = RateLimiter(min_interval=3, clock=clock, sleep=sleeps.append)
+        limiter.acquire("a")
+        limiter.acquire("a")
+        assert sleeps == [pytest.approx(3)]
+        assert limiter.stats()["total_wait"] == pytest.approx(3)
+
+    def test_concurrent_threads_get_distinct_slots(self, clock):
+        limiter = RateLimiter(min_interval=1, clock=clock)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = limiter.reserve("a")
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(waits) == [pytest.approx(i) for i in range(8)]
+
+    def test_acquire_async(self):
+        async def run():
+            limiter = RateLimiter(min_interval=0.02)
+            return await asyncio.gather(*(limiter.acquire_async("a") for _ in range(3)))
+
+        waits = sorted(asyncio.run(run()))
+        assert waits[0] == 0
+        assert waits[2] >= waits[1] > 0
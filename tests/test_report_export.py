@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+
+import pyarrow.parquet as pq
+import pytest
+
+from report_export import CSV_COLUMNS, available_formats, export_report, iter_csv, iter_jsonl, write_report
+from results_store import COLUMNS, ResultsStore
+
+
+def _store(rows=5):
+    store = ResultsStore(clock=lambda: 1700000000.0)
+    store.extend("google_dorks", [f"https://a.com/{i}" for i in range(rows)], "Fotos", 'q "x"')
+    store.append("instagram_collab", "https://ig.com/p/1")
+    return store
+
+
+class TestReportExport:
+    def test_csv_streams_one_piece_per_chunk(self):
+        pieces = list(iter_csv(_store().iter_chunks(chunk_rows=2)))
+        assert len(pieces) == 3
+        rows = list(csv.reader(io.StringIO("".join(pieces))))
+        assert rows[0] == ["tipo", "url", "source", "query", "timestamp"]
+        assert rows[1] == ["Fotos", "https://a.com/0", "google_dorks", 'q "x"', "2023-11-14T22:13:20+00:00"]
+        assert rows[-1][:3] == ["instagram_collab", "https://ig.com/p/1", "instagram_collab"]
+        assert len(rows) == 7
+
+    def test_csv_header_only_when_empty(self):
+        assert "".join(iter_csv(ResultsStore().iter_chunks())) == ",".join(CSV_COLUMNS) + "\r\n"
+
+    def test_jsonl_rows(self):
+        lines = "".join(iter_jsonl(_store().iter_chunks(chunk_rows=4))).splitlines()
+        assert len(lines) == 6
+        assert json.loads(lines[-1])["source"] == "instagram_collab"
+
+    def test_parquet_writes_row_group_per_chunk(self, tmp_path):
+        path = tmp_path / "out.parquet"
+        with open(path, "wb") as handle:
+            write_report(_store().iter_chunks(chunk_rows=2), "parquet", handle)
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_rows == 6
+        assert parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+        assert table.column_names == list(COLUMNS)
+        assert str(table.column("timestamp")[0]) == "2023-11-14 22:13:20+00:00"
+
+    def test_export_report_writes_file(self, tmp_path):
+        path = export_report(_store(rows=200).iter_chunks(chunk_rows=50), "jsonl", str(tmp_path / "exports"))
+        assert path.endswith(".jsonl")
+        with open(path, "rb") as handle:
+            assert len(handle.read().splitlines()) == 201
+
+    def test_export_report_removes_partial_file(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_report(iter(()), "xml", str(tmp_path))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            write_report(iter(()), "xml", io.BytesIO())
+
+    def test_available_formats(self):
+        assert available_formats() == ["csv", "jsonl", "parquet"]
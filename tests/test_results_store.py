@@ -0,0 +1,96 @@
+import pytest
+
+from results_store import COLUMNS, ResultRecord, ResultsStore
+
+
+def _clock():
+    return 1700000000.0
+
+
+class TestResultsStore:
+    def test_append_and_iterate_records(self):
+        store = ResultsStore(clock=_clock)
+        store.append("google_dorks", "https://a.com", "Fotos", "q1")
+        assert len(store) == 1
+        assert list(store) == [ResultRecord("google_dorks", "Fotos", "q1", "https://a.com", 1700000000.0)]
+
+    def test_records_use_slots(self):
+        record = ResultRecord("s", "t", "q", "u", 0.0)
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.extra = 1
+
+    def test_add_dork_appends_every_url(self):
+        store = ResultsStore(clock=_clock)
+        added = store.add_dork({"type": "Fotos", "query": "q", "urls": ["https://a.com", "https://b.com"]})
+        assert added == 2
+        assert store.urls("google_dorks") == ["https://a.com", "https://b.com"]
+
+    def test_empty_extend_does_not_bump_version(self):
+        store = ResultsStore()
+        store.extend("google_dorks", [])
+        assert store.version == 0
+
+    def test_dork_results_regroups_by_type_and_query(self):
+        store = ResultsStore()
+        store.add_dork({"type": "A", "query": "qa", "urls": ["https://a.com"]})
+        store.add_dork({"type": "B", "query": "qb", "urls": ["https://b.com", "https://c.com"]})
+        store.extend("instagram_collab", ["https://ig.com/p/1"])
+        assert store.dork_results() == {
+            "dorks": [
+                {"type": "A", "query": "qa", "urls": ["https://a.com"]},
+                {"type": "B", "query": "qb", "urls": ["https://b.com", "https://c.com"]},
+            ]
+        }
+
+    def test_remove_source_keeps_other_rows(self):
+        store = ResultsStore()
+        store.extend("google_dorks", ["https://a.com", "https://b.com"], "A")
+        store.extend("instagram_collab", ["https://ig.com/p/1"])
+        assert store.remove_source("google_dorks") == 2
+        assert store.remove_source("google_dorks") == 0
+        assert store.urls() == ["https://ig.com/p/1"]
+        assert not store.has_source("google_dorks")
+        assert store.has_source("instagram_collab")
+
+    def test_frame_is_cached_until_new_rows(self):
+        store = ResultsStore(clock=_clock)
+        store.extend("google_dorks", ["https://a.com"], "A", "q")
+        first = store.frame()
+        assert store.frame() is first
+        assert store.frame_builds == 1
+        store.append("image_gallery", "https://a.com/1.jpg")
+        second = store.frame()
+        assert second is not first
+        assert store.frame_builds == 2
+        assert list(second.columns) == list(COLUMNS)
+        assert second["source"].tolist() == ["google_dorks", "image_gallery"]
+        assert str(second.loc[0, "timestamp"]) == "2023-11-14 22:13:20+00:00"
+
+    def test_views_are_rebuilt_per_version(self):
+        store = ResultsStore()
+        builds = []
+
+        def count_urls(current):
+            builds.append(current.version)
+            return len(current)
+
+        assert store.view("count", count_urls) == 0
+        assert store.view("count", count_urls) == 0
+        store.append("google_dorks", "https://a.com")
+        assert store.view("count", count_urls) == 1
+        assert builds == [0, 1]
+        assert store.view_builds["count"] == 2
+
+    def test_empty_frame_has_columns(self):
+        frame = ResultsStore().frame()
+        assert frame.empty
+        assert list(frame.columns) == list(COLUMNS)
+
+    def test_iter_chunks_yields_columnar_slices(self):
+        store = ResultsStore(clock=_clock)
+        store.extend("google_dorks", [f"https://a.com/{i}" for i in range(5)], "A", "q")
+        chunks = list(store.iter_chunks(chunk_rows=2))
+        assert [len(chunk["url"]) for chunk in chunks] == [2, 2, 1]
+        assert chunks[0]["source"] == ["google_dorks", "google_dorks"]
+        assert chunks[2]["timestamp"] == [1700000000.0]
@@ -0,0 +1,195 @@
+import asyncio
+
+import pytest
+import requests
+
+from retry_scheduler import (
+    PERMANENT,
+    TRANSIENT,
+    RetryExhausted,
+    RetryScheduler,
+    TransientError,
+    classify,
+    parse_retry_after,
+)
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status}", response=response)
+
+
+def _scheduler(clock, **kwargs):
+    kwargs.setdefault("rng", lambda: 1.0)
+    return RetryScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (TransientError("x"), TRANSIENT),
+            (requests.ConnectionError("down"), TRANSIENT),
+            (requests.Timeout("slow"), TRANSIENT),
+            (_http_error(429), TRANSIENT),
+            (_http_error(503), TRANSIENT),
+            (_http_error(404), PERMANENT),
+            (requests.HTTPError("no response"), PERMANENT),
+            (ValueError("bad"), PERMANENT),
+        ],
+    )
+    def test_classify(self, error, expected):
+        assert classify(error) == expected
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412480.0) == 30
+
+    def test_past_date_and_garbage(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412480.0) == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("-5") == 0
+
+
+class TestRetryScheduler:
+    def test_backoff_is_exponential_capped_and_jittered(self):
+        scheduler = RetryScheduler(base_delay=0.5, max_delay=4.0, rng=lambda: 1.0)
+        assert [scheduler.backoff(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+        half = RetryScheduler(base_delay=0.5, rng=lambda: 0.5)
+        assert half.backoff(2) == 1.0
+
+    def test_retry_after_is_a_floor(self):
+        scheduler = RetryScheduler(rng=lambda: 0.0, max_cooldown=60)
+        assert scheduler.backoff(0, retry_after=7) == 7
+        assert scheduler.backoff(0, retry_after=3600) == 60
+
+    def test_retries_transient_then_succeeds(self, clock):
+        scheduler = _scheduler(clock, max_attempts=3)
+        outcomes = [TransientError("503"), requests.ConnectionError("reset"), "ok"]
+
+        def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert scheduler.call("host", flaky) == "ok"
+        assert clock.sleeps == [0.5, 1.0]
+        stats = scheduler.stats()
+        assert stats["attempts"] == 3
+        assert stats["retries"] == 2
+        assert stats["successes"] == 1
+        assert stats["backoff_time"] == 1.5
+
+    def test_permanent_error_is_raised_immediately(self, clock):
+        scheduler = _scheduler(clock)
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            scheduler.call("host", broken)
+        assert len(calls) == 1
+        assert scheduler.permanent_failures == 1
+        assert scheduler.cooldown_remaining("host") == 0
+
+    def test_exhaustion_reports_ready_time(self, clock):
+        scheduler = _scheduler(clock, max_attempts=2)
+
+        def down():
+            raise TransientError("503", status=503)
+
+        with pytest.raises(RetryExhausted) as excinfo:
+            scheduler.call("host", down)
+        assert excinfo.value.attempts == 2
+        assert excinfo.value.status == 503
+        assert excinfo.value.ready_at == clock.now + 1.0
+        assert scheduler.exhausted == 1
+
+    def test_long_cooldown_fails_fast_for_every_caller(self, clock):
+        scheduler = _scheduler(clock, max_delay=30)
+        calls = []
+
+        def limited():
+            calls.append(1)
+            raise TransientError("429", status=429, retry_after=300)
+
+        with pytest.raises(RetryExhausted):
+            scheduler.call("host", limited)
+        with pytest.raises(RetryExhausted) as excinfo:
+            scheduler.call("host", lambda: "never")
+        assert excinfo.value.last_error is None
+        assert len(calls) == 1
+        assert scheduler.fast_failures == 1
+        assert scheduler.cooldowns() == {"host": 300}
+        assert scheduler.call("other", lambda: "ok") == "ok"
+        clock.now += 300
+        assert scheduler.call("host", lambda: "ok") == "ok"
+
+    def test_short_cooldown_is_waited_out(self, clock):
+        scheduler = _scheduler(clock, max_attempts=1)
+        with pytest.raises(RetryExhausted):
+            scheduler.call("host", lambda: (_ for _ in ()).throw(TransientError("503")))
+        assert scheduler.call("host", lambda: "ok") == "ok"
+        assert clock.sleeps == [0.5]
+
+    def test_call_async(self, clock):
+        scheduler = RetryScheduler(max_attempts=2, base_delay=0.001, clock=clock, rng=lambda: 0.0)
+        outcomes = [TransientError("503"), "ok"]
+
+        async def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert asyncio.run(scheduler.call_async("host", flaky)) == "ok"
+        assert scheduler.retries == 1
+
+
+class TestCooldownQueue:
+    def test_defer_orders_by_ready_time(self, clock):
+        scheduler = _scheduler(clock)
+        scheduler.defer("a", "late", ready_at=clock.now + 20)
+        scheduler.defer("b", "early", ready_at=clock.now + 5)
+        assert scheduler.pending() == 2
+        assert scheduler.is_deferred("early")
+        assert scheduler.pop_ready() == []
+        assert scheduler.next_ready_in() == 5
+        assert scheduler.wait_ready() == ["early"]
+        assert scheduler.wait_ready() == ["late"]
+        assert clock.sleeps == [5, 15]
+        assert scheduler.wait_ready() == []
+
+    def test_defer_defaults_to_host_cooldown(self, clock):
+        scheduler = _scheduler(clock)
+        with pytest.raises(RetryExhausted):
+            scheduler.call("host", lambda: (_ for _ in ()).throw(TransientError("429", retry_after=60)))
+        scheduler.defer("host", "task")
+        assert scheduler.next_ready_in() == 60
+
+    def test_defer_drops_after_max_deferrals(self, clock):
+        scheduler = _scheduler(clock, max_deferrals=2)
+        assert scheduler.defer("host", "task")
+        scheduler.pop_ready()
+        assert scheduler.defer("host", "task")
+        scheduler.pop_ready()
+        assert not scheduler.defer("host", "task")
+        assert scheduler.dropped == 1
+        assert scheduler.pending() == 0
+
+    def test_forget_resets_deferral_budget(self, clock):
+        scheduler = _scheduler(clock, max_deferrals=1)
+        assert scheduler.defer("host", "task")
+        scheduler.pop_ready()
+        scheduler.forget("task")
+        assert scheduler.defer("host", "task")
@@ -0,0 +1,61 @@
+from search_cache import SearchCache
+
+
+class TestSearchCache:
+    def test_miss_then_hit(self):
+        cache = SearchCache()
+        assert cache.get("q", 10) is None
+        cache.set("q", 10, ["https://a.com"])
+        assert cache.get("q", 10) == ["https://a.com"]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_normalizes_query(self):
+        cache = SearchCache()
+        cache.set('  "John   Doe" site:x.com ', 10, ["https://a.com"])
+        assert cache.get('"john doe" SITE:x.com', 10) == ["https://a.com"]
+
+    def test_key_includes_max_results(self):
+        cache = SearchCache()
+        cache.set("q", 10, ["https://a.com"])
+        assert cache.get("q", 20) is None
+
+    def test_expired_entry_is_a_miss(self, clock):
+        cache = SearchCache(ttl=60, clock=clock)
+        cache.set("q", 10, ["https://a.com"])
+        clock.now += 61
+        assert cache.get("q", 10) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock):
+        cache = SearchCache(max_entries=2, clock=clock)
+        cache.set("a", 10, ["1"])
+        clock.now += 1
+        cache.set("b", 10, ["2"])
+        clock.now += 1
+        assert cache.get("a", 10) == ["1"]
+        clock.now += 1
+        cache.set("c", 10, ["3"])
+        assert cache.get("b", 10) is None
+        assert cache.get("a", 10) == ["1"]
+        assert cache.get("c", 10) == ["3"]
+        assert cache.evictions == 1
+
+    def test_persists_on_disk(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        cache = SearchCache(path=path)
+        cache.set("q", 10, ["https://a.com"])
+        cache.close()
+        reopened = SearchCache(path=path)
+        assert reopened.get("q", 10) == ["https://a.com"]
+
+    def test_stats(self):
+        cache = SearchCache()
+        cache.set("q", 10, ["x"])
+        cache.get("q", 10)
+        cache.get("other", 10)
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["hit_rate"] == 0.5
@@ -0,0 +1,26 @@
+import sqlite3
+
+from sqlite_cache import SQLiteCache
+
+
+class TestSQLiteCache:
+    def test_entries_carry_their_own_ttl(self, clock):
+        cache = SQLiteCache(":memory:", "entries", ttl=60, max_entries=10, clock=clock)
+        cache._store("short", {"v": 1}, 5)
+        cache._store("long", {"v": 2}, 60)
+        clock.now += 5
+        assert cache._fetch("short") is None
+        assert cache._fetch("long") == {"v": 2}
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_outdated_table_is_rebuilt(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, payload TEXT, created_at REAL, accessed_at REAL)")
+        conn.execute("INSERT INTO entries VALUES ('a', '[]', 0, 0)")
+        conn.commit()
+        conn.close()
+        cache = SQLiteCache(path, "entries", ttl=60, max_entries=10)
+        assert len(cache) == 0
+        cache._store("a", ["x"], 60)
+        assert cache._fetch("a") == ["x"]
@@ -0,0 +1,82 @@
+import io
+
+from PIL import Image
+
+from image_cache import ImageCache
+from thumbnails import ThumbnailPipeline, make_thumbnail
+
+
+def _jpeg(size=(1600, 1200)) -> bytes:
+    buf = io.BytesIO()
+    Image.effect_noise(size, 32).convert("RGB").save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+
+def _png_with_alpha(size=(800, 400)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGBA", size, (255, 0, 0, 128)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestMakeThumbnail:
+    def test_downscales_jpeg_within_bounds(self):
+        original = _jpeg()
+        thumb = make_thumbnail(original, (320, 320))
+        image = Image.open(io.BytesIO(thumb))
+        assert image.format == "JPEG"
+        assert max(image.size) == 320
+        assert image.size == (320, 240)
+        assert len(thumb) < len(original)
+
+    def test_keeps_alpha_as_png(self):
+        image = Image.open(io.BytesIO(make_thumbnail(_png_with_alpha(), (200, 200))))
+        assert image.format == "PNG"
+        assert image.mode == "RGBA"
+        assert image.size == (200, 100)
+
+    def test_applies_exif_orientation(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        buf = io.BytesIO()
+        Image.new("RGB", (800, 400), (10, 20, 30)).save(buf, format="JPEG", exif=exif)
+        image = Image.open(io.BytesIO(make_thumbnail(buf.getvalue(), (360, 360))))
+        assert image.size == (180, 360)
+        assert image.getexif().get(0x0112) in (None, 1)
+
+    def test_small_image_not_upscaled(self):
+        image = Image.open(io.BytesIO(make_thumbnail(_jpeg((100, 50)), (320, 320))))
+        assert image.size == (100, 50)
+
+
+class TestThumbnailPipeline:
+    def test_caches_by_content_hash(self):
+        pipeline = ThumbnailPipeline(cache=ImageCache(), max_size=(64, 64))
+        original = _jpeg((400, 300))
+        first = pipeline.thumbnail(original)
+        second = pipeline.thumbnail(bytes(original))
+        assert first == second
+        assert pipeline.generated == 1
+        pipeline.close()
+
+    def test_counts_every_generated_thumbnail_across_workers(self):
+        pipeline = ThumbnailPipeline(cache=ImageCache(), max_size=(32, 32), max_workers=4)
+        fetched = [(idx, _jpeg((100 + idx, 80)), "ok") for idx in range(12)]
+        results = list(pipeline.iter_thumbnails(iter(fetched)))
+        assert len(results) == 12
+        assert pipeline.generated == 12
+        pipeline.close()
+
+    def test_invalid_bytes_return_empty(self):
+        pipeline = ThumbnailPipeline(max_size=(64, 64))
+        assert pipeline.thumbnail(b"not an image") == b""
+        pipeline.close()
+
+    def test_iter_thumbnails_passes_failures_through(self):
+        pipeline = ThumbnailPipeline(max_size=(64, 64))
+        fetched = [(0, _jpeg((200, 200)), "ok"), (1, b"", "forbidden"), (2, _jpeg((300, 100)), "ok")]
+        results = {idx: (status, thumb) for idx, _, status, thumb in pipeline.iter_thumbnails(iter(fetched))}
+        assert set(results) == {0, 1, 2}
+        assert results[1] == ("forbidden", b"")
+        assert Image.open(io.BytesIO(results[0][1])).size == (64, 64)
+        assert Image.open(io.BytesIO(results[2][1])).size == (64, 21)
+        pipeline.close()
@@ -0,0 +1,79 @@
+import hashlib
+import io
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from image_cache import ImageCache
+
+
+def make_thumbnail(image_bytes: bytes, max_size: Tuple[int, int] = (360, 360), quality: int = 80) -> bytes:
+    image = Image.open(io.BytesIO(image_bytes))
+    if image.format == "JPEG":
+        image.draft("RGB", max_size)
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail(max_size, reducing_gap=2.0)
+    buf = io.BytesIO()
+    if image.mode in ("RGBA", "LA", "P"):
+        image.convert("RGBA").save(buf, format="PNG", optimize=True)
+    else:
+        image.convert("RGB").save(buf, format="JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+class ThumbnailPipeline:
+    def __init__(
+        self,
+        cache: Optional[ImageCache] = None,
+        max_size: Tuple[int, int] = (360, 360),
+        max_workers: int = 4,
+    ) -> None:
+        self.cache = cache if cache is not None else ImageCache(max_bytes=16 * 1024 * 1024)
+        self.max_size = max_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail")
+        self._lock = threading.Lock()
+        self.generated = 0
+
+    def cache_key(self, image_bytes: bytes) -> str:
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        return f"thumb:{self.max_size[0]}x{self.max_size[1]}:{digest}"
+
+    def thumbnail(self, image_bytes: bytes) -> bytes:
+        key = self.cache_key(image_bytes)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            thumb = make_thumbnail(image_bytes, self.max_size)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return b""
+        with self._lock:
+            self.generated += 1
+        self.cache.put(key, thumb)
+        return thumb
+
+    def submit(self, image_bytes: bytes) -> "Future[bytes]":
+        return self._executor.submit(self.thumbnail, image_bytes)
+
+    def iter_thumbnails(
+        self, fetched: Iterable[Tuple[int, bytes, str]]
+    ) -> Iterator[Tuple[int, bytes, str, bytes]]:
+        pending: Dict["Future[bytes]", Tuple[int, bytes, str]] = {}
+        for idx, image_bytes, status in fetched:
+            if status == "ok" and image_bytes:
+                pending[self.submit(image_bytes)] = (idx, image_bytes, status)
+            else:
+                yield idx, image_bytes, status, b""
+            for future in [f for f in pending if f.done()]:
+                done_idx, done_bytes, done_status = pending.pop(future)
+                yield done_idx, done_bytes, done_status, future.result()
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                done_idx, done_bytes, done_status = pending.pop(future)
+                yield done_idx, done_bytes, done_status, future.result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)